@@ -0,0 +1,326 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import yaml
+
+from pathlib import Path
+
+import leiah
+
+from leiah.descriptor import Descriptor, Loader
+from leiah.jobs import clear_estimator_cache
+
+
+ESTIMATOR = "tests.resources.estimators.DummyEstimator"
+DEFAULT_SIZES = (10, 1000, 100000)
+DEFAULT_OUTPUT = Path(".leiah/benchmarks")
+JOBS_PER_MODEL = 100
+MAX_SUBMITTED_JOBS = 1000
+
+
+def generate_descriptor(
+    jobs: int, hyperparameter_depth: int = 1, tuning_ranges: int = 0
+) -> dict:
+    models = dict()
+    jobs_per_model = min(jobs, JOBS_PER_MODEL)
+
+    for index in range(jobs):
+        model_name = f"model-{index // jobs_per_model:05d}"
+        model = models.setdefault(
+            model_name,
+            {
+                "estimator": ESTIMATOR,
+                "version": 1,
+                "tags": [f"group-{index // jobs_per_model % 10}"],
+                "hyperparameters": _generate_hyperparameters(hyperparameter_depth),
+                "training-jobs": dict(),
+                "hyperparameter-tuning-jobs": dict(),
+            },
+        )
+
+        job = {
+            "description": f"Job {index}",
+            "hyperparameters": {"learning_rate": 0.001 * (index % 10)},
+        }
+
+        if tuning_ranges and index % 2:
+            job["objective_metric_name"] = "loss"
+            job["hyperparameter_ranges"] = _generate_ranges(tuning_ranges)
+            model["hyperparameter-tuning-jobs"][f"hpt-{index:06d}"] = job
+        else:
+            model["training-jobs"][f"job-{index:06d}"] = job
+
+    return {"models": models}
+
+
+def _generate_hyperparameters(depth: int, width: int = 4) -> dict:
+    if depth <= 1:
+        return {f"parameter_{i}": i for i in range(width)}
+
+    return {
+        f"section_{i}": _generate_hyperparameters(depth - 1, width)
+        for i in range(width)
+    }
+
+
+def _generate_ranges(count: int) -> dict:
+    ranges = dict()
+
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            ranges[f"range_{index}"] = {
+                "type": "continuous",
+                "min_value": 0.0001,
+                "max_value": 0.1,
+                "scaling_type": "Logarithmic",
+            }
+        elif kind == 1:
+            ranges[f"range_{index}"] = {
+                "type": "integer",
+                "min_value": 1,
+                "max_value": 512,
+            }
+        else:
+            ranges[f"range_{index}"] = {
+                "type": "categorical",
+                "values": ["adam", "sgd", "rmsprop"],
+            }
+
+    return ranges
+
+
+def measure(fn, repeat: int = 5) -> dict:
+    timings = []
+    result = None
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "repeat": repeat,
+    }, result
+
+
+def measure_peak_memory(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_case(name: str, data: dict, repeat: int, directory: Path) -> dict:
+    path = directory / f"{name}.yaml"
+    with open(path, "w") as f:
+        yaml.dump(data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    jobs = sum(
+        len(model["training-jobs"]) + len(model["hyperparameter-tuning-jobs"])
+        for model in data["models"].values()
+    )
+
+    results = {"jobs": jobs, "descriptor_bytes": len(content)}
+
+    results["parse"], _ = measure(lambda: yaml.load(content, Loader=Loader), repeat)
+    results["load"], descriptor = measure(lambda: Descriptor(path), repeat)
+    results["load_streaming"], streaming = measure(
+        lambda: Descriptor(path, streaming=True), repeat
+    )
+    results["construction"], _ = measure(lambda: Descriptor(data), repeat)
+    results["construction_eager"], _ = measure(
+        lambda: Descriptor(data, eager=True), repeat
+    )
+
+    results["peak_memory"] = {
+        "load": measure_peak_memory(lambda: Descriptor(path)),
+        "load_streaming_single_job": measure_peak_memory(
+            lambda: Descriptor(path, streaming=True)._get_jobs(
+                next(iter(streaming.index.names))
+            )
+        ),
+        "construction_eager": measure_peak_memory(lambda: Descriptor(data, eager=True)),
+    }
+
+    results["index"], _ = measure(lambda: descriptor.index, 1)
+    results["selection"] = benchmark_selection(descriptor, repeat)
+
+    def construct_without_estimator_cache():
+        clear_estimator_cache()
+        return Descriptor(data, eager=True)
+
+    results["construction_eager_cold"], _ = measure(
+        construct_without_estimator_cache, repeat
+    )
+    results["submission"] = benchmark_submission(data, repeat)
+
+    return results
+
+
+def benchmark_selection(descriptor: Descriptor, repeat: int) -> dict:
+    model_name = next(reversed(list(descriptor.models)))
+    model = descriptor.models[model_name]
+    identifier = next(reversed(list(model.jobs)))
+
+    selectors = {
+        "exact": f"{model_name}.{identifier}",
+        "model": model_name,
+        "glob": f"{model_name}.*",
+        "regex": f"re:{model_name}\\.job-.*",
+        "tag": "tag:group-0",
+    }
+
+    results = dict()
+    for kind, selector in selectors.items():
+        timing, jobs = measure(lambda: descriptor._get_jobs(selector), repeat)
+        timing["matches"] = len(jobs)
+        results[kind] = timing
+
+    return results
+
+
+def benchmark_submission(data: dict, repeat: int) -> dict:
+    results = dict()
+
+    for mode, max_workers in (("sequential", None), ("threads", 8)):
+
+        def run():
+            descriptor = Descriptor(data)
+            jobs = descriptor._get_jobs()[:MAX_SUBMITTED_JOBS]
+            selectors = [f"{job.model.name}.{job.identifier}" for job in jobs]
+            return descriptor.run(jobs=selectors, max_workers=max_workers)
+
+        timing, summary = measure(run, repeat)
+        latencies = [submission.latency for submission in summary]
+        timing["jobs"] = len(summary)
+        timing["latency_median"] = statistics.median(latencies)
+        timing["latency_max"] = max(latencies)
+        results[mode] = timing
+
+    return results
+
+
+def get_cases(sizes) -> dict:
+    cases = dict()
+
+    for size in sizes:
+        cases[f"jobs-{size}"] = generate_descriptor(size)
+
+    cases["deep-hyperparameters"] = generate_descriptor(1000, hyperparameter_depth=5)
+    cases["tuning-ranges"] = generate_descriptor(1000, tuning_ranges=50)
+
+    return cases
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+
+    for case, metrics in results["cases"].items():
+        baseline_metrics = baseline["cases"].get(case)
+        if baseline_metrics is None:
+            continue
+
+        for metric, value, previous in _flatten(metrics, baseline_metrics):
+            if previous and value / previous > threshold:
+                regressions.append((case, metric, previous, value))
+
+    return regressions
+
+
+def _flatten(metrics: dict, baseline: dict, prefix: str = ""):
+    for key, value in metrics.items():
+        previous = baseline.get(key)
+
+        if isinstance(value, dict) and isinstance(previous, dict):
+            if "min" in value and "min" in previous:
+                yield f"{prefix}{key}", value["min"], previous["min"]
+            else:
+                yield from _flatten(value, previous, f"{prefix}{key}.")
+        elif prefix == "peak_memory." and isinstance(previous, int):
+            yield f"{prefix}{key}", value, previous
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Number of jobs of each synthetic descriptor.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Path of the JSON results file.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Path of a previous JSON results file to compare against.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Slowdown ratio reported as a regression when comparing.",
+    )
+    arguments = parser.parse_args(argv)
+
+    results = {
+        "version": leiah.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "cases": dict(),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, data in get_cases(arguments.sizes).items():
+            print(f"Running {name}...", file=sys.stderr)
+            results["cases"][name] = benchmark_case(
+                name, data, arguments.repeat, Path(directory)
+            )
+
+    output = arguments.output or DEFAULT_OUTPUT / f"{leiah.__version__}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"Results saved to {output}", file=sys.stderr)
+
+    if arguments.compare is None:
+        return 0
+
+    with open(arguments.compare) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, arguments.threshold)
+    for case, metric, previous, value in regressions:
+        print(f"{case} {metric}: {previous:.6g} -> {value:.6g}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
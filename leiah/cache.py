@@ -0,0 +1,41 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+from pathlib import Path
+
+from leiah import __version__
+
+
+class DescriptorCache(object):
+    def __init__(self, directory) -> None:
+        self.directory = Path(directory)
+
+    def get(self, content: bytes):
+        try:
+            with open(self._get_file_path(content), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def set(self, content: bytes, data) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        fd, temporary_file_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary_file_path, self._get_file_path(content))
+        except BaseException:
+            os.unlink(temporary_file_path)
+            raise
+
+    def _get_file_path(self, content: bytes) -> Path:
+        digest = hashlib.sha256(content)
+        digest.update(__version__.encode())
+
+        return self.directory / f"{digest.hexdigest()}.pickle"
@@ -0,0 +1,106 @@
+from collections import namedtuple
+
+from leiah.exceptions import DescriptorError
+
+
+INPUT_MODES = ("File", "FastFile", "Pipe")
+
+DISTRIBUTIONS = ("FullyReplicated", "ShardedByS3Key")
+
+COMPRESSIONS = ("None", "Gzip")
+
+RECORD_WRAPPINGS = ("None", "RecordIO")
+
+S3_DATA_TYPES = ("S3Prefix", "ManifestFile", "AugmentedManifestFile")
+
+STREAMING_INPUT_MODES = ("FastFile", "Pipe")
+
+Channel = namedtuple(
+    "Channel",
+    [
+        "uri",
+        "input_mode",
+        "distribution",
+        "compression",
+        "record_wrapping",
+        "content_type",
+        "s3_data_type",
+    ],
+    defaults=[None, None, None, None, None, "S3Prefix"],
+)
+
+CHANNEL_SETTINGS = {
+    "input_mode": INPUT_MODES,
+    "distribution": DISTRIBUTIONS,
+    "compression": COMPRESSIONS,
+    "record_wrapping": RECORD_WRAPPINGS,
+    "s3_data_type": S3_DATA_TYPES,
+}
+
+
+def get_channels(channels: dict) -> dict:
+    if channels is None:
+        return None
+
+    if not isinstance(channels, dict):
+        raise DescriptorError(
+            "Channels must map channel names to a URI or to the channel's settings"
+        )
+
+    return {name: get_channel(name, value) for name, value in channels.items()}
+
+
+def get_channel(name: str, value) -> Channel:
+    if isinstance(value, Channel):
+        return value
+
+    if not isinstance(value, dict):
+        return Channel(uri=str(value))
+
+    unknown = sorted(set(value) - set(Channel._fields))
+    if unknown:
+        raise DescriptorError(
+            f'Channel "{name}" has unknown settings: {", ".join(unknown)}. '
+            f'Supported settings are: {", ".join(Channel._fields)}'
+        )
+
+    if not value.get("uri", None):
+        raise DescriptorError(f'Channel "{name}" is missing its "uri"')
+
+    for setting, values in CHANNEL_SETTINGS.items():
+        if setting in value and value[setting] not in values:
+            raise DescriptorError(
+                f'Setting "{setting}" of channel "{name}" must be one of '
+                f'{", ".join(values)}. Found "{value[setting]}" instead'
+            )
+
+    channel = Channel(**dict(value, uri=str(value["uri"])))
+
+    if channel.input_mode in STREAMING_INPUT_MODES and not channel.uri.startswith(
+        "s3://"
+    ):
+        raise DescriptorError(
+            f'Channel "{name}" uses input mode "{channel.input_mode}", which '
+            "requires an S3 URI"
+        )
+
+    return channel
+
+
+def get_training_input(channel: Channel):
+    # Channels without any settings are still passed as plain URIs, so SageMaker
+    # keeps using the estimator's defaults for them.
+    if channel == Channel(uri=channel.uri):
+        return channel.uri
+
+    from sagemaker.inputs import TrainingInput
+
+    return TrainingInput(
+        channel.uri,
+        distribution=channel.distribution,
+        compression=channel.compression,
+        content_type=channel.content_type,
+        record_wrapping=channel.record_wrapping,
+        s3_data_type=channel.s3_data_type,
+        input_mode=channel.input_mode,
+    )
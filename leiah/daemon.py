@@ -0,0 +1,343 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+from pathlib import Path
+
+from leiah.exceptions import DaemonError, DescriptorError
+from leiah.ledger import Ledger
+
+
+DEFAULT_SOCKET_PATH = ".leiah/daemon.sock"
+
+COMMANDS = ("ping", "list", "run", "status", "shutdown")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            response = self.server.daemon.handle(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class Daemon(object):
+    def __init__(
+        self,
+        socket_path=DEFAULT_SOCKET_PATH,
+        session=None,
+        ledger=None,
+        cache_dir=None,
+        tracker=None,
+    ) -> None:
+        self.socket_path = Path(socket_path)
+        self.session = session
+        self.ledger = Ledger(ledger) if isinstance(ledger, (str, Path)) else ledger
+        self.cache_dir = cache_dir
+
+        self._tracker = tracker
+        self._descriptors = dict()
+        self._locks = dict()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def serve_forever(self) -> None:
+        self.start()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def start(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise DaemonError(
+                    f"A daemon is already listening on {self.socket_path}"
+                )
+
+            self.socket_path.unlink()
+
+        self._server = _Server(str(self.socket_path), _Handler)
+        self._server.daemon = self
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def handle(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            command = request.pop("command", None)
+            if command not in COMMANDS:
+                raise DaemonError(f'Command "{command}" is not supported')
+
+            return {"ok": True, "result": getattr(self, f"_{command}")(**request)}
+        except (DaemonError, DescriptorError, TypeError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {str(e)}"}
+
+    def get_descriptor(self, path):
+        from leiah.descriptor import Descriptor
+
+        path = Path(path).resolve()
+        version = _get_version(path)
+
+        with self._get_lock(path):
+            cached = self._descriptors.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            descriptor = Descriptor(
+                path,
+                cache_dir=self.cache_dir,
+                session=self.session,
+                ledger=self.ledger,
+            )
+            self._descriptors[path] = (version, descriptor)
+
+            return descriptor
+
+    @property
+    def tracker(self):
+        if self._tracker is None:
+            from leiah.tracking import JobTracker
+
+            with self._lock:
+                if self._tracker is None:
+                    self._tracker = JobTracker(session=self.session)
+
+        return self._tracker
+
+    def _get_lock(self, path: Path) -> threading.RLock:
+        with self._lock:
+            return self._locks.setdefault(path, threading.RLock())
+
+    def _ping(self) -> dict:
+        return {"pid": os.getpid(), "descriptors": len(self._descriptors)}
+
+    def _list(self, descriptor: str, jobs: list = None) -> list:
+        descriptor = self.get_descriptor(descriptor)
+
+        if jobs is None:
+            return descriptor.index.names
+
+        return [
+            f"{model_name}.{identifier}"
+            for selector in jobs
+            for model_name, identifier in descriptor.index.select(selector)
+        ]
+
+    def _run(
+        self,
+        descriptor: str,
+        jobs: list = None,
+        max_workers: int = None,
+        incremental: bool = False,
+    ) -> dict:
+        path = Path(descriptor).resolve()
+        descriptor = self.get_descriptor(path)
+
+        # A sequential run stops at the first failure, which would leave the jobs
+        # submitted before it out of the response and the tracker.
+        with self._get_lock(path):
+            summary = descriptor.run(
+                jobs=jobs, max_workers=max_workers or 1, incremental=incremental
+            )
+
+        with self._lock:
+            self.tracker.track(summary.succeeded)
+
+        return {
+            "submissions": [
+                {
+                    "name": submission.name,
+                    "job_name": getattr(submission.result, "name", None),
+                    "error": None if submission.succeeded else str(submission.error),
+                    "latency": submission.latency,
+                }
+                for submission in summary
+            ],
+            "skipped": [job.name for job in summary.skipped],
+            "elapsed": summary.elapsed,
+        }
+
+    def _status(self, refresh: bool = True) -> dict:
+        with self._lock:
+            if refresh and self.tracker.running:
+                self.tracker.poll()
+
+            return dict(self.tracker.statuses)
+
+    def _shutdown(self) -> dict:
+        self.shutdown()
+        return {"pid": os.getpid()}
+
+
+class DaemonClient(object):
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, timeout: float = None) -> None:
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    def request(self, command: str, **kwargs):
+        request = dict(kwargs, command=command)
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(self.timeout)
+                connection.connect(str(self.socket_path))
+                connection.sendall(json.dumps(request).encode() + b"\n")
+
+                with connection.makefile("rb") as f:
+                    line = f.readline()
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise DaemonError(f"No daemon is listening on {self.socket_path}")
+
+        if not line:
+            raise DaemonError("The daemon closed the connection without a response")
+
+        response = json.loads(line)
+        if not response["ok"]:
+            raise DaemonError(response["error"])
+
+        return response["result"]
+
+    def ping(self) -> dict:
+        return self.request("ping")
+
+    def list(self, descriptor, jobs: list = None) -> list:
+        return self.request("list", descriptor=str(descriptor), jobs=jobs)
+
+    def run(
+        self,
+        descriptor,
+        jobs: list = None,
+        max_workers: int = None,
+        incremental: bool = False,
+    ) -> dict:
+        return self.request(
+            "run",
+            descriptor=str(descriptor),
+            jobs=jobs,
+            max_workers=max_workers,
+            incremental=incremental,
+        )
+
+    def status(self, refresh: bool = True) -> dict:
+        return self.request("status", refresh=refresh)
+
+    def shutdown(self) -> dict:
+        return self.request("shutdown")
+
+
+def _get_version(path: Path) -> tuple:
+    from leiah.descriptor import get_descriptor_paths
+
+    # Editing a file inside a directory doesn't change the directory itself, so
+    # every descriptor file is part of the version.
+    version = []
+    for file_path in get_descriptor_paths(path):
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise DaemonError(f'Descriptor "{path}" was not found')
+
+        version.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+
+    return tuple(version)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+
+    return True
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leiah.daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve")
+    serve.add_argument("--ledger", default=None)
+    serve.add_argument("--cache-dir", default=None)
+
+    subparsers.add_parser("ping")
+    subparsers.add_parser("status")
+    subparsers.add_parser("shutdown")
+
+    for command in ("list", "run"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("descriptor")
+        subparser.add_argument("jobs", nargs="*")
+
+        if command == "run":
+            subparser.add_argument("--max-workers", type=int, default=None)
+            subparser.add_argument("--incremental", action="store_true")
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "serve":
+        Daemon(
+            arguments.socket,
+            ledger=arguments.ledger,
+            cache_dir=arguments.cache_dir,
+        ).serve_forever()
+        return 0
+
+    client = DaemonClient(arguments.socket)
+
+    try:
+        if arguments.command == "list":
+            result = client.list(arguments.descriptor, arguments.jobs or None)
+        elif arguments.command == "run":
+            result = client.run(
+                arguments.descriptor,
+                arguments.jobs or None,
+                max_workers=arguments.max_workers,
+                incremental=arguments.incremental,
+            )
+        else:
+            result = client.request(arguments.command)
+    except DaemonError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    print(json.dumps(result, indent=2))
+
+    if arguments.command == "run" and any(
+        submission["error"] for submission in result["submissions"]
+    ):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
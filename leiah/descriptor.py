@@ -1,18 +1,165 @@
+import glob
+import os
+import time
 import yaml
 
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from yaml.parser import ParserError
 from yaml.scanner import ScannerError
 
+from leiah.cache import DescriptorCache
 from leiah.jobs import TrainingJob, HyperparameterTuningJob
 from leiah.exceptions import DescriptorError
+from leiah.ledger import Ledger
+from leiah.matrix import JobMatrix
+from leiah.runs import RunSummary, arun_jobs, run_jobs
+from leiah.selectors import JobIndex, get_model_jobs
+from leiah.streaming import DescriptorOutline
+from leiah.tracing import span
+
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+DESCRIPTOR_SUFFIXES = (".yaml", ".yml")
+
+
+class LazyCollection(Mapping):
+    __slots__ = ("_factories", "_data", "_jobs")
+
+    def __init__(self) -> None:
+        self._factories = dict()
+        self._data = dict()
+        self._jobs = dict()
+
+    def __getitem__(self, identifier):
+        try:
+            return self._jobs[identifier]
+        except KeyError:
+            factory_fn = self._factories[identifier]
+
+        job = factory_fn()
+        self._jobs[identifier] = job
+        return job
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def __contains__(self, identifier) -> bool:
+        return identifier in self._factories
+
+    def add(self, identifier: str, factory_fn, data: dict = None) -> None:
+        self._factories[identifier] = factory_fn
+        self._data[identifier] = data
+        self._jobs.pop(identifier, None)
+
+    def get_data(self, identifier: str) -> dict:
+        return self._data[identifier]
+
+    def is_materialized(self, identifier: str) -> bool:
+        return identifier in self._jobs
+
+    def materialize(self) -> None:
+        for identifier in self:
+            self[identifier]
+
+
+class JobCollection(LazyCollection):
+    __slots__ = ("_matrices",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._matrices = dict()
+
+    def __getitem__(self, identifier):
+        try:
+            return self._jobs[identifier]
+        except KeyError:
+            factory_fn = self._get_factory(identifier)
+
+        job = factory_fn()
+        self._jobs[identifier] = job
+        return job
+
+    def __iter__(self):
+        for identifier in self._factories:
+            matrix = self._matrices.get(identifier, None)
+
+            if matrix is None:
+                yield identifier
+            else:
+                yield from matrix
+
+    def __len__(self) -> int:
+        return (
+            len(self._factories)
+            - len(self._matrices)
+            + sum(len(matrix) for matrix in self._matrices.values())
+        )
+
+    def __contains__(self, identifier) -> bool:
+        if identifier in self._factories:
+            return identifier not in self._matrices
+
+        matrix = self._get_matrix(identifier)
+        return matrix is not None and identifier in matrix
+
+    def add(self, identifier: str, factory_fn, data: dict = None) -> None:
+        super().add(identifier, factory_fn, data=data)
+        self._matrices.pop(identifier, None)
+
+    def add_matrix(self, identifier: str, factory_fn, matrix: JobMatrix) -> None:
+        super().add(identifier, factory_fn, data=matrix.data)
+        self._matrices[identifier] = matrix
+
+    def get_data(self, identifier: str) -> dict:
+        try:
+            return self._data[identifier]
+        except KeyError:
+            matrix = self._get_matrix(identifier)
+            if matrix is None:
+                raise
+
+            return matrix.data
+
+    def _get_matrix(self, identifier: str):
+        return self._matrices.get(identifier.partition("[")[0], None)
+
+    def _get_factory(self, identifier: str):
+        if identifier in self._factories and identifier not in self._matrices:
+            return self._factories[identifier]
+
+        matrix = self._get_matrix(identifier)
+        combination = matrix.get_combination(identifier) if matrix else None
+        if combination is None:
+            raise KeyError(identifier)
+
+        return partial(
+            self._factories[matrix.identifier],
+            identifier=identifier,
+            data=matrix.get_data(combination),
+        )
+
+
+class ModelCollection(LazyCollection):
+    __slots__ = ()
 
 
 class Model(object):
-    def __init__(self, name: str, data: dict()) -> None:
+    __slots__ = ("name", "data", "session", "jobs")
+
+    def __init__(
+        self, name: str, data: dict(), eager: bool = False, session=None
+    ) -> None:
         self.name = name
         self.data = data
-        self.jobs = dict()
+        self.session = session
+        self.jobs = JobCollection()
 
         self._load_jobs(
             self.data,
@@ -28,35 +175,226 @@ class Model(object):
             ),
         )
 
+        if eager:
+            self.jobs.materialize()
+
     def _load_jobs(self, data, section, factory_fn):
         if section not in data:
             return
 
-        for identifier, data in data[section].items():
-            identifier = str(identifier)
+        with span("model.load_jobs", model=self.name, section=section):
+            for identifier, data in data[section].items():
+                identifier = str(identifier)
 
-            self.jobs[identifier] = factory_fn(
-                model=self, identifier=identifier, data=data
-            )
+                if isinstance(data, dict) and "matrix" in data:
+                    self.jobs.add_matrix(
+                        identifier,
+                        partial(factory_fn, model=self),
+                        JobMatrix(identifier, data),
+                    )
+                    continue
+
+                self.jobs.add(
+                    identifier,
+                    partial(factory_fn, model=self, identifier=identifier, data=data),
+                    data=data,
+                )
 
 
 class Descriptor(object):
-    def __init__(self, descriptor) -> None:
-        self.__models = dict()
+    def __init__(
+        self,
+        descriptor,
+        eager: bool = False,
+        cache_dir=None,
+        session=None,
+        ledger=None,
+        backend=None,
+        streaming: bool = False,
+        load_workers: int = None,
+    ) -> None:
+        self.__models = ModelCollection() if streaming else dict()
+        self.__index = None
+        self.__outlines = dict()
+        self.__sources = dict()
+        self.__job_names = dict()
+        self.eager = eager
+        self.streaming = streaming
+        self.load_workers = load_workers
+        self.session = session
+        self.backend = backend
+        self.ledger = Ledger(ledger) if isinstance(ledger, (str, Path)) else ledger
+        self.cache = DescriptorCache(cache_dir) if cache_dir is not None else None
 
         if isinstance(descriptor, dict):
             self._parse_descriptor(data=descriptor)
         elif isinstance(descriptor, str) or isinstance(descriptor, Path):
-            self._load_descriptor(descriptor_file_path=descriptor)
+            self._load_descriptors(get_descriptor_paths(descriptor))
         else:
             raise DescriptorError(
                 "Invalid descriptor source. Must be a dictionary, or "
-                "the path of the descriptor file."
+                "the path of a descriptor file or directory."
             )
 
-    def run(self, jobs=None):
-        for job in self._get_jobs(jobs):
-            job.run()
+        if self.eager and isinstance(self.__models, ModelCollection):
+            self.__models.materialize()
+
+    def run(
+        self,
+        jobs=None,
+        max_workers: int = None,
+        incremental: bool = False,
+        backend=None,
+    ) -> RunSummary:
+        backend = backend or self.backend
+        start = time.perf_counter()
+
+        with span("descriptor.run"):
+            jobs = self._get_jobs(jobs)
+            summaries = []
+
+            for stage in self._get_stages(jobs):
+                summary = run_jobs(
+                    stage,
+                    max_workers=max_workers,
+                    ledger=self._get_ledger(incremental) if backend is None else None,
+                    incremental=incremental,
+                    backend=backend,
+                    prepare=self._resolve_warm_start if backend is None else None,
+                )
+
+                if backend is None:
+                    self._record_job_names(summary)
+
+                summaries.append(summary)
+
+            return _merge_summaries(jobs, summaries, time.perf_counter() - start)
+
+    async def arun(
+        self,
+        jobs=None,
+        max_concurrency: int = 10,
+        incremental: bool = False,
+        backend=None,
+    ) -> RunSummary:
+        backend = backend or self.backend
+        start = time.perf_counter()
+
+        with span("descriptor.run"):
+            jobs = self._get_jobs(jobs)
+            summaries = []
+
+            for stage in self._get_stages(jobs):
+                summary = await arun_jobs(
+                    stage,
+                    max_concurrency=max_concurrency,
+                    ledger=self._get_ledger(incremental) if backend is None else None,
+                    incremental=incremental,
+                    backend=backend,
+                    prepare=self._resolve_warm_start if backend is None else None,
+                )
+
+                if backend is None:
+                    self._record_job_names(summary)
+
+                summaries.append(summary)
+
+            return _merge_summaries(jobs, summaries, time.perf_counter() - start)
+
+    def _get_stages(self, jobs: list) -> list:
+        # Warm start parents selected in the same run are submitted in an earlier
+        # stage than their children, so their job names are known by then.
+        selected = {job.name: job for job in jobs}
+        stages = dict()
+
+        def get_stage(job, visiting: frozenset) -> int:
+            if job.name not in stages:
+                parents = [
+                    selected[parent]
+                    for parent in getattr(job, "warm_start_parents", None) or ()
+                    if parent in selected and parent not in visiting
+                ]
+                stages[job.name] = 1 + max(
+                    (get_stage(parent, visiting | {job.name}) for parent in parents),
+                    default=-1,
+                )
+
+            return stages[job.name]
+
+        grouped = dict()
+        for job in jobs:
+            grouped.setdefault(get_stage(job, frozenset()), []).append(job)
+
+        return [grouped[stage] for stage in sorted(grouped)]
+
+    def _resolve_warm_start(self, job) -> None:
+        parents = getattr(job, "warm_start_parents", None)
+        if not parents:
+            return
+
+        job_names = []
+        for parent in parents:
+            if parent not in self.index:
+                raise DescriptorError(
+                    f'Warm start parent "{parent}" of job "{job.name}" was not found'
+                )
+
+            if not self._is_tuning_job(parent):
+                raise DescriptorError(
+                    f'Warm start parent "{parent}" of job "{job.name}" is not a '
+                    "hyperparameter tuning job"
+                )
+
+            job_name = self._get_job_name(parent)
+            if job_name is None:
+                raise DescriptorError(
+                    f'Warm start parent "{parent}" of job "{job.name}" has no '
+                    "recorded submission"
+                )
+
+            job_names.append(job_name)
+
+        job.parent_tuning_jobs = job_names
+
+    def _is_tuning_job(self, name: str) -> bool:
+        ((model_name, identifier),) = self.index.select(name)
+        section = self.models[model_name].data.get("hyperparameter-tuning-jobs", None)
+
+        return identifier.partition("[")[0] in {str(key) for key in section or ()}
+
+    def _get_job_name(self, name: str) -> str:
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        # Submissions made by this descriptor are looked up first, then the ledger,
+        # and finally SageMaker itself, so warm start works without a ledger.
+        job_name = self.__job_names.get(name, None)
+
+        if job_name is None and self.ledger is not None:
+            job_name = self.ledger.get_job_name(name)
+
+        if job_name is None:
+            (job,) = self._get_jobs(name)
+
+            try:
+                job_name = job.estimator.get_latest_tuning_job_name()
+            except (BotoCoreError, ClientError) as e:
+                raise DescriptorError(
+                    f'Unable to look up tuning job "{name}" on SageMaker. {str(e)}'
+                )
+
+        return job_name
+
+    def _record_job_names(self, summary: RunSummary) -> None:
+        for submission in summary.succeeded:
+            job_name = getattr(submission.result, "name", None)
+            if job_name is not None:
+                self.__job_names[submission.name] = job_name
+
+    def _get_ledger(self, incremental: bool) -> Ledger:
+        if self.ledger is None and incremental:
+            self.ledger = Ledger()
+
+        return self.ledger
 
     def _get_jobs(self, jobs=None) -> list:
         if jobs is None:
@@ -66,33 +404,173 @@ class Descriptor(object):
 
         result = []
 
-        for name in jobs:
-            identifier = name.split(".", 1)
+        for selector in jobs:
+            for model_name, identifier in self.index.select(selector):
+                result.append(self.models[model_name].jobs[identifier])
 
-            try:
-                model = self.models[identifier[0]]
-            except KeyError:
-                raise DescriptorError(f'Job "{name}" was not found')
-
-            if len(identifier) == 2:
-                try:
-                    job = model.jobs[identifier[1]]
-                except KeyError:
-                    raise DescriptorError(f'Job "{name}" was not found')
-                else:
-                    result.append(job)
+        return result
+
+    @property
+    def index(self) -> JobIndex:
+        if self.__index is None:
+            if self.__outlines:
+                self.__index = JobIndex.from_entries(self._get_index_entries())
             else:
-                for job in model.jobs.values():
-                    result.append(job)
+                self.__index = JobIndex(self.models)
 
-        return result
+        return self.__index
+
+    def _get_index_entries(self):
+        for name in self.models:
+            outline = self.__outlines.get(name, None)
+
+            # Matrix jobs are expanded from their values, so those models are parsed.
+            if outline is not None and not outline.models[name].has_matrix:
+                yield outline.get_entry(name)
+            else:
+                yield name, get_model_jobs(self.models[name])
+
+    def _load_descriptors(self, paths: list) -> None:
+        read_descriptor = partial(
+            _read_descriptor, streaming=self.streaming, cache=self.cache
+        )
+
+        if len(paths) == 1 or self.load_workers == 1:
+            results = map(read_descriptor, paths)
+        else:
+            max_workers = min(self.load_workers or os.cpu_count() or 1, len(paths))
+            chunksize = max(1, len(paths) // (max_workers * 4))
+
+            with span("descriptor.load_all", files=len(paths)):
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(
+                        executor.map(read_descriptor, paths, chunksize=chunksize)
+                    )
+
+        for path, result in zip(paths, results):
+            if isinstance(result, DescriptorOutline):
+                self._parse_outline(result, source=path)
+            else:
+                self._parse_descriptor(result, source=path)
+
+    def _parse_descriptor(self, data: dict(), source=None) -> None:
+        _validate_descriptor(data)
+
+        descriptor_models = data["models"]
+        if descriptor_models is None:
+            return
+
+        with span("descriptor.parse", models=len(descriptor_models)):
+            for name, data in descriptor_models.items():
+                name = str(name)
+                self._add_model(
+                    name,
+                    partial(Model, name, data, eager=self.eager, session=self.session),
+                    source,
+                )
+
+    def _parse_outline(self, outline: DescriptorOutline, source=None) -> None:
+        for name in outline.models:
+            self._add_model(name, partial(self._load_model, outline, name), source)
+            self.__outlines[name] = outline
+
+    def _add_model(self, name: str, factory_fn, source) -> None:
+        if source is not None:
+            previous_source = self.__sources.setdefault(name, source)
+            if previous_source != source:
+                raise DescriptorError(
+                    f'Model "{name}" is defined in both "{previous_source}" and '
+                    f'"{source}"'
+                )
+
+        if isinstance(self.__models, ModelCollection):
+            self.__models.add(name, factory_fn)
+        else:
+            self.__models[name] = factory_fn()
 
-    def _load_descriptor(self, descriptor_file_path) -> None:
+    def _load_model(self, outline: DescriptorOutline, name: str) -> Model:
+        with span("descriptor.load_model", model=name):
+            return Model(
+                name, outline.load_model(name), eager=self.eager, session=self.session
+            )
+
+    @property
+    def models(self) -> dict:
+        return self.__models
+
+
+def _merge_summaries(jobs: list, summaries: list, elapsed: float) -> RunSummary:
+    if len(summaries) == 1:
+        return summaries[0]
+
+    positions = dict()
+    for position, job in enumerate(jobs):
+        positions.setdefault(job.name, position)
+
+    submissions = [submission for summary in summaries for submission in summary]
+    skipped = [job for summary in summaries for job in summary.skipped]
+
+    return RunSummary(
+        sorted(submissions, key=lambda submission: positions[submission.name]),
+        elapsed=elapsed,
+        skipped=sorted(skipped, key=lambda job: positions[job.name]),
+    )
+
+
+def get_descriptor_paths(descriptor) -> list:
+    path = Path(descriptor)
+
+    if path.is_dir():
+        paths = [
+            file_path
+            for file_path in path.rglob("*")
+            if file_path.suffix in DESCRIPTOR_SUFFIXES and file_path.is_file()
+        ]
+    elif not path.exists() and any(c in str(descriptor) for c in "*?["):
+        paths = [
+            Path(file_path)
+            for file_path in glob.glob(str(descriptor), recursive=True)
+            if os.path.isfile(file_path)
+        ]
+    else:
+        return [path]
+
+    if not paths:
+        raise DescriptorError(f'No descriptor files were found in "{descriptor}"')
+
+    return sorted(paths)
+
+
+def _read_descriptor(descriptor_file_path, streaming: bool = False, cache=None):
+    with span("descriptor.load", path=str(descriptor_file_path)):
+        if streaming:
+            with span("descriptor.scan", path=str(descriptor_file_path)):
+                outline = DescriptorOutline.scan_file(descriptor_file_path)
+
+            # Anchors and aliases can reference nodes outside of a model, so those
+            # descriptors are parsed as a whole.
+            if not outline.has_aliases:
+                return outline
+
+        with open(descriptor_file_path, "rb") as f:
+            content = f.read()
+
+        data = cache.get(content) if cache is not None else None
+
+        if data is None:
+            data = _load_yaml(content)
+            _validate_descriptor(data)
+
+            if cache is not None:
+                cache.set(content, data)
+
+        return data
+
+
+def _load_yaml(content: bytes):
+    with span("descriptor.yaml", size=len(content)):
         try:
-            with open(descriptor_file_path) as f:
-                data = yaml.load(f, Loader=yaml.FullLoader)
-        except FileNotFoundError:
-            raise
+            return yaml.load(content, Loader=Loader)
         except ScannerError as e:
             raise DescriptorError(
                 f"The specified file is not a valid descriptor. Error: {str(e)}"
@@ -101,26 +579,11 @@ class Descriptor(object):
             raise DescriptorError(
                 f"The specified file is not a valid descriptor. Error: {str(e)}"
             )
-        else:
-            self._parse_descriptor(data)
-
-    def _parse_descriptor(self, data: dict()) -> None:
-        if not isinstance(data, dict):
-            raise DescriptorError("The specified file is not a valid descriptor")
 
-        try:
-            descriptor_models = data["models"]
-        except KeyError:
-            raise DescriptorError(
-                'Descriptor file is missing the root element "models".'
-            )
-        else:
-            if descriptor_models is None:
-                return
 
-            for name, data in descriptor_models.items():
-                self.__models[str(name)] = Model(str(name), data)
+def _validate_descriptor(data: dict()) -> None:
+    if not isinstance(data, dict):
+        raise DescriptorError("The specified file is not a valid descriptor")
 
-    @property
-    def models(self) -> dict:
-        return self.__models
+    if "models" not in data:
+        raise DescriptorError('Descriptor file is missing the root element "models".')
@@ -1,27 +1,101 @@
-import sagemaker
+import asyncio
+import contextvars
+import functools
+import os
+import re
 
-from sagemaker.tensorflow import TensorFlow
-from sagemaker.tuner import (
-    HyperparameterTuner,
-)
+from leiah.channels import get_channels, get_training_input
+from leiah.packaging import get_source_digest
+from leiah.session import SessionPool, get_default_session_pool
+from leiah.tracing import span
+from leiah.tracking import TRAINING, TUNING, JobHandle
+
+
+TUNING_JOB_TIMESTAMP = re.compile(r"-\d{6}-\d{4}")
 
 
 class Estimator(object):
-    def __init__(self, model: str, job: str, hyperparameters: dict = None, **kwargs):
+    __slots__ = (
+        "model",
+        "job",
+        "hyperparameters",
+        "session",
+        "_sagemaker_estimator",
+        "_source_digest",
+    )
+
+    def __init__(
+        self,
+        model: str,
+        job: str,
+        hyperparameters: dict = None,
+        session: SessionPool = None,
+        **kwargs,
+    ):
         self.model = model
         self.job = job
         self.hyperparameters = hyperparameters or dict()
+        self.session = session or get_default_session_pool()
+        self._sagemaker_estimator = None
+        self._source_digest = None
+
+    @property
+    def sagemaker_estimator(self):
+        # The SageMaker estimator points to the packaged source code, so it's built
+        # again whenever the source directory changes.
+        digest = self.get_source_digest()
+
+        if self._sagemaker_estimator is None or digest != self._source_digest:
+            with span(
+                "estimator.get_sagemaker_estimator", job=f"{self.model}.{self.job}"
+            ):
+                self._sagemaker_estimator = self.get_sagemaker_estimator()
+                self._source_digest = digest
+
+        return self._sagemaker_estimator
+
+    def get_source_digest(self):
+        source_dir = getattr(self, "source_dir", None)
+        if isinstance(source_dir, (str, os.PathLike)) and os.path.isdir(source_dir):
+            return get_source_digest(source_dir)
+
+        return None
 
     def fit(self):
         print(f"Fitting estimator {self.get_training_job_name()}...")
 
-        sagemaker_estimator = self.get_sagemaker_estimator()
-        return sagemaker_estimator.fit(self.channels, wait=False)
+        sagemaker_estimator = self.sagemaker_estimator
+
+        sagemaker_estimator.fit(self.get_inputs(), wait=False)
+        return JobHandle(TRAINING, sagemaker_estimator.latest_training_job.job_name)
 
     def tune(self, **kwargs):
         print(f"Tuning estimator {self.get_tuning_job_name()}...")
         sagemaker_tuner = self.get_sagemaker_tuner(**kwargs)
-        return sagemaker_tuner.fit(self.channels, wait=False)
+
+        sagemaker_tuner.fit(self.get_inputs(), wait=False)
+        return JobHandle(TUNING, sagemaker_tuner.latest_tuning_job.job_name)
+
+    async def afit(self):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run, self.fit
+        )
+
+    async def atune(self, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run, functools.partial(self.tune, **kwargs)
+        )
+
+    def get_inputs(self):
+        channels = getattr(self, "channels", None)
+        if not channels:
+            return channels
+
+        return {
+            name: get_training_input(channel) for name, channel in channels.items()
+        }
 
     def get_training_job_name(self):
         return f"training-{self.model}-{self.job}"
@@ -29,16 +103,57 @@ class Estimator(object):
     def get_tuning_job_name(self):
         return f"tuning-{self.model}-{self.job}"
 
+    def get_latest_tuning_job_name(self):
+        from sagemaker.tuner import HyperparameterTuner
+
+        # SageMaker trims the base name so the timestamp fits in the tuning job name.
+        # A trimmed name could belong to a different job, so it isn't resolved.
+        length = HyperparameterTuner.TUNING_JOB_NAME_MAX_LENGTH - len("-yymmdd-HHMM")
+        prefix = self.get_tuning_job_name()
+        if len(prefix) > length:
+            return None
+
+        response = self.session.client("sagemaker").list_hyper_parameter_tuning_jobs(
+            NameContains=prefix,
+            SortBy="CreationTime",
+            SortOrder="Descending",
+            MaxResults=100,
+        )
+
+        for summary in response.get("HyperParameterTuningJobSummaries", []):
+            name = summary["HyperParameterTuningJobName"]
+            start = len(prefix)
+            if name.startswith(prefix) and TUNING_JOB_TIMESTAMP.fullmatch(name[start:]):
+                return name
+
+        return None
+
     def get_sagemaker_tuner(self, **kwargs):
+        from sagemaker.tuner import HyperparameterTuner
+
         return HyperparameterTuner(
             base_tuning_job_name=self.get_tuning_job_name(),
-            estimator=self.get_sagemaker_estimator(),
+            estimator=self.sagemaker_estimator,
             objective_metric_name=self.get_tuner_objective_metric_name(),
             objective_type=kwargs.get("objective_type", "Minimize"),
             hyperparameter_ranges=kwargs["hyperparameter_ranges"],
             metric_definitions=self.get_tuner_metric_definitions(),
             max_jobs=kwargs.get("max_jobs", 1),
             max_parallel_jobs=kwargs.get("max_parallel_jobs", 1),
+            strategy=kwargs.get("strategy", "Bayesian"),
+            early_stopping_type=kwargs.get("early_stopping_type", "Off"),
+            warm_start_config=self.get_warm_start_config(kwargs.get("warm_start")),
+        )
+
+    def get_warm_start_config(self, warm_start: dict = None):
+        if not warm_start:
+            return None
+
+        from sagemaker.tuner import WarmStartConfig, WarmStartTypes
+
+        return WarmStartConfig(
+            warm_start_type=WarmStartTypes(warm_start["type"]),
+            parents=set(warm_start["parents"]),
         )
 
     def get_sagemaker_estimator(self):
@@ -52,6 +167,23 @@ class Estimator(object):
 
 
 class TensorFlowEstimator(Estimator):
+    __slots__ = (
+        "entry_point",
+        "train_instance_type",
+        "source_dir",
+        "model_uri",
+        "model_dir",
+        "code_location",
+        "output_path",
+        "train_max_run",
+        "py_version",
+        "framework_version",
+        "train_instance_count",
+        "train_volume_size",
+        "debugger_hook_config",
+        "channels",
+    )
+
     def __init__(
         self,
         model: str,
@@ -71,12 +203,14 @@ class TensorFlowEstimator(Estimator):
         train_volume_size: int = 10,
         debugger_hook_config: bool = False,
         channels: dict = None,
+        session: SessionPool = None,
         **kwargs,
     ):
         super().__init__(
             model=model,
             job=job,
             hyperparameters=hyperparameters,
+            session=session,
         )
 
         self.entry_point = entry_point
@@ -92,14 +226,28 @@ class TensorFlowEstimator(Estimator):
         self.train_instance_count = train_instance_count
         self.train_volume_size = train_volume_size
         self.debugger_hook_config = debugger_hook_config
-        self.channels = channels
+        self.channels = get_channels(channels)
+
+    def get_source_dir(self):
+        if (
+            self.source_dir
+            and os.path.isdir(self.source_dir)
+            and self.code_location
+            and self.code_location.startswith("s3://")
+        ):
+            return self.session.packager.upload(self.source_dir, self.code_location)
+
+        return self.source_dir
 
     def get_sagemaker_estimator(self):
+        from sagemaker.tensorflow import TensorFlow
+
         sagemaker_estimator = TensorFlow(
             base_job_name=self.get_training_job_name(),
-            source_dir=self.source_dir,
+            source_dir=self.get_source_dir(),
             entry_point=self.entry_point,
-            role=sagemaker.get_execution_role(),
+            role=self.session.role,
+            sagemaker_session=self.session.sagemaker_session,
             hyperparameters=self.hyperparameters,
             train_instance_type=self.train_instance_type,
             train_instance_count=self.train_instance_count,
@@ -1,2 +1,6 @@
 class DescriptorError(Exception):
     pass
+
+
+class DaemonError(Exception):
+    pass
@@ -1,172 +1,354 @@
+import hashlib
 import importlib
+import inspect
+import json
+import os
+
+from collections import ChainMap, namedtuple
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from leiah.exceptions import DescriptorError
+from leiah.packaging import get_source_digest
+from leiah.search import CategoricalRange, ContinuousRange, IntegerRange, SearchSpace
+from leiah.tracing import span
+
 
-from sagemaker.tuner import (
-    IntegerParameter,
-    CategoricalParameter,
-    ContinuousParameter,
+FINGERPRINT_EXCLUDED_PROPERTIES = (
+    "description",
+    "training-jobs",
+    "hyperparameter-tuning-jobs",
+    "tags",
 )
-from leiah.exceptions import DescriptorError
+
+ESTIMATOR_EXCLUDED_PROPERTIES = ("model", "job", "hyperparameters", "tags")
+
+TUNING_EXCLUDED_ATTRIBUTES = (
+    "estimator",
+    "description",
+    "hyperparameters",
+    "tags",
+    "warm_start",
+)
+
+TUNING_STRATEGIES = ("Bayesian", "Random", "Hyperband", "Grid")
+
+EARLY_STOPPING_TYPES = ("Off", "Auto")
+
+WARM_START_TYPES = ("IdenticalDataAndAlgorithm", "TransferLearning")
+
+DEFAULT_WARM_START_TYPE = "IdenticalDataAndAlgorithm"
+
+MAX_WARM_START_PARENTS = 5
+
+ResolvedEstimator = namedtuple("ResolvedEstimator", ["class_", "signature", "error"])
+
+_resolved_estimators = dict()
+
+
+def resolve_estimator(estimator: str) -> ResolvedEstimator:
+    try:
+        resolved = _resolved_estimators[estimator]
+    except KeyError:
+        with span("estimator.import", estimator=estimator):
+            resolved = _import_estimator(estimator)
+
+        _resolved_estimators[estimator] = resolved
+
+    if resolved.error is not None:
+        raise DescriptorError(resolved.error)
+
+    return resolved
+
+
+def clear_estimator_cache() -> None:
+    _resolved_estimators.clear()
+
+
+def _import_estimator(estimator: str) -> ResolvedEstimator:
+    error = f'Error creating estimator "{estimator}"'
+
+    identifiers = estimator.strip().split(".")
+    class_name = identifiers[-1]
+    module_name = ".".join(identifiers[:-1])
+
+    if not module_name:
+        return ResolvedEstimator(None, None, error)
+
+    try:
+        module = importlib.import_module(module_name)
+        class_ = getattr(module, class_name)
+    except ModuleNotFoundError:
+        return ResolvedEstimator(None, None, error)
+    except AttributeError:
+        return ResolvedEstimator(None, None, error)
+
+    try:
+        signature = inspect.signature(class_)
+    except (TypeError, ValueError):
+        signature = None
+
+    return ResolvedEstimator(class_, signature, None)
+
+
+def _get_estimator_job(identifier: str) -> str:
+    # Matrix identifiers aren't valid in SageMaker job names, so their parameters are
+    # replaced with a short digest.
+    base, bracket, _ = identifier.partition("[")
+    if not bracket:
+        return identifier
+
+    return f"{base}-{hashlib.sha1(identifier.encode()).hexdigest()[:8]}"
 
 
 class SagemakerJob(object):
+    __slots__ = ("model", "identifier", "data", "estimator")
+
     def __init__(self, model: object, identifier: str, data: dict) -> None:
         self.model = model
         self.identifier = identifier
+        self.data = data
 
         self._initialize(data)
 
-    def _initialize(self, data):
-        def get_properties():
-            properties = dict()
-            properties.update(self.model.data)
-            properties.update(data)
+    @property
+    def name(self) -> str:
+        return f"{self.model.name}.{self.identifier}"
 
-            return properties
+    @property
+    def description(self) -> str:
+        return self.data.get("description", None)
 
-        def get_hyperparameters():
-            hyperparameters = dict()
-            if "hyperparameters" in self.model.data:
-                hyperparameters.update(self.model.data["hyperparameters"])
+    @property
+    def estimator_classname(self) -> str:
+        return self.properties["estimator"]
 
-            if "hyperparameters" in data:
-                hyperparameters.update(data["hyperparameters"])
+    @property
+    def properties(self) -> Mapping:
+        return MappingProxyType(ChainMap(self.data, self.model.data))
 
-            return hyperparameters
+    @property
+    def hyperparameters(self) -> Mapping:
+        return MappingProxyType(
+            ChainMap(
+                self.data.get("hyperparameters", None) or dict(),
+                self.model.data.get("hyperparameters", None) or dict(),
+            )
+        )
 
-        self.description = data.get("description", None)
+    def run(self, backend=None):
+        raise NotImplementedError()
 
-        estimator_classname = (
-            data["estimator"] if "estimator" in data else self.model.data["estimator"]
-        )
+    async def arun(self, backend=None):
+        raise NotImplementedError()
 
+    def _initialize(self, data):
         self.estimator = self._get_estimator(
-            estimator_classname,
+            self.estimator_classname,
             model=self.model.name,
-            job=self.identifier,
-            properties=get_properties(),
-            hyperparameters=get_hyperparameters(),
+            job=_get_estimator_job(self.identifier),
+            properties=self.properties,
+            hyperparameters=dict(self.hyperparameters),
         )
 
+    def fingerprint(self) -> str:
+        configuration = {
+            "type": type(self).__name__,
+            "estimator": self.estimator_classname,
+            "properties": {
+                key: value
+                for key, value in self.properties.items()
+                if key not in FINGERPRINT_EXCLUDED_PROPERTIES
+            },
+            "hyperparameters": dict(self.hyperparameters),
+        }
+
+        source_dir = getattr(self.estimator, "source_dir", None)
+        if isinstance(source_dir, (str, Path)) and os.path.isdir(source_dir):
+            configuration["source"] = get_source_digest(source_dir)
+
+        content = json.dumps(configuration, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
     def _get_estimator(self, estimator, model, job, properties, hyperparameters):
-        def remove_attribute(properties, attribute):
-            if attribute in properties:
-                del properties[attribute]
-
-        identifiers = estimator.strip().split(".")
-        class_name = identifiers[-1]
-        module_name = ".".join(identifiers[:-1])
-
-        if not module_name:
-            raise DescriptorError(f'Error creating estimator "{estimator}"')
-
-        try:
-            module = importlib.import_module(module_name)
-            class_ = getattr(module, class_name)
-        except ModuleNotFoundError:
-            raise DescriptorError(f'Error creating estimator "{estimator}"')
-        except AttributeError:
-            raise DescriptorError(f'Error creating estimator "{estimator}"')
-        else:
-            remove_attribute(properties, "model")
-            remove_attribute(properties, "job")
-            remove_attribute(properties, "hyperparameters")
+        with span("job.get_estimator", job=f"{model}.{job}", estimator=estimator):
+            resolved = resolve_estimator(estimator)
+
+            arguments = {
+                key: value
+                for key, value in properties.items()
+                if key not in ESTIMATOR_EXCLUDED_PROPERTIES
+            }
+            arguments.update(model=model, job=job, hyperparameters=hyperparameters)
+
+            if resolved.signature is not None:
+                try:
+                    resolved.signature.bind(**arguments)
+                except TypeError as e:
+                    raise DescriptorError(
+                        f'Error creating estimator "{estimator}". {str(e)}'
+                    )
 
             try:
-                return class_(
-                    model=model,
-                    job=job,
-                    hyperparameters=hyperparameters,
-                    **properties,
-                )
+                instance = resolved.class_(**arguments)
             except TypeError as e:
                 raise DescriptorError(
                     f'Error creating estimator "{estimator}". {str(e)}'
                 )
 
+            if self.model.session is not None:
+                instance.session = self.model.session
+
+            return instance
+
 
 class TrainingJob(SagemakerJob):
-    def run(self):
-        self.estimator.fit()
+    __slots__ = ()
+
+    def run(self, backend=None):
+        with span("job.fit", job=self.name):
+            if backend is not None:
+                return backend.fit(self.estimator)
+
+            return self.estimator.fit()
+
+    async def arun(self, backend=None):
+        with span("job.fit", job=self.name):
+            if backend is not None:
+                return backend.fit(self.estimator)
+
+            return await self.estimator.afit()
 
 
 class HyperparameterTuningJob(SagemakerJob):
+    __slots__ = ("search_space", "parent_tuning_jobs")
+
     def __init__(self, model: object, identifier: str, data: dict) -> None:
         super().__init__(model=model, identifier=identifier, data=data)
 
-        self.hyperparameter_ranges = self._get_hyperparameter_ranges(
+        self.search_space = SearchSpace.compile(
             data.get("hyperparameter_ranges", None)
         )
+        self.parent_tuning_jobs = None
 
-        self.attributes = data
-        self.attributes["hyperparameter_ranges"] = self._get_hyperparameter_ranges(
-            data.get("hyperparameter_ranges", None)
-        )
+        self._validate_strategy()
+        self._validate_warm_start()
 
-    def run(self):
-        self.estimator.tune(**self.attributes)
+    @property
+    def warm_start_parents(self) -> list:
+        warm_start = self.data.get("warm_start", None)
+        if not warm_start:
+            return []
 
-    def _get_hyperparameter_ranges(self, hyperparameter_ranges):
-        if not hyperparameter_ranges:
-            return dict()
+        return [str(parent) for parent in warm_start["parents"]]
 
-        result = dict()
-        for parameter, data in hyperparameter_ranges.items():
-            if "type" not in data:
-                raise DescriptorError(
-                    f'Parameter "{parameter}" doesn\'t have a "type" specified'
+    @property
+    def hyperparameter_ranges(self) -> dict:
+        return self.search_space.to_sagemaker()
+
+    @property
+    def attributes(self) -> dict:
+        return self._get_attributes(self.hyperparameter_ranges)
+
+    def run(self, backend=None):
+        with span("job.tune", job=self.name):
+            if backend is not None:
+                return backend.tune(
+                    self.estimator,
+                    **self._get_attributes(self.search_space, warm_start=False),
                 )
 
-            if data["type"] == "categorical":
-                result[parameter] = self._get_categorical_parameter(data)
-            elif data["type"] == "integer":
-                result[parameter] = self._get_integer_parameter(data)
-            elif data["type"] == "continuous":
-                result[parameter] = self._get_continuous_parameter(data)
-            else:
+            return self.estimator.tune(**self.attributes)
+
+    async def arun(self, backend=None):
+        with span("job.tune", job=self.name):
+            if backend is not None:
+                return backend.tune(
+                    self.estimator,
+                    **self._get_attributes(self.search_space, warm_start=False),
+                )
+
+            return await self.estimator.atune(**self.attributes)
+
+    def _get_attributes(self, hyperparameter_ranges, warm_start: bool = True) -> dict:
+        attributes = {
+            key: value
+            for key, value in self.data.items()
+            if key not in TUNING_EXCLUDED_ATTRIBUTES
+        }
+        attributes["hyperparameter_ranges"] = hyperparameter_ranges
+
+        if warm_start and self.warm_start_parents:
+            if self.parent_tuning_jobs is None:
                 raise DescriptorError(
-                    f"Parameter type \"{data['type']}\" is not supported"
+                    f'The warm start parents of job "{self.name}" haven\'t been '
+                    "resolved"
                 )
 
-        return result
+            attributes["warm_start"] = {
+                "type": self.data["warm_start"].get("type", DEFAULT_WARM_START_TYPE),
+                "parents": list(self.parent_tuning_jobs),
+            }
 
-    def _get_categorical_parameter(self, data):
-        if "values" not in data:
+        return attributes
+
+    def _validate_strategy(self) -> None:
+        strategy = self.data.get("strategy", "Bayesian")
+        if strategy not in TUNING_STRATEGIES:
+            raise DescriptorError(f'Tuning strategy "{strategy}" is not supported')
+
+        early_stopping_type = self.data.get("early_stopping_type", "Off")
+        if early_stopping_type not in EARLY_STOPPING_TYPES:
             raise DescriptorError(
-                'The "values" attribute of a categorical parameter is required'
+                f'Early stopping type "{early_stopping_type}" is not supported'
             )
 
-        return CategoricalParameter(values=data["values"])
+        if strategy == "Hyperband" and early_stopping_type != "Off":
+            raise DescriptorError(
+                "The Hyperband strategy has its own early stopping mechanism and "
+                'requires "early_stopping_type" to be "Off"'
+            )
 
-    def _get_integer_parameter(self, data):
-        if "min_value" not in data:
+        if strategy == "Grid" and not all(
+            isinstance(parameter_range, CategoricalRange)
+            for _, parameter_range in self.search_space.items()
+        ):
             raise DescriptorError(
-                'The "min_value" attribute of an integer parameter is required'
+                "The Grid strategy only supports categorical parameters"
             )
 
-        if "max_value" not in data:
+    def _validate_warm_start(self) -> None:
+        warm_start = self.data.get("warm_start", None)
+        if not warm_start:
+            return
+
+        if not isinstance(warm_start, dict) or not warm_start.get("parents"):
             raise DescriptorError(
-                'The "max_value" attribute of an integer parameter is required'
+                'The "parents" attribute of a warm start configuration is required'
             )
 
-        return IntegerParameter(
-            min_value=data["min_value"],
-            max_value=data["max_value"],
-            scaling_type=data.get("scaling_type", "Auto"),
-        )
+        if isinstance(warm_start["parents"], str):
+            raise DescriptorError(
+                'The "parents" attribute of a warm start configuration must be a list'
+            )
 
-    def _get_continuous_parameter(self, data):
-        if "min_value" not in data:
+        if len(warm_start["parents"]) > MAX_WARM_START_PARENTS:
             raise DescriptorError(
-                'The "min_value" attribute of a continuous parameter is required'
+                f"A warm start configuration supports up to {MAX_WARM_START_PARENTS} "
+                "parents"
             )
 
-        if "max_value" not in data:
+        warm_start_type = warm_start.get("type", DEFAULT_WARM_START_TYPE)
+        if warm_start_type not in WARM_START_TYPES:
             raise DescriptorError(
-                'The "max_value" attribute of a continuous parameter is required'
+                f'Warm start type "{warm_start_type}" is not supported'
             )
 
-        return ContinuousParameter(
-            min_value=data["min_value"],
-            max_value=data["max_value"],
-            scaling_type=data.get("scaling_type", "Auto"),
-        )
+    def _get_categorical_parameter(self, data):
+        return CategoricalRange.from_data(data).to_sagemaker()
+
+    def _get_integer_parameter(self, data):
+        return IntegerRange.from_data(data).to_sagemaker()
+
+    def _get_continuous_parameter(self, data):
+        return ContinuousRange.from_data(data).to_sagemaker()
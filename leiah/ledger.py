@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+
+
+class Ledger(object):
+    def __init__(self, path=".leiah/ledger.sqlite") -> None:
+        self.path = Path(path)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS submissions ("
+                "name TEXT PRIMARY KEY, "
+                "fingerprint TEXT NOT NULL, "
+                "submitted_at REAL NOT NULL, "
+                "job_name TEXT)"
+            )
+
+            columns = [
+                row[1]
+                for row in self._connection.execute("PRAGMA table_info(submissions)")
+            ]
+            if "job_name" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE submissions ADD COLUMN job_name TEXT"
+                )
+
+            self._connection.commit()
+
+        return self._connection
+
+    def get(self, name: str) -> str:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT fingerprint FROM submissions WHERE name = ?", (name,)
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def get_job_name(self, name: str) -> str:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT job_name FROM submissions WHERE name = ?", (name,)
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def record(self, name: str, fingerprint: str, job_name: str = None) -> None:
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO submissions "
+                "(name, fingerprint, submitted_at, job_name) VALUES (?, ?, ?, ?)",
+                (name, fingerprint, time.time(), job_name),
+            )
+            self.connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
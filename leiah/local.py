@@ -0,0 +1,198 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from leiah.exceptions import DescriptorError
+from leiah.tuning import LocalTuner
+
+
+class LocalRun(object):
+    def __init__(self, name: str, directory: Path, future=None) -> None:
+        self.name = name
+        self.directory = directory
+        self.future = future
+        self.exit_code = None
+        self.duration = None
+
+    @property
+    def log_file_path(self) -> Path:
+        return self.directory / "output.log"
+
+    @property
+    def model_dir(self) -> Path:
+        return self.directory / "model"
+
+    @property
+    def output_data_dir(self) -> Path:
+        return self.directory / "output"
+
+    @property
+    def done(self) -> bool:
+        return self.future is None or self.future.done()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.wait() == 0
+
+    @property
+    def log(self) -> str:
+        self.wait()
+        return self.log_file_path.read_text()
+
+    def wait(self, timeout: float = None) -> int:
+        if self.future is not None:
+            self.future.result(timeout=timeout)
+
+        return self.exit_code
+
+    def __repr__(self) -> str:
+        status = "running" if not self.done else f"exit code {self.exit_code}"
+        return f"<LocalRun {self.name} {status}>"
+
+
+class LocalBackend(object):
+    def __init__(
+        self,
+        max_workers: int = None,
+        work_dir=".leiah/local",
+        channels: dict = None,
+        python: str = sys.executable,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.work_dir = Path(work_dir)
+        self.channels = channels or dict()
+        self.python = python
+        self.runs = []
+
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+            return self._executor
+
+    def fit(self, estimator, hyperparameters: dict = None, name: str = None):
+        print(f"Fitting estimator {estimator.get_training_job_name()} locally...")
+
+        hyperparameters = dict(
+            estimator.hyperparameters if hyperparameters is None else hyperparameters
+        )
+        name = name or estimator.get_training_job_name()
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+
+        run = LocalRun(name, self.work_dir / f"{name}-{timestamp}")
+        command, environment = self._get_command(estimator, hyperparameters, run)
+
+        with self._lock:
+            self.runs.append(run)
+
+        run.future = self.executor.submit(
+            self._execute, run, command, environment, estimator.source_dir
+        )
+
+        return run
+
+    def tune(self, estimator, **kwargs) -> LocalTuner:
+        return LocalTuner(self, estimator, **kwargs).start()
+
+    def wait(self) -> list:
+        with self._lock:
+            runs = list(self.runs)
+
+        for run in runs:
+            run.wait()
+
+        return runs
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_channel_path(self, name: str, uri: str) -> str:
+        if name in self.channels:
+            return str(self.channels[name])
+
+        if uri in self.channels:
+            return str(self.channels[uri])
+
+        if uri.startswith("file://"):
+            return uri.replace("file://", "", 1)
+
+        if "://" not in uri:
+            return uri
+
+        raise DescriptorError(
+            f'Channel "{name}" ({uri}) is not mapped to a local path'
+        )
+
+    def _get_command(self, estimator, hyperparameters: dict, run: LocalRun) -> tuple:
+        estimator_channels = getattr(estimator, "channels", None) or dict()
+        channels = {
+            name: self.get_channel_path(name, getattr(channel, "uri", channel))
+            for name, channel in estimator_channels.items()
+        }
+
+        if getattr(estimator, "model_dir", None):
+            hyperparameters["model_dir"] = str(run.model_dir.resolve())
+
+        command = [self.python, estimator.entry_point]
+        for key, value in hyperparameters.items():
+            if not isinstance(value, str):
+                value = json.dumps(value)
+
+            command.extend([f"--{key}", value])
+
+        environment = dict(os.environ)
+        environment.update(
+            {
+                "SM_TRAINING_ENV": "local",
+                "SM_HPS": json.dumps(hyperparameters),
+                "SM_CHANNELS": json.dumps(sorted(channels)),
+                "SM_MODEL_DIR": str(run.model_dir.resolve()),
+                "SM_OUTPUT_DATA_DIR": str(run.output_data_dir.resolve()),
+                "SM_NUM_CPUS": "1",
+            }
+        )
+
+        for name, path in channels.items():
+            environment[f"SM_CHANNEL_{name.upper()}"] = str(Path(path).resolve())
+
+        return command, environment
+
+    def _execute(self, run: LocalRun, command: list, environment: dict, cwd) -> int:
+        run.model_dir.mkdir(parents=True, exist_ok=True)
+        run.output_data_dir.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        with open(run.log_file_path, "wb") as log:
+            process = subprocess.run(
+                command,
+                cwd=cwd,
+                env=environment,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+
+        run.duration = time.perf_counter() - start
+        run.exit_code = process.returncode
+
+        return run.exit_code
@@ -0,0 +1,109 @@
+import itertools
+import math
+
+from leiah.exceptions import DescriptorError
+
+
+class JobMatrix(object):
+    __slots__ = ("identifier", "data", "names", "values", "_positions")
+
+    def __init__(self, identifier: str, data: dict) -> None:
+        self.identifier = identifier
+        self.data = data
+
+        matrix = data.get("matrix", None)
+        if not isinstance(matrix, dict) or not matrix:
+            raise DescriptorError(
+                f'The matrix of job "{identifier}" must map parameter names to '
+                "lists of values"
+            )
+
+        self.names = tuple(str(name) for name in matrix)
+        self.values = []
+        self._positions = []
+
+        for name, values in zip(self.names, matrix.values()):
+            if not isinstance(values, list) or not values:
+                raise DescriptorError(
+                    f'Parameter "{name}" of the matrix of job "{identifier}" must be '
+                    "a non-empty list of values"
+                )
+
+            positions = {_format(value): index for index, value in enumerate(values)}
+            if len(positions) != len(values):
+                raise DescriptorError(
+                    f'Parameter "{name}" of the matrix of job "{identifier}" has '
+                    "duplicated values"
+                )
+
+            self.values.append(tuple(values))
+            self._positions.append(positions)
+
+        self.values = tuple(self.values)
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for values in self.values)
+
+    def __iter__(self):
+        for combination in itertools.product(*self.values):
+            yield self.get_identifier(combination)
+
+    def __contains__(self, identifier) -> bool:
+        return self.get_combination(identifier) is not None
+
+    def get_identifier(self, combination: tuple) -> str:
+        parameters = ",".join(
+            f"{name}={_format(value)}" for name, value in zip(self.names, combination)
+        )
+        return f"{self.identifier}[{parameters}]"
+
+    def get_combination(self, identifier: str):
+        prefix = f"{self.identifier}["
+        if not identifier.startswith(prefix) or not identifier.endswith("]"):
+            return None
+
+        start = len(prefix)
+        parameters = identifier[start:-1]
+        combination = []
+
+        for index, name in enumerate(self.names):
+            if not parameters.startswith(f"{name}="):
+                return None
+
+            start = len(name) + 1
+            parameters = parameters[start:]
+
+            if index + 1 < len(self.names):
+                value, separator, parameters = parameters.partition(
+                    f",{self.names[index + 1]}="
+                )
+                if not separator:
+                    return None
+
+                parameters = f"{self.names[index + 1]}={parameters}"
+            else:
+                value = parameters
+
+            position = self._positions[index].get(value, None)
+            if position is None:
+                return None
+
+            combination.append(self.values[index][position])
+
+        return tuple(combination)
+
+    def get_data(self, combination: tuple) -> dict:
+        data = {key: value for key, value in self.data.items() if key != "matrix"}
+        data["hyperparameters"] = dict(
+            self.data.get("hyperparameters", None) or dict(),
+            **dict(zip(self.names, combination)),
+        )
+
+        return data
+
+
+def _format(value) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+
+    return str(value)
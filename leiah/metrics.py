@@ -0,0 +1,234 @@
+import re
+
+from array import array
+
+import numpy as np
+
+from leiah.exceptions import DescriptorError
+
+
+CHUNK_SIZE = 1024 * 1024
+
+SPECIAL_CHARACTERS = ".^$*+?{}[]\\|()"
+QUANTIFIERS = "*+?{"
+
+GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=")
+
+
+def _get_common_prefix(regexes: list) -> str:
+    prefix = []
+
+    for characters in zip(*regexes):
+        character = characters[0]
+        if character in SPECIAL_CHARACTERS or any(c != character for c in characters):
+            break
+
+        prefix.append(character)
+
+    # A literal followed by a quantifier in any of the regexes belongs to that
+    # quantifier, so it can't be moved out of the alternation.
+    while prefix:
+        quantified = tuple("".join(prefix) + quantifier for quantifier in QUANTIFIERS)
+        if not any(regex.startswith(quantified) for regex in regexes):
+            break
+
+        prefix.pop()
+
+    return "".join(prefix)
+
+
+def _split_global_flags(regex: str) -> tuple:
+    flags = ""
+
+    match = GLOBAL_FLAGS.match(regex)
+    while match is not None:
+        flags += match.group(1)
+        end = match.end()
+        regex = regex[end:]
+        match = GLOBAL_FLAGS.match(regex)
+
+    return flags, regex
+
+
+def _has_alternation(regex: str) -> bool:
+    depth = 0
+    position = 0
+
+    while position < len(regex):
+        character = regex[position]
+
+        if character == "\\":
+            position += 1
+        elif character == "[":
+            # A "]" right after the opening bracket (or its negation) is a literal.
+            position += 1
+            if regex.startswith("^", position):
+                position += 1
+            if regex.startswith("]", position):
+                position += 1
+            while position < len(regex) and regex[position] != "]":
+                if regex[position] == "\\":
+                    position += 1
+                position += 1
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+
+        position += 1
+
+    return False
+
+
+def _get_alternative(index: int, regex: str, flags: str) -> str:
+    if flags:
+        regex = f"(?{flags}:{regex})"
+
+    return f"(?P<m{index}>(?:{regex}))"
+
+
+class MetricEngine(object):
+    def __init__(self, metric_definitions: list) -> None:
+        self.names = []
+        regexes = []
+        flags = []
+        groups = []
+
+        for index, definition in enumerate(metric_definitions):
+            try:
+                name, regex = definition["Name"], definition["Regex"]
+                pattern = re.compile(regex)
+            except (KeyError, TypeError):
+                raise DescriptorError(f"Invalid metric definition {definition}")
+            except re.error as e:
+                raise DescriptorError(f'Invalid regex for metric "{name}". {str(e)}')
+
+            if pattern.groups < 1:
+                raise DescriptorError(
+                    f'The regex for metric "{name}" must have a capturing group'
+                )
+
+            # Each regex is wrapped in a named group, which renumbers its groups.
+            if BACKREFERENCE.search(regex):
+                raise DescriptorError(
+                    f'The regex for metric "{name}" can\'t use backreferences'
+                )
+
+            # Global flags are only allowed at the start of the combined pattern, so
+            # they are scoped to the metric's own regex instead.
+            regex_flags, regex = _split_global_flags(regex)
+
+            try:
+                re.compile(_get_alternative(index, regex, regex_flags).encode())
+            except re.error as e:
+                raise DescriptorError(f'Invalid regex for metric "{name}". {str(e)}')
+
+            self.names.append(name)
+            regexes.append(regex)
+            flags.append(regex_flags)
+            groups.append(pattern.groups)
+
+        # Python's regex engine tries every alternative at every position, so the
+        # literal prefix shared by all the metrics is matched once, up front. That's
+        # only possible when every regex is a single, unflagged sequence.
+        if any(flags) or any(_has_alternation(regex) for regex in regexes):
+            prefix = ""
+        else:
+            prefix = _get_common_prefix(regexes)
+
+        alternatives = "|".join(
+            _get_alternative(index, regex.replace(prefix, "", 1), regex_flags)
+            for index, (regex, regex_flags) in enumerate(zip(regexes, flags))
+        )
+
+        self.pattern = re.compile(f"{re.escape(prefix)}(?:{alternatives})".encode())
+
+        # Each alternative is wrapped in a named group, so the value of a metric is
+        # the first group inside it that took part in the match.
+        self._groups = {
+            self.pattern.groupindex[f"m{index}"]: (index, count)
+            for index, count in enumerate(groups)
+        }
+
+    def stream(self):
+        return MetricStream(self)
+
+    def process_lines(self, lines) -> dict:
+        stream = self.stream()
+        for line in lines:
+            if isinstance(line, str):
+                line = line.encode()
+
+            stream.feed(line if line.endswith(b"\n") else line + b"\n")
+
+        return stream.close()
+
+    def process_file(self, file_path, chunk_size: int = CHUNK_SIZE) -> dict:
+        stream = self.stream()
+
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                stream.feed(chunk)
+
+        return stream.close()
+
+
+class MetricStream(object):
+    def __init__(self, engine: MetricEngine) -> None:
+        self.engine = engine
+        self._values = [array("d") for _ in engine.names]
+        self._remainder = b""
+
+    def feed(self, data) -> None:
+        if isinstance(data, str):
+            data = data.encode()
+
+        data = self._remainder + data
+        end = data.rfind(b"\n") + 1
+
+        self._remainder = data[end:]
+        self._scan(data, end)
+
+    def close(self) -> dict:
+        remainder, self._remainder = self._remainder, b""
+        self._scan(remainder, len(remainder))
+
+        return self.series
+
+    @property
+    def series(self) -> dict:
+        return {
+            name: np.frombuffer(values, dtype=np.float64).copy()
+            for name, values in zip(self.engine.names, self._values)
+        }
+
+    def _scan(self, data: bytes, end: int) -> None:
+        if not self.engine.names:
+            return
+
+        groups = self.engine._groups
+        values = self._values
+
+        for match in self.engine.pattern.finditer(data, 0, end):
+            group = match.lastindex
+            while group not in groups:
+                group -= 1
+
+            index, count = groups[group]
+            value = match.group(group + 1)
+
+            if value is None and count > 1:
+                end_group = group + count
+                value = next(
+                    (v for v in match.groups()[group:end_group] if v is not None),
+                    None,
+                )
+
+            try:
+                values[index].append(float(value))
+            except (TypeError, ValueError):
+                continue
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import tarfile
+import tempfile
+import threading
+
+from pathlib import Path
+
+from leiah.tracing import span
+
+
+_source_digests = dict()
+
+
+def _get_source_files(source_dir: Path) -> list:
+    files = []
+    for root, directories, filenames in os.walk(source_dir):
+        directories[:] = sorted(d for d in directories if d != "__pycache__")
+
+        for filename in sorted(filenames):
+            if filename.endswith(".pyc"):
+                continue
+
+            file_path = Path(root) / filename
+            files.append((file_path.relative_to(source_dir).as_posix(), file_path))
+
+    return files
+
+
+def hash_source_dir(source_dir) -> str:
+    digest = hashlib.sha256()
+
+    for relative_path, file_path in _get_source_files(Path(source_dir)):
+        digest.update(relative_path.encode())
+        digest.update(b"\0")
+
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def get_source_digest(source_dir) -> str:
+    source_dir = Path(source_dir).resolve()
+
+    snapshot = tuple(
+        (relative_path, file_path.stat().st_size, file_path.stat().st_mtime_ns)
+        for relative_path, file_path in _get_source_files(source_dir)
+    )
+
+    try:
+        cached_snapshot, digest = _source_digests[source_dir]
+    except KeyError:
+        pass
+    else:
+        if cached_snapshot == snapshot:
+            return digest
+
+    digest = hash_source_dir(source_dir)
+    _source_digests[source_dir] = (snapshot, digest)
+
+    return digest
+
+
+def clear_source_digests() -> None:
+    _source_digests.clear()
+
+
+def parse_s3_uri(uri: str) -> tuple:
+    if not uri.startswith("s3://"):
+        raise ValueError(f'"{uri}" is not an S3 URI')
+
+    bucket, _, prefix = uri.replace("s3://", "", 1).partition("/")
+    return bucket, prefix.strip("/")
+
+
+class SourcePackager(object):
+    def __init__(self, s3_client) -> None:
+        self.s3_client = s3_client
+        self._uploads = dict()
+        self._locks = dict()
+        self._lock = threading.Lock()
+
+    def get_digest(self, source_dir) -> str:
+        return get_source_digest(source_dir)
+
+    def upload(self, source_dir, code_location: str) -> str:
+        digest = self.get_digest(source_dir)
+        bucket, prefix = parse_s3_uri(code_location)
+        key = "/".join(filter(None, [prefix, "source", digest, "sourcedir.tar.gz"]))
+
+        with self._lock:
+            lock = self._locks.setdefault((bucket, key), threading.Lock())
+
+        with lock:
+            try:
+                return self._uploads[(bucket, key)]
+            except KeyError:
+                pass
+
+            if not self._exists(bucket, key):
+                self._upload(source_dir, bucket, key)
+
+            uri = f"s3://{bucket}/{key}"
+            self._uploads[(bucket, key)] = uri
+
+            return uri
+
+    def _exists(self, bucket: str, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+
+            raise
+
+        return True
+
+    def _upload(self, source_dir, bucket: str, key: str) -> None:
+        with span("packaging.upload", source_dir=str(source_dir), key=key):
+            fd, tarball_file_path = tempfile.mkstemp(suffix=".tar.gz")
+            os.close(fd)
+
+            try:
+                with tarfile.open(tarball_file_path, "w:gz") as tarball:
+                    for relative_path, file_path in _get_source_files(Path(source_dir)):
+                        tarball.add(file_path, arcname=relative_path)
+
+                self.s3_client.upload_file(tarball_file_path, bucket, key)
+            finally:
+                os.unlink(tarball_file_path)
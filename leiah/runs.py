@@ -0,0 +1,205 @@
+import asyncio
+import contextvars
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobSubmission(object):
+    def __init__(self, job, result=None, error=None, latency: float = 0.0) -> None:
+        self.job = job
+        self.result = result
+        self.error = error
+        self.latency = latency
+
+    @property
+    def name(self) -> str:
+        return self.job.name
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "succeeded" if self.succeeded else f"failed: {self.error!r}"
+        return f"<JobSubmission {self.name} {status} in {self.latency:.3f}s>"
+
+
+class RunSummary(object):
+    def __init__(
+        self, submissions: list, elapsed: float = 0.0, skipped: list = None
+    ) -> None:
+        self.submissions = submissions
+        self.elapsed = elapsed
+        self.skipped = skipped or []
+
+    def __iter__(self):
+        return iter(self.submissions)
+
+    def __len__(self) -> int:
+        return len(self.submissions)
+
+    def __getitem__(self, index):
+        return self.submissions[index]
+
+    @property
+    def succeeded(self) -> list:
+        return [submission for submission in self if submission.succeeded]
+
+    @property
+    def failed(self) -> list:
+        return [submission for submission in self if not submission.succeeded]
+
+    def __repr__(self) -> str:
+        return (
+            f"<RunSummary {len(self.succeeded)} succeeded, "
+            f"{len(self.failed)} failed, {len(self.skipped)} skipped "
+            f"in {self.elapsed:.3f}s>"
+        )
+
+
+def submit(
+    job, isolate_errors: bool = True, backend=None, prepare=None
+) -> JobSubmission:
+    start = time.perf_counter()
+
+    try:
+        if prepare is not None:
+            prepare(job)
+
+        result = job.run(backend=backend)
+    except Exception as e:
+        if not isolate_errors:
+            raise
+
+        print(f"Submission of job {job.name} failed: {str(e)}")
+        return JobSubmission(job, error=e, latency=time.perf_counter() - start)
+
+    return JobSubmission(job, result=result, latency=time.perf_counter() - start)
+
+
+def run_jobs(
+    jobs: list,
+    max_workers: int = None,
+    ledger=None,
+    incremental: bool = False,
+    backend=None,
+    prepare=None,
+) -> RunSummary:
+    start = time.perf_counter()
+
+    jobs, skipped, fingerprints = _filter_jobs(jobs, ledger, incremental)
+
+    if max_workers is None:
+        submissions = []
+        for job in jobs:
+            submissions.append(
+                submit(job, isolate_errors=False, backend=backend, prepare=prepare)
+            )
+            _record(ledger, submissions[-1], fingerprints)
+    else:
+        # Every submission runs in a copy of the caller's context, so its spans are
+        # still nested under the caller's.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    submit,
+                    job,
+                    backend=backend,
+                    prepare=prepare,
+                )
+                for job in jobs
+            ]
+            submissions = [future.result() for future in futures]
+
+        for submission in submissions:
+            _record(ledger, submission, fingerprints)
+
+    return RunSummary(submissions, elapsed=time.perf_counter() - start, skipped=skipped)
+
+
+def _filter_jobs(jobs: list, ledger, incremental: bool) -> tuple:
+    if ledger is None:
+        return jobs, [], dict()
+
+    pending = []
+    skipped = []
+    fingerprints = dict()
+
+    for job in jobs:
+        fingerprint = job.fingerprint()
+
+        if incremental and ledger.get(job.name) == fingerprint:
+            print(f"Skipping job {job.name}. Its configuration didn't change.")
+            skipped.append(job)
+        else:
+            pending.append(job)
+            fingerprints[job.name] = fingerprint
+
+    return pending, skipped, fingerprints
+
+
+def _record(ledger, submission: JobSubmission, fingerprints: dict) -> None:
+    if ledger is not None and submission.succeeded:
+        ledger.record(
+            submission.name,
+            fingerprints[submission.name],
+            job_name=getattr(submission.result, "name", None),
+        )
+
+
+async def asubmit(
+    job, semaphore: asyncio.Semaphore = None, backend=None, prepare=None
+) -> JobSubmission:
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
+
+    async with semaphore:
+        start = time.perf_counter()
+
+        try:
+            if prepare is not None:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, contextvars.copy_context().run, prepare, job
+                )
+
+            result = await job.arun(backend=backend)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Submission of job {job.name} failed: {str(e)}")
+            return JobSubmission(job, error=e, latency=time.perf_counter() - start)
+
+        return JobSubmission(job, result=result, latency=time.perf_counter() - start)
+
+
+async def arun_jobs(
+    jobs: list,
+    max_concurrency: int = 10,
+    ledger=None,
+    incremental: bool = False,
+    backend=None,
+    prepare=None,
+) -> RunSummary:
+    start = time.perf_counter()
+
+    # Fingerprints can hash whole source directories, so they are computed outside
+    # of the event loop.
+    loop = asyncio.get_running_loop()
+    jobs, skipped, fingerprints = await loop.run_in_executor(
+        None, _filter_jobs, jobs, ledger, incremental
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    submissions = await asyncio.gather(
+        *[asubmit(job, semaphore, backend=backend, prepare=prepare) for job in jobs]
+    )
+
+    for submission in submissions:
+        _record(ledger, submission, fingerprints)
+
+    return RunSummary(
+        list(submissions), elapsed=time.perf_counter() - start, skipped=skipped
+    )
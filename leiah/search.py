@@ -0,0 +1,278 @@
+import itertools
+import math
+
+from collections import namedtuple
+
+import numpy as np
+
+from leiah.exceptions import DescriptorError
+
+
+SCALING_TYPES = ("Auto", "Linear", "Logarithmic", "ReverseLogarithmic")
+
+
+def _require(data, attribute, parameter_type):
+    if attribute not in data:
+        raise DescriptorError(
+            f'The "{attribute}" attribute of {parameter_type} parameter is required'
+        )
+
+    return data[attribute]
+
+
+class CategoricalRange(namedtuple("CategoricalRange", ["values"])):
+    __slots__ = ()
+
+    @classmethod
+    def from_data(cls, data):
+        values = _require(data, "values", "a categorical")
+
+        if not isinstance(values, (list, tuple)) or not values:
+            raise DescriptorError(
+                'The "values" attribute of a categorical parameter must be a '
+                "non-empty list"
+            )
+
+        return cls(values=tuple(values))
+
+    def grid(self, points: int) -> tuple:
+        return self.values
+
+    def from_unit(self, u: np.ndarray) -> np.ndarray:
+        indices = (u * len(self.values)).astype(np.int64)
+        indices = np.minimum(indices, len(self.values) - 1)
+
+        return np.asarray(self.values, dtype=object)[indices]
+
+    def to_sagemaker(self):
+        from sagemaker.tuner import CategoricalParameter
+
+        return CategoricalParameter(values=list(self.values))
+
+
+class _NumericRange(object):
+    __slots__ = ()
+
+    @classmethod
+    def _from_data(cls, data, parameter_type):
+        min_value = _require(data, "min_value", parameter_type)
+        max_value = _require(data, "max_value", parameter_type)
+        scaling_type = data.get("scaling_type", "Auto")
+
+        try:
+            low, high = float(min_value), float(max_value)
+        except (TypeError, ValueError):
+            raise DescriptorError(
+                f'The "min_value" and "max_value" attributes of {parameter_type} '
+                "parameter must be numbers"
+            )
+
+        if low > high:
+            raise DescriptorError(
+                f'The "min_value" attribute of {parameter_type} parameter can\'t be '
+                'greater than its "max_value"'
+            )
+
+        if scaling_type not in SCALING_TYPES:
+            raise DescriptorError(f'Scaling type "{scaling_type}" is not supported')
+
+        if scaling_type == "Logarithmic" and low <= 0:
+            raise DescriptorError(
+                "Logarithmic scaling requires a positive \"min_value\""
+            )
+
+        if scaling_type == "ReverseLogarithmic" and (low < 0 or high >= 1):
+            raise DescriptorError(
+                "Reverse logarithmic scaling requires values between 0 and 1"
+            )
+
+        return cls(min_value, max_value, scaling_type)
+
+    @property
+    def bounds(self) -> tuple:
+        return float(self.min_value), float(self.max_value)
+
+    def _scale(self, u: np.ndarray) -> np.ndarray:
+        low, high = self.bounds
+
+        if self.scaling_type == "Logarithmic":
+            values = np.exp(np.log(low) + u * (np.log(high) - np.log(low)))
+        elif self.scaling_type == "ReverseLogarithmic":
+            values = 1.0 - np.exp(
+                np.log1p(-low) + u * (np.log1p(-high) - np.log1p(-low))
+            )
+        else:
+            values = low + u * (high - low)
+
+        return np.clip(values, low, high)
+
+
+class IntegerRange(
+    _NumericRange,
+    namedtuple("IntegerRange", ["min_value", "max_value", "scaling_type"]),
+):
+    __slots__ = ()
+
+    @classmethod
+    def from_data(cls, data):
+        return cls._from_data(data, "an integer")
+
+    def grid(self, points: int) -> tuple:
+        low, high = self.bounds
+        count = min(points, int(math.floor(high) - math.ceil(low)) + 1)
+        if count < 1:
+            return ()
+
+        values = np.round(self._scale(np.linspace(0.0, 1.0, count)))
+        return tuple(int(value) for value in np.unique(values))
+
+    def from_unit(self, u: np.ndarray) -> np.ndarray:
+        low, high = self.bounds
+        low, high = math.ceil(low), math.floor(high)
+
+        if self.scaling_type in ("Auto", "Linear"):
+            values = low + np.floor(u * (high - low + 1))
+        else:
+            values = np.round(self._scale(u))
+
+        return np.clip(values, low, high).astype(np.int64)
+
+    def to_sagemaker(self):
+        from sagemaker.tuner import IntegerParameter
+
+        return IntegerParameter(
+            min_value=self.min_value,
+            max_value=self.max_value,
+            scaling_type=self.scaling_type,
+        )
+
+
+class ContinuousRange(
+    _NumericRange,
+    namedtuple("ContinuousRange", ["min_value", "max_value", "scaling_type"]),
+):
+    __slots__ = ()
+
+    @classmethod
+    def from_data(cls, data):
+        return cls._from_data(data, "a continuous")
+
+    def grid(self, points: int) -> tuple:
+        values = self._scale(np.linspace(0.0, 1.0, points))
+        return tuple(float(value) for value in values)
+
+    def from_unit(self, u: np.ndarray) -> np.ndarray:
+        return self._scale(u)
+
+    def to_sagemaker(self):
+        from sagemaker.tuner import ContinuousParameter
+
+        return ContinuousParameter(
+            min_value=self.min_value,
+            max_value=self.max_value,
+            scaling_type=self.scaling_type,
+        )
+
+
+PARAMETER_TYPES = {
+    "categorical": CategoricalRange,
+    "integer": IntegerRange,
+    "continuous": ContinuousRange,
+}
+
+
+class SearchSpace(object):
+    __slots__ = ("_parameters",)
+
+    def __init__(self, parameters: dict) -> None:
+        self._parameters = tuple(parameters.items())
+
+    @classmethod
+    def compile(cls, hyperparameter_ranges: dict):
+        if not hyperparameter_ranges:
+            return cls(dict())
+
+        parameters = dict()
+        for parameter, data in hyperparameter_ranges.items():
+            if "type" not in data:
+                raise DescriptorError(
+                    f'Parameter "{parameter}" doesn\'t have a "type" specified'
+                )
+
+            try:
+                parameter_type = PARAMETER_TYPES[data["type"]]
+            except KeyError:
+                raise DescriptorError(
+                    f"Parameter type \"{data['type']}\" is not supported"
+                )
+
+            parameters[str(parameter)] = parameter_type.from_data(data)
+
+        return cls(parameters)
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+    def __iter__(self):
+        return (name for name, _ in self._parameters)
+
+    def __getitem__(self, name: str):
+        for parameter, parameter_range in self._parameters:
+            if parameter == name:
+                return parameter_range
+
+        raise KeyError(name)
+
+    def items(self):
+        return iter(self._parameters)
+
+    @property
+    def names(self) -> tuple:
+        return tuple(name for name, _ in self._parameters)
+
+    def grid_size(self, points: int = 5) -> int:
+        size = 1
+        for _, parameter_range in self._parameters:
+            size *= len(parameter_range.grid(points))
+
+        return size
+
+    def grid(self, points: int = 5):
+        names = self.names
+        axes = [parameter_range.grid(points) for _, parameter_range in self._parameters]
+
+        for values in itertools.product(*axes):
+            yield dict(zip(names, values))
+
+    def sample(self, n: int, seed=None) -> dict:
+        random_state = np.random.default_rng(seed)
+        return self._from_unit(random_state.random((n, len(self))))
+
+    def sample_latin_hypercube(self, n: int, seed=None) -> dict:
+        random_state = np.random.default_rng(seed)
+
+        strata = np.argsort(random_state.random((len(self), n)), axis=1).T
+        u = (strata + random_state.random((n, len(self)))) / n
+
+        return self._from_unit(u)
+
+    def to_sagemaker(self) -> dict:
+        return {
+            name: parameter_range.to_sagemaker()
+            for name, parameter_range in self._parameters
+        }
+
+    def _from_unit(self, u: np.ndarray) -> dict:
+        return {
+            name: parameter_range.from_unit(u[:, column])
+            for column, (name, parameter_range) in enumerate(self._parameters)
+        }
+
+
+def iterate_samples(samples: dict):
+    names = list(samples)
+    for values in zip(*(samples[name] for name in names)):
+        yield {
+            name: value.item() if isinstance(value, np.generic) else value
+            for name, value in zip(names, values)
+        }
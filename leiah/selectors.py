@@ -0,0 +1,178 @@
+import bisect
+import fnmatch
+import re
+
+from leiah.exceptions import DescriptorError
+
+
+GLOB_CHARACTERS = "*?["
+REGEX_CHARACTERS = ".^$*+?{}[]\\|()"
+
+
+class JobIndex(object):
+    def __init__(self, models) -> None:
+        self._jobs = dict()
+        self._positions = dict()
+        self._models = dict()
+        self._tags = dict()
+
+        for model in models.values():
+            self._add(model.name, get_model_jobs(model))
+
+        self._names = sorted(self._jobs)
+
+    @classmethod
+    def from_entries(cls, entries) -> "JobIndex":
+        index = cls(dict())
+
+        for model_name, jobs in entries:
+            index._add(model_name, jobs)
+
+        index._names = sorted(index._jobs)
+        return index
+
+    def _add(self, model_name: str, jobs: list) -> None:
+        self._models[model_name] = []
+
+        for identifier, tags in jobs:
+            name = f"{model_name}.{identifier}"
+
+            self._jobs[name] = (model_name, identifier)
+            self._positions[name] = len(self._positions)
+            self._models[model_name].append(name)
+
+            for tag in tags:
+                self._tags.setdefault(tag, []).append(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name) -> bool:
+        return name in self._jobs
+
+    @property
+    def names(self) -> list:
+        return list(self._names)
+
+    @property
+    def tags(self) -> list:
+        return sorted(self._tags)
+
+    def select(self, selector: str) -> list:
+        if selector.startswith("tag:"):
+            names = self._tags.get(selector.partition(":")[2], [])
+        elif selector.startswith("re:"):
+            names = self._select_regex(selector.partition(":")[2])
+        elif selector in self._jobs:
+            names = [selector]
+        elif any(character in selector for character in GLOB_CHARACTERS):
+            names = self._select_matrix(selector) or self._select_glob(selector)
+        elif selector in self._models:
+            return [self._jobs[name] for name in self._models[selector]]
+        else:
+            names = self._select_matrix(selector)
+
+        if not names:
+            raise DescriptorError(f'Job "{selector}" was not found')
+
+        return [self._jobs[name] for name in names]
+
+    def _select_matrix(self, selector: str) -> list:
+        # "model.job" selects every combination of a matrix job, and
+        # "model.job[name=value,...]" the combinations with those values.
+        base, bracket, parameters = selector.partition("[")
+        if not bracket:
+            wanted = dict()
+        elif parameters.endswith("]"):
+            wanted = _get_parameters(parameters[:-1])
+            if not wanted:
+                return []
+        else:
+            return []
+
+        prefix = f"{base}["
+        start = len(prefix)
+
+        def matches(name: str) -> bool:
+            if not name.endswith("]"):
+                return False
+
+            parameters = _get_parameters(name[start:-1])
+            return parameters is not None and wanted.items() <= parameters.items()
+
+        return self._select(prefix, matches)
+
+    def _select_glob(self, pattern: str) -> list:
+        prefix = _get_prefix(pattern, GLOB_CHARACTERS)
+        matcher = re.compile(fnmatch.translate(pattern))
+
+        return self._select(prefix, lambda name: matcher.match(name) is not None)
+
+    def _select_regex(self, pattern: str) -> list:
+        try:
+            matcher = re.compile(pattern)
+        except re.error as e:
+            raise DescriptorError(f'Invalid job selector "re:{pattern}". {str(e)}')
+
+        prefix = ""
+        if "|" not in pattern:
+            anchored = pattern[1:] if pattern.startswith("^") else pattern
+            prefix = _get_prefix(anchored, REGEX_CHARACTERS)
+
+            end = len(prefix)
+            if anchored[end:][:1] in ("?", "*", "{"):
+                prefix = prefix[:-1]
+
+        return self._select(prefix, lambda name: matcher.fullmatch(name) is not None)
+
+    def _select(self, prefix: str, matches) -> list:
+        start = bisect.bisect_left(self._names, prefix)
+        end = len(self._names)
+
+        if prefix:
+            upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            end = bisect.bisect_left(self._names, upper_bound)
+
+        names = [name for name in self._names[start:end] if matches(name)]
+        return sorted(names, key=self._positions.__getitem__)
+
+
+def get_model_jobs(model) -> list:
+    model_tags = _get_tags(model.data)
+
+    return [
+        (identifier, model_tags | _get_tags(model.jobs.get_data(identifier)))
+        for identifier in model.jobs
+    ]
+
+
+def _get_parameters(parameters: str):
+    result = dict()
+
+    for parameter in parameters.split(","):
+        name, separator, value = parameter.partition("=")
+        if not separator or not name:
+            return None
+
+        result[name] = value
+
+    return result
+
+
+def _get_prefix(pattern: str, special_characters: str) -> str:
+    for index, character in enumerate(pattern):
+        if character in special_characters:
+            return pattern[:index]
+
+    return pattern
+
+
+def _get_tags(data) -> set:
+    if not data or "tags" not in data or data["tags"] is None:
+        return set()
+
+    tags = data["tags"]
+    if isinstance(tags, str):
+        return {tags}
+
+    return {str(tag) for tag in tags}
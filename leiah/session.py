@@ -0,0 +1,116 @@
+import threading
+
+from leiah.packaging import SourcePackager
+from leiah.throttling import RateLimiter, ThrottledClient
+from leiah.tracing import span
+
+
+class SessionPool(object):
+    def __init__(
+        self,
+        boto_session=None,
+        sagemaker_session=None,
+        role: str = None,
+        packager: SourcePackager = None,
+        rate_limiter: RateLimiter = None,
+    ) -> None:
+        self._boto_session = boto_session
+        self._sagemaker_session = sagemaker_session
+        self._role = role
+        self._clients = dict()
+        self._packager = packager
+        self._rate_limiter = rate_limiter
+        self._lock = threading.RLock()
+
+    @property
+    def boto_session(self):
+        if self._boto_session is None:
+            with self._lock:
+                if self._boto_session is None:
+                    import boto3
+
+                    self._boto_session = boto3.Session()
+
+        return self._boto_session
+
+    @property
+    def sagemaker_session(self):
+        if self._sagemaker_session is None:
+            with self._lock:
+                if self._sagemaker_session is None:
+                    import sagemaker
+
+                    self._sagemaker_session = sagemaker.Session(
+                        boto_session=self.boto_session,
+                        sagemaker_client=self.client("sagemaker"),
+                    )
+
+        return self._sagemaker_session
+
+    @property
+    def role(self) -> str:
+        if self._role is None:
+            with self._lock:
+                if self._role is None:
+                    import sagemaker
+
+                    with span("session.role"):
+                        self._role = sagemaker.get_execution_role(
+                            self.sagemaker_session
+                        )
+
+        return self._role
+
+    @property
+    def packager(self) -> SourcePackager:
+        if self._packager is None:
+            with self._lock:
+                if self._packager is None:
+                    self._packager = SourcePackager(self.client("s3"))
+
+        return self._packager
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        if self._rate_limiter is None:
+            with self._lock:
+                if self._rate_limiter is None:
+                    self._rate_limiter = RateLimiter()
+
+        return self._rate_limiter
+
+    def client(self, service_name: str):
+        try:
+            return self._clients[service_name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if service_name not in self._clients:
+                from botocore.config import Config
+
+                # The throttled client owns the retries, so botocore must not
+                # retry throttled calls again underneath it.
+                config = Config(retries={"max_attempts": 1})
+                self._clients[service_name] = ThrottledClient(
+                    self.boto_session.client(service_name, config=config),
+                    self.rate_limiter,
+                    service_name,
+                )
+
+            return self._clients[service_name]
+
+
+_default_session_pool = None
+_default_session_pool_lock = threading.Lock()
+
+
+def get_default_session_pool() -> SessionPool:
+    global _default_session_pool
+
+    if _default_session_pool is None:
+        with _default_session_pool_lock:
+            if _default_session_pool is None:
+                _default_session_pool = SessionPool()
+
+    return _default_session_pool
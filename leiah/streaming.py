@@ -0,0 +1,384 @@
+import codecs
+import functools
+import os
+import re
+import yaml
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from yaml.constructor import ConstructorError, SafeConstructor
+from yaml.events import (
+    AliasEvent,
+    CollectionEndEvent,
+    CollectionStartEvent,
+    DocumentEndEvent,
+    DocumentStartEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.parser import ParserError
+from yaml.resolver import Resolver
+from yaml.scanner import ScannerError
+
+from leiah.exceptions import DescriptorError
+
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# libyaml leaves a byte order mark out of its marks, while PyYAML counts it as a
+# character.
+SKIPS_BOM = Loader is not yaml.SafeLoader
+
+JOB_SECTIONS = ("training-jobs", "hyperparameter-tuning-jobs")
+
+ITEM = object()
+
+MULTIBYTE_CHARACTER = re.compile(b"[\xc0-\xff]")
+
+SKIPPED_EVENTS = (
+    StreamStartEvent,
+    StreamEndEvent,
+    DocumentStartEvent,
+    DocumentEndEvent,
+)
+
+
+class ModelOutline(object):
+    __slots__ = ("name", "start", "end", "column", "tags", "jobs", "has_matrix")
+
+    def __init__(self, name: str, start: int, column: int) -> None:
+        self.name = name
+        self.start = start
+        self.end = start
+        self.column = column
+        self.tags = set()
+        self.jobs = {section: dict() for section in JOB_SECTIONS}
+        self.has_matrix = False
+
+    def get_jobs(self) -> dict:
+        jobs = dict()
+        for section in JOB_SECTIONS:
+            jobs.update(self.jobs[section])
+
+        return jobs
+
+
+class ByteOffsets(object):
+    __slots__ = ("_indexes", "_extras", "_position", "_extra", "_base")
+
+    def __init__(self) -> None:
+        self._indexes = array("q")
+        self._extras = array("q")
+        self._position = 0
+        self._extra = 0
+        self._base = 0
+
+    def feed(self, data: bytes) -> None:
+        if not self._position and SKIPS_BOM and data.startswith(codecs.BOM_UTF8):
+            self._base = len(codecs.BOM_UTF8)
+            self._position = self._base
+            start = self._base
+            data = data[start:]
+
+        # Only the lead byte of every multibyte UTF-8 character is recorded, with the
+        # number of extra bytes used by the characters up to and including it.
+        for match in MULTIBYTE_CHARACTER.finditer(data):
+            position = self._position + match.start()
+            lead = data[match.start()]
+
+            self._indexes.append(position - self._base - self._extra)
+            self._extra += 1 if lead < 0xE0 else 2 if lead < 0xF0 else 3
+            self._extras.append(self._extra)
+
+        self._position += len(data)
+
+    def get(self, index: int) -> int:
+        count = bisect_left(self._indexes, index)
+        return index + self._base + (self._extras[count - 1] if count else 0)
+
+
+class _OffsetReader(object):
+    def __init__(self, file, offsets: ByteOffsets) -> None:
+        self.name = getattr(file, "name", "<file>")
+        self._file = file
+        self._offsets = offsets
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._offsets.feed(data)
+        return data
+
+
+class DescriptorOutline(object):
+    def __init__(self, content: bytes = None, path=None) -> None:
+        self.models = dict()
+        self.has_aliases = False
+        self.path = path
+
+        # Outlines of files only keep the file's path, and read the fragments of the
+        # models that are loaded.
+        self._content = content
+        self._version = None
+
+    @classmethod
+    def scan(cls, content: bytes) -> "DescriptorOutline":
+        outline = cls(content=content)
+
+        offsets = ByteOffsets()
+        offsets.feed(content)
+        outline._scan_events(yaml.parse(content, Loader=Loader), offsets)
+
+        return outline
+
+    @classmethod
+    def scan_file(cls, path) -> "DescriptorOutline":
+        outline = cls(path=Path(path))
+        outline._version = _get_version(outline.path)
+
+        offsets = ByteOffsets()
+        with open(outline.path, "rb") as f:
+            reader = _OffsetReader(f, offsets)
+            outline._scan_events(yaml.parse(reader, Loader=Loader), offsets)
+
+        return outline
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def entries(self):
+        for name in self.models:
+            yield self.get_entry(name)
+
+    def get_entry(self, name: str) -> tuple:
+        model = self.models[name]
+
+        return name, [
+            (identifier, model.tags | tags)
+            for identifier, tags in model.get_jobs().items()
+        ]
+
+    def get_fragment(self, name: str) -> bytes:
+        model = self.models[name]
+        start, end = model.start, model.end
+
+        if self._content is not None:
+            fragment = self._content[start:end]
+        else:
+            fragment = self._read(start, end)
+
+        # The first line of the fragment starts at the column of the model's value,
+        # so it's indented again to line up with the rest of the block.
+        return b" " * model.column + fragment
+
+    def load_model(self, name: str):
+        try:
+            return yaml.load(self.get_fragment(name), Loader=Loader)
+        except (ScannerError, ParserError) as e:
+            raise DescriptorError(
+                f'Model "{name}" is not a valid descriptor entry. Error: {str(e)}'
+            )
+
+    def _read(self, start: int, end: int) -> bytes:
+        with open(self.path, "rb") as f:
+            if _get_version(self.path, f.fileno()) != self._version:
+                raise DescriptorError(
+                    f'Descriptor "{self.path}" changed after it was scanned'
+                )
+
+            f.seek(start)
+            return f.read(end - start)
+
+    def _scan_events(self, events, offsets: ByteOffsets) -> None:
+        try:
+            self._scan(events)
+        except (ScannerError, ParserError) as e:
+            raise DescriptorError(
+                f"The specified file is not a valid descriptor. Error: {str(e)}"
+            )
+
+        # Marks count characters, so they are turned into byte offsets once the
+        # whole content has been read.
+        for model in self.models.values():
+            model.start = offsets.get(model.start)
+            model.end = offsets.get(model.end)
+
+    def _scan(self, events) -> None:
+        # Every open collection is tracked as [path, is_mapping, key, expecting_key].
+        # Paths that aren't needed for the outline are None.
+        stack = []
+        found_models = False
+
+        for event in events:
+            if isinstance(event, SKIPPED_EVENTS):
+                continue
+
+            if isinstance(event, CollectionEndEvent):
+                self._end(stack.pop()[0], event)
+                continue
+
+            if isinstance(event, AliasEvent) or event.anchor is not None:
+                self.has_aliases = True
+
+            if not stack:
+                if not isinstance(event, MappingStartEvent):
+                    raise DescriptorError(
+                        "The specified file is not a valid descriptor"
+                    )
+
+                path = ()
+            else:
+                frame = stack[-1]
+                parent_path, is_mapping, key, expecting_key = frame
+
+                if expecting_key:
+                    if parent_path is None:
+                        frame[2] = None
+                    elif len(parent_path) in (1, 3):
+                        frame[2] = _resolve(event)
+                    else:
+                        frame[2] = getattr(event, "value", None)
+                    frame[3] = False
+
+                    if isinstance(event, CollectionStartEvent):
+                        stack.append(
+                            [None, isinstance(event, MappingStartEvent), None, True]
+                        )
+
+                    continue
+
+                if is_mapping:
+                    frame[3] = True
+
+                if parent_path is None or (is_mapping and key is None):
+                    path = None
+                elif is_mapping:
+                    path = _get_path(parent_path + (key,))
+                else:
+                    path = _get_path(parent_path + (ITEM,))
+
+            if path == ("models",):
+                found_models = True
+
+            self._start(path, event)
+
+            if isinstance(event, CollectionStartEvent):
+                is_mapping = isinstance(event, MappingStartEvent)
+                stack.append([path, is_mapping, None, is_mapping])
+            else:
+                self._end(path, event)
+
+        if not found_models:
+            raise DescriptorError(
+                'Descriptor file is missing the root element "models".'
+            )
+
+    def _start(self, path, event) -> None:
+        if not path:
+            return
+
+        length = len(path)
+
+        if length == 1:
+            if isinstance(event, ScalarEvent):
+                valid = _resolve(event) == "None"
+            else:
+                valid = not isinstance(event, CollectionStartEvent) or isinstance(
+                    event, MappingStartEvent
+                )
+
+            if not valid:
+                raise DescriptorError("The specified file is not a valid descriptor")
+        elif length == 2:
+            self.models[path[1]] = ModelOutline(
+                path[1], event.start_mark.index, event.start_mark.column
+            )
+        elif length == 5 and path[4] == "matrix":
+            self.models[path[1]].has_matrix = True
+        elif path[2] == "tags" or length > 4:
+            if isinstance(event, ScalarEvent):
+                self._add_tag(path, _resolve(event))
+        elif length == 4 and path[3] is not ITEM:
+            self.models[path[1]].jobs[path[2]][path[3]] = set()
+
+    def _end(self, path, event) -> None:
+        if path is not None and len(path) == 2:
+            self.models[path[1]].end = event.end_mark.index
+
+    def _add_tag(self, path, tag: str) -> None:
+        if path[-1] == "tags" and tag == "None":
+            return
+
+        model = self.models[path[1]]
+        if path[2] == "tags":
+            model.tags.add(tag)
+        else:
+            model.jobs[path[2]][path[3]].add(tag)
+
+
+def _get_version(path: Path, fd: int = None) -> tuple:
+    stat = os.stat(fd) if fd is not None else path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _get_path(path: tuple):
+    # Only the paths needed to outline models, their jobs and their tags are
+    # tracked, everything else is skipped.
+    length = len(path)
+
+    if path[0] != "models":
+        return None
+
+    if length <= 2:
+        return path
+
+    if path[2] == "tags":
+        return path if length == 3 or (length == 4 and path[3] is ITEM) else None
+
+    if path[2] not in JOB_SECTIONS:
+        return None
+
+    if length <= 4:
+        return path
+
+    if length == 5 and path[4] == "matrix":
+        return path
+
+    if path[4] != "tags":
+        return None
+
+    return path if length == 5 or (length == 6 and path[5] is ITEM) else None
+
+
+_resolver = Resolver()
+_constructor = SafeConstructor()
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_plain_scalar(value: str) -> str:
+    tag = _resolver.resolve(ScalarNode, value, (True, False))
+
+    try:
+        return str(_constructor.construct_object(ScalarNode(tag, value)))
+    except ConstructorError:
+        return value
+
+
+def _resolve(event):
+    if not isinstance(event, ScalarEvent):
+        return None
+
+    # Plain scalars can only resolve to something other than a string when their
+    # first character has an implicit resolver.
+    if (
+        not event.style
+        and event.implicit[0]
+        and event.value[:1] in Resolver.yaml_implicit_resolvers
+    ):
+        return _resolve_plain_scalar(event.value)
+
+    return event.value
@@ -0,0 +1,212 @@
+import functools
+import random
+import threading
+import time
+
+from collections import namedtuple
+
+
+ApiLimit = namedtuple(
+    "ApiLimit",
+    ["rate", "burst", "max_concurrency", "min_rate", "backoff"],
+    defaults=[10.0, 10, 10, 0.1, 0.5],
+)
+
+RetryPolicy = namedtuple(
+    "RetryPolicy", ["max_attempts", "base_delay", "max_delay"], defaults=[8, 0.5, 20.0]
+)
+
+THROTTLING_ERRORS = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "SlowDown",
+)
+
+RETRYABLE_ERRORS = THROTTLING_ERRORS + (
+    "ResourceLimitExceeded",
+    "ServiceUnavailable",
+    "RequestTimeout",
+)
+
+DEFAULT_LIMITS = {
+    "sagemaker.create_training_job": ApiLimit(rate=1.0, burst=5, max_concurrency=5),
+    "sagemaker.create_hyper_parameter_tuning_job": ApiLimit(
+        rate=1.0, burst=5, max_concurrency=5
+    ),
+    "sagemaker": ApiLimit(rate=5.0, burst=10, max_concurrency=10),
+}
+
+
+def get_error_code(error: Exception):
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return None
+
+    return response.get("Error", {}).get("Code", None)
+
+
+class AdaptiveLimiter(object):
+    def __init__(self, limit: ApiLimit, clock=time.monotonic) -> None:
+        self.limit = limit
+        self.clock = clock
+        self.rate = float(limit.rate)
+        self.concurrency = float(limit.max_concurrency)
+        self.tokens = float(limit.burst)
+        self.active = 0
+
+        self._updated = clock()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while True:
+                self._refill()
+
+                if self.active >= int(self.concurrency):
+                    self._condition.wait()
+                elif self.tokens < 1.0:
+                    self._condition.wait((1.0 - self.tokens) / self.rate)
+                else:
+                    self.tokens -= 1.0
+                    self.active += 1
+                    return
+
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self.active -= 1
+
+            # Additive increase, multiplicative decrease: every success widens the
+            # window by about one call per round, every throttle halves it.
+            if throttled:
+                self.concurrency = max(1.0, self.concurrency * self.limit.backoff)
+                self.rate = max(self.limit.min_rate, self.rate * self.limit.backoff)
+            else:
+                self.concurrency = min(
+                    float(self.limit.max_concurrency),
+                    self.concurrency + 1.0 / self.concurrency,
+                )
+                self.rate = min(
+                    float(self.limit.rate), self.rate + self.limit.rate / 20.0
+                )
+
+            self._condition.notify_all()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(
+            float(self.limit.burst), self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class RateLimiter(object):
+    def __init__(
+        self,
+        limits: dict = None,
+        default: ApiLimit = ApiLimit(),
+        retry: RetryPolicy = RetryPolicy(),
+        sleep=time.sleep,
+        jitter=random.random,
+    ) -> None:
+        self.limits = DEFAULT_LIMITS if limits is None else limits
+        self.default = default
+        self.retry = retry
+        self.sleep = sleep
+        self.jitter = jitter
+
+        self._limiters = dict()
+        self._counters = dict()
+        self._lock = threading.Lock()
+
+    def get_limit(self, api: str) -> ApiLimit:
+        service = api.partition(".")[0]
+        return self.limits.get(api, self.limits.get(service, self.default))
+
+    def get_limiter(self, api: str) -> AdaptiveLimiter:
+        try:
+            return self._limiters[api]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if api not in self._limiters:
+                self._limiters[api] = AdaptiveLimiter(self.get_limit(api))
+                self._counters[api] = dict.fromkeys(
+                    ("calls", "successes", "failures", "retries", "throttles"), 0
+                )
+
+            return self._limiters[api]
+
+    def get_delay(self, attempt: int) -> float:
+        delay = min(self.retry.max_delay, self.retry.base_delay * 2 ** (attempt - 1))
+        return delay * self.jitter()
+
+    def call(self, api: str, fn, *args, **kwargs):
+        limiter = self.get_limiter(api)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            limiter.acquire()
+            self._count(api, "calls")
+
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                code = get_error_code(e)
+                throttled = code in THROTTLING_ERRORS or code == "ResourceLimitExceeded"
+                limiter.release(throttled=throttled)
+
+                if throttled:
+                    self._count(api, "throttles")
+
+                if code not in RETRYABLE_ERRORS or attempt >= self.retry.max_attempts:
+                    self._count(api, "failures")
+                    raise
+
+                self._count(api, "retries")
+                self.sleep(self.get_delay(attempt))
+            else:
+                limiter.release()
+                self._count(api, "successes")
+                return result
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                api: dict(
+                    self._counters[api],
+                    rate=limiter.rate,
+                    concurrency=limiter.concurrency,
+                )
+                for api, limiter in self._limiters.items()
+            }
+
+    def _count(self, api: str, counter: str) -> None:
+        with self._lock:
+            self._counters[api][counter] += 1
+
+
+class ThrottledClient(object):
+    def __init__(self, client, rate_limiter: RateLimiter, service_name: str) -> None:
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._service_name = service_name
+
+        meta = getattr(client, "meta", None)
+        self._operations = frozenset(getattr(meta, "method_to_api_mapping", None) or ())
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+
+        if name in self._operations:
+            return functools.partial(
+                self._rate_limiter.call, f"{self._service_name}.{name}", attribute
+            )
+
+        return attribute
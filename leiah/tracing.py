@@ -0,0 +1,198 @@
+import contextvars
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+_current_span = contextvars.ContextVar("leiah_current_span", default=None)
+
+
+class Span(object):
+    __slots__ = ("name", "attributes", "parent", "thread_id", "start", "end", "error")
+
+    def __init__(self, name: str, attributes: dict = None, parent=None) -> None:
+        self.name = name
+        self.attributes = attributes or dict()
+        self.parent = parent
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end = None
+        self.error = None
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} {self.duration:.6f}s>"
+
+
+class Hook(object):
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+
+class Tracer(object):
+    def __init__(self, hooks: list = None) -> None:
+        self.hooks = tuple(hooks or ())
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Hook) -> None:
+        with self._lock:
+            self.hooks = self.hooks + (hook,)
+
+    def remove_hook(self, hook: Hook) -> None:
+        with self._lock:
+            self.hooks = tuple(h for h in self.hooks if h is not hook)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        hooks = self.hooks
+        if not hooks:
+            yield None
+            return
+
+        span = Span(name, attributes, parent=_current_span.get())
+        token = _current_span.set(span)
+
+        for hook in hooks:
+            hook.on_start(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = e
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+
+            for hook in hooks:
+                hook.on_end(span)
+
+
+class ChromeTraceExporter(Hook):
+    def __init__(self) -> None:
+        self.events = []
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        arguments = {key: str(value) for key, value in span.attributes.items()}
+        if span.error is not None:
+            arguments["error"] = repr(span.error)
+
+        event = {
+            "name": span.name,
+            "cat": span.name.partition(".")[0],
+            "ph": "X",
+            "ts": span.start * 1e6,
+            "dur": (span.end - span.start) * 1e6,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": arguments,
+        }
+
+        with self._lock:
+            self.events.append(event)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+
+class TimingSummary(Hook):
+    def __init__(self) -> None:
+        self.timings = dict()
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        duration = span.end - span.start
+
+        with self._lock:
+            timing = self.timings.get(span.name)
+            if timing is None:
+                self.timings[span.name] = [1, duration, duration, duration]
+            else:
+                timing[0] += 1
+                timing[1] += duration
+                timing[2] = min(timing[2], duration)
+                timing[3] = max(timing[3], duration)
+
+    def rows(self) -> list:
+        with self._lock:
+            rows = [
+                {
+                    "name": name,
+                    "count": count,
+                    "total": total,
+                    "mean": total / count,
+                    "min": minimum,
+                    "max": maximum,
+                }
+                for name, (count, total, minimum, maximum) in self.timings.items()
+            ]
+
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def report(self) -> str:
+        rows = self.rows()
+        width = max([len("span")] + [len(row["name"]) for row in rows])
+
+        lines = [
+            f"{'span':<{width}} {'count':>8} {'total':>10} {'mean':>10} {'max':>10}"
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['name']:<{width}} {row['count']:>8} "
+                f"{row['total']:>10.4f} {row['mean']:>10.4f} {row['max']:>10.4f}"
+            )
+
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
+
+
+_default_tracer = Tracer()
+
+
+def get_default_tracer() -> Tracer:
+    return _default_tracer
+
+
+def span(name: str, **attributes):
+    return _default_tracer.span(name, **attributes)
+
+
+def add_hook(hook: Hook) -> None:
+    _default_tracer.add_hook(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    _default_tracer.remove_hook(hook)
+
+
+@contextmanager
+def tracing(*hooks):
+    for hook in hooks:
+        add_hook(hook)
+
+    try:
+        yield hooks[0] if len(hooks) == 1 else hooks
+    finally:
+        for hook in hooks:
+            remove_hook(hook)
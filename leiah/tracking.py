@@ -0,0 +1,208 @@
+import os
+import time
+
+from collections import namedtuple
+
+from leiah.session import SessionPool, get_default_session_pool
+
+
+JobHandle = namedtuple("JobHandle", ["kind", "name"])
+
+TRAINING = "training"
+TUNING = "tuning"
+
+TERMINAL_STATUSES = ("Completed", "Failed", "Stopped")
+
+TRAINING_LOG_GROUP = "/aws/sagemaker/TrainingJobs"
+
+
+class JobTracker(object):
+    def __init__(
+        self,
+        session: SessionPool = None,
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        sleep=time.sleep,
+    ) -> None:
+        self.session = session or get_default_session_pool()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.sleep = sleep
+
+        self.statuses = dict()
+        self.interval = min_interval
+
+        self._handles = dict()
+        self._tracked_after = dict()
+        self._log_start_time = None
+        self._log_event_ids = set()
+
+    def track(self, handles) -> None:
+        for handle in handles:
+            handle = getattr(handle, "result", handle)
+            if isinstance(handle, JobHandle):
+                self._handles[handle.name] = handle
+                self.statuses.setdefault(handle.name, None)
+
+                # Give the clocks some slack, since creation times are set by AWS.
+                self._tracked_after.setdefault(handle.name, time.time() - 300)
+
+        if self._log_start_time is None and self._tracked_after:
+            self._log_start_time = int(min(self._tracked_after.values()) * 1000)
+
+    @property
+    def handles(self) -> list:
+        return list(self._handles.values())
+
+    @property
+    def running(self) -> list:
+        return [
+            handle
+            for handle in self._handles.values()
+            if self.statuses[handle.name] not in TERMINAL_STATUSES
+        ]
+
+    @property
+    def done(self) -> bool:
+        return not self.running
+
+    def poll(self) -> dict:
+        running = self.running
+        changed = dict()
+
+        names = [handle.name for handle in running if handle.kind == TRAINING]
+        if names:
+            changed.update(self._update(names, self._list_training_jobs))
+
+        names = [handle.name for handle in running if handle.kind == TUNING]
+        if names:
+            changed.update(self._update(names, self._list_tuning_jobs))
+
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+        return changed
+
+    def wait(self, timeout: float = None, callback=None) -> dict:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = self.poll()
+            if callback is not None and changed:
+                callback(changed)
+
+            if self.done:
+                return dict(self.statuses)
+
+            if deadline is not None and time.monotonic() + self.interval > deadline:
+                return dict(self.statuses)
+
+            self.sleep(self.interval)
+
+    def tail(self, follow: bool = True):
+        while True:
+            names = [
+                handle.name for handle in self.running if handle.kind == TRAINING
+            ]
+
+            # Statuses are refreshed before reading the logs, so the last lines of a
+            # job that just finished are still returned.
+            self.poll()
+
+            for event in self._filter_log_events(names):
+                yield event
+
+            if not follow or not names:
+                return
+
+            self.sleep(self.interval)
+
+    def _get_created_after(self, names: list) -> float:
+        # Only jobs that are still running bound the listing, so the number of pages
+        # depends on the jobs in flight rather than on everything tracked so far.
+        return min(self._tracked_after[name] for name in names)
+
+    def _update(self, names: list, list_jobs) -> dict:
+        changed = dict()
+        wanted = set(names)
+
+        for name, status in list_jobs(
+            os.path.commonprefix(names), self._get_created_after(names)
+        ):
+            if name in wanted and self.statuses[name] != status:
+                self.statuses[name] = status
+                changed[name] = status
+
+        return changed
+
+    def _paginate(self, operation, key: str, **kwargs):
+        while True:
+            response = operation(**kwargs)
+            for item in response.get(key, []):
+                yield item
+
+            if not response.get("NextToken"):
+                return
+
+            kwargs["NextToken"] = response["NextToken"]
+
+    def _list_training_jobs(self, prefix: str, created_after: float):
+        client = self.session.client("sagemaker")
+
+        for summary in self._paginate(
+            client.list_training_jobs,
+            "TrainingJobSummaries",
+            NameContains=prefix,
+            CreationTimeAfter=created_after,
+            MaxResults=100,
+        ):
+            yield summary["TrainingJobName"], summary["TrainingJobStatus"]
+
+    def _list_tuning_jobs(self, prefix: str, created_after: float):
+        client = self.session.client("sagemaker")
+
+        for summary in self._paginate(
+            client.list_hyper_parameter_tuning_jobs,
+            "HyperParameterTuningJobSummaries",
+            NameContains=prefix,
+            CreationTimeAfter=created_after,
+            MaxResults=100,
+        ):
+            yield (
+                summary["HyperParameterTuningJobName"],
+                summary["HyperParameterTuningJobStatus"],
+            )
+
+    def _filter_log_events(self, names: list):
+        if not names:
+            return
+
+        client = self.session.client("logs")
+        wanted = set(names)
+
+        start_time = int(self._get_created_after(names) * 1000)
+        if start_time > self._log_start_time:
+            self._log_start_time = start_time
+            self._log_event_ids = set()
+
+        for event in self._paginate(
+            client.filter_log_events,
+            "events",
+            logGroupName=TRAINING_LOG_GROUP,
+            logStreamNamePrefix=os.path.commonprefix(names),
+            startTime=self._log_start_time,
+        ):
+            name = event["logStreamName"].split("/", 1)[0]
+            if name not in wanted or event["eventId"] in self._log_event_ids:
+                continue
+
+            if event["timestamp"] > self._log_start_time:
+                self._log_start_time = event["timestamp"]
+                self._log_event_ids = set()
+
+            self._log_event_ids.add(event["eventId"])
+            yield name, event["message"]
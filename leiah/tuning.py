@@ -0,0 +1,251 @@
+import math
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from leiah.exceptions import DescriptorError
+from leiah.metrics import MetricEngine
+from leiah.search import SearchSpace, iterate_samples
+
+
+LOCAL_STRATEGIES = ("Random", "Hyperband")
+
+
+class Trial(object):
+    def __init__(self, number: int, hyperparameters: dict) -> None:
+        self.number = number
+        self.hyperparameters = hyperparameters
+        self.objectives = dict()
+        self.runs = []
+
+    @property
+    def rung(self):
+        return max(self.objectives) if self.objectives else None
+
+    @property
+    def objective(self):
+        return self.objectives[self.rung] if self.objectives else None
+
+    def __repr__(self) -> str:
+        return (
+            f"<Trial {self.number} {self.hyperparameters} "
+            f"objective={self.objective} rung={self.rung}>"
+        )
+
+
+class LocalTuner(object):
+    def __init__(
+        self,
+        backend,
+        estimator,
+        hyperparameter_ranges,
+        objective_type: str = "Minimize",
+        max_jobs: int = 1,
+        max_parallel_jobs: int = 1,
+        strategy: str = "Random",
+        resource: str = "epochs",
+        min_resource: int = 1,
+        max_resource: int = None,
+        reduction_factor: int = 3,
+        seed: int = None,
+        **kwargs,
+    ) -> None:
+        if strategy not in LOCAL_STRATEGIES:
+            raise DescriptorError(
+                f'Tuning strategy "{strategy}" is not supported by the local backend'
+            )
+
+        if objective_type not in ("Minimize", "Maximize"):
+            raise DescriptorError(f'Objective type "{objective_type}" is not supported')
+
+        if not isinstance(hyperparameter_ranges, SearchSpace):
+            hyperparameter_ranges = SearchSpace.compile(hyperparameter_ranges)
+
+        self.backend = backend
+        self.estimator = estimator
+        self.search_space = hyperparameter_ranges
+        self.objective_type = objective_type
+        self.max_jobs = max_jobs
+        self.max_parallel_jobs = max_parallel_jobs
+        self.strategy = strategy
+        self.resource = resource
+        self.reduction_factor = reduction_factor
+        self.seed = seed
+
+        self.objective_metric_name = estimator.get_tuner_objective_metric_name()
+        self.metric_engine = MetricEngine(estimator.get_tuner_metric_definitions())
+
+        if self.objective_metric_name not in self.metric_engine.names:
+            raise DescriptorError(
+                f'Objective metric "{self.objective_metric_name}" has no definition'
+            )
+        self.budgets = self._get_budgets(min_resource, max_resource)
+
+        self.trials = []
+        self.error = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def best_trial(self) -> Trial:
+        completed = self._rank(
+            [trial for trial in self.trials if trial.objective is not None]
+        )
+
+        if not completed:
+            return None
+
+        top_rung = max(trial.rung for trial in completed)
+        return next(trial for trial in completed if trial.rung == top_rung)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run_in_thread, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def wait(self, timeout: float = None) -> Trial:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        if self.error is not None:
+            raise self.error
+
+        return self.best_trial
+
+    def run(self) -> Trial:
+        print(f"Tuning estimator {self.estimator.get_tuning_job_name()} locally...")
+
+        samples = iterate_samples(self.search_space.sample(self.max_jobs, self.seed))
+        self.trials = [
+            Trial(number, hyperparameters)
+            for number, hyperparameters in enumerate(samples)
+        ]
+
+        pending = list(self.trials)
+        promoted = [set() for _ in self.budgets]
+        completed = [[] for _ in self.budgets]
+        running = dict()
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel_jobs) as executor:
+            while True:
+                while len(running) < self.max_parallel_jobs:
+                    assignment = self._next(pending, promoted, completed)
+                    if assignment is None:
+                        break
+
+                    trial, rung = assignment
+                    future = executor.submit(self._evaluate, trial, rung)
+                    running[future] = (trial, rung)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    trial, rung = running.pop(future)
+                    future.result()
+                    completed[rung].append(trial)
+
+        return self.best_trial
+
+    def _run_in_thread(self) -> None:
+        try:
+            self.run()
+        except Exception as e:
+            self.error = e
+
+    def _next(self, pending: list, promoted: list, completed: list):
+        for rung in reversed(range(len(self.budgets) - 1)):
+            # The top 1/reduction_factor of the rung is promoted, but trials that
+            # failed to report an objective are never candidates.
+            promotable = len(completed[rung]) // self.reduction_factor
+            ranked = self._rank(
+                [
+                    trial
+                    for trial in completed[rung]
+                    if trial.objectives.get(rung) is not None
+                ],
+                rung=rung,
+            )
+
+            for trial in ranked[:promotable]:
+                if trial.number not in promoted[rung]:
+                    promoted[rung].add(trial.number)
+                    return trial, rung + 1
+
+        if pending:
+            return pending.pop(0), 0
+
+        return None
+
+    def _rank(self, trials: list, rung: int = None) -> list:
+        def key(trial):
+            objective = (
+                trial.objectives.get(rung) if rung is not None else trial.objective
+            )
+
+            if objective is None:
+                return (1, 0.0)
+
+            return (0, objective if self.objective_type == "Minimize" else -objective)
+
+        return sorted(trials, key=key)
+
+    def _evaluate(self, trial: Trial, rung: int) -> None:
+        budget = self.budgets[rung]
+
+        hyperparameters = dict(self.estimator.hyperparameters)
+        hyperparameters.update(trial.hyperparameters)
+        if self.strategy == "Hyperband":
+            hyperparameters[self.resource] = budget
+
+        run = self.backend.fit(
+            self.estimator,
+            hyperparameters=hyperparameters,
+            name=f"{self.estimator.get_tuning_job_name()}-{trial.number:03d}-{rung}",
+        )
+
+        with self._lock:
+            trial.runs.append(run)
+
+        exit_code = run.wait()
+        objective = self._read_objective(run) if exit_code == 0 else None
+
+        with self._lock:
+            trial.objectives[rung] = objective
+
+    def _read_objective(self, run):
+        series = self.metric_engine.process_file(run.log_file_path)
+        values = series[self.objective_metric_name]
+
+        return float(values[-1]) if len(values) else None
+
+    def _get_budgets(self, min_resource, max_resource) -> list:
+        if self.strategy != "Hyperband":
+            return [max_resource]
+
+        if max_resource is None:
+            max_resource = self.estimator.hyperparameters.get(self.resource, None)
+
+        if max_resource is None:
+            raise DescriptorError(
+                f'The "max_resource" attribute is required to tune "{self.resource}"'
+            )
+
+        if min_resource <= 0 or min_resource > max_resource:
+            raise DescriptorError(
+                'The "min_resource" attribute must be between 1 and "max_resource"'
+            )
+
+        if self.reduction_factor < 2:
+            raise DescriptorError('The "reduction_factor" attribute must be at least 2')
+
+        rungs = int(
+            math.floor(math.log(max_resource / min_resource, self.reduction_factor))
+        )
+        budgets = [
+            int(min_resource * self.reduction_factor ** rung) for rung in range(rungs)
+        ]
+
+        return budgets + [int(max_resource)]
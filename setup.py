@@ -7,7 +7,7 @@ setup(
     url="https://github.com/svpino/leiah",
     author="Santiago L. Valdarrama",
     author_email="svpino@gmail.com",
-    packages=find_packages(exclude=["test"]),
-    install_requires=["PyYAML==5.3.1", "sagemaker==2.15.0"],
+    packages=find_packages(exclude=["test", "benchmarks"]),
+    install_requires=["numpy", "PyYAML==5.3.1", "sagemaker==2.15.0"],
     zip_safe=False,
 )
@@ -1,4 +1,5 @@
 from leiah.estimators import Estimator
+from leiah.tracking import TRAINING, TUNING, JobHandle
 
 
 class DummyEstimator(Estimator):
@@ -12,12 +13,18 @@ class DummyEstimator(Estimator):
             **kwargs
         )
 
+        self.fitted = False
         self.tuned = False
         self.kwargs = None
 
+    def fit(self):
+        self.fitted = True
+        return JobHandle(TRAINING, self.get_training_job_name())
+
     def tune(self, **kwargs):
         self.tuned = True
         self.kwargs = kwargs
+        return JobHandle(TUNING, self.get_tuning_job_name())
 
     def get_sagemaker_estimator(self):
         return None
@@ -98,3 +105,11 @@ class ExperimentEstimator(Estimator):
 
     def tune(self, **kwargs):
         self.tuned = True
+
+
+class FailingEstimator(DummyEstimator):
+    def fit(self):
+        raise RuntimeError("Unable to fit estimator")
+
+    def tune(self, **kwargs):
+        raise RuntimeError("Unable to tune estimator")
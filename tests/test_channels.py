@@ -0,0 +1,82 @@
+import pytest
+
+from sagemaker.inputs import TrainingInput
+from leiah.channels import Channel, get_channel, get_channels, get_training_input
+from leiah.exceptions import DescriptorError
+
+
+def test_get_channels_uri():
+    channels = get_channels({"train": "s3://bucket/train"})
+
+    assert channels == {"train": Channel(uri="s3://bucket/train")}
+    assert get_training_input(channels["train"]) == "s3://bucket/train"
+
+
+def test_get_channels_none():
+    assert get_channels(None) is None
+
+
+def test_get_channel_settings():
+    channel = get_channel(
+        "train",
+        {
+            "uri": "s3://bucket/train",
+            "input_mode": "FastFile",
+            "distribution": "ShardedByS3Key",
+            "compression": "Gzip",
+        },
+    )
+
+    training_input = get_training_input(channel)
+
+    assert isinstance(training_input, TrainingInput)
+    assert training_input.config == {
+        "DataSource": {
+            "S3DataSource": {
+                "S3DataType": "S3Prefix",
+                "S3Uri": "s3://bucket/train",
+                "S3DataDistributionType": "ShardedByS3Key",
+            }
+        },
+        "CompressionType": "Gzip",
+        "InputMode": "FastFile",
+    }
+
+
+def test_get_channel_pipe_mode():
+    channel = get_channel(
+        "train",
+        {
+            "uri": "s3://bucket/train",
+            "input_mode": "Pipe",
+            "record_wrapping": "RecordIO",
+            "content_type": "application/x-recordio",
+        },
+    )
+
+    config = get_training_input(channel).config
+
+    assert config["InputMode"] == "Pipe"
+    assert config["RecordWrapperType"] == "RecordIO"
+    assert config["ContentType"] == "application/x-recordio"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"input_mode": "File"},
+        {"uri": "s3://bucket/train", "input_mode": "Stream"},
+        {"uri": "s3://bucket/train", "distribution": "Sharded"},
+        {"uri": "s3://bucket/train", "compression": "Zip"},
+        {"uri": "s3://bucket/train", "shuffle": True},
+        {"uri": "file:///data/train", "input_mode": "FastFile"},
+    ],
+)
+def test_get_channel_invalid(value):
+    with pytest.raises(DescriptorError):
+        get_channel("train", value)
+
+
+def test_get_channels_invalid():
+    with pytest.raises(DescriptorError):
+        get_channels(["s3://bucket/train"])
@@ -0,0 +1,201 @@
+import os
+import pytest
+import tempfile
+import threading
+import time
+
+from leiah.daemon import Daemon, DaemonClient, main
+from leiah.exceptions import DaemonError
+
+
+DESCRIPTOR = """
+models:
+  model-01:
+    estimator: tests.resources.estimators.DummyEstimator
+    training-jobs:
+      1: {}
+      2: {}
+    hyperparameter-tuning-jobs:
+      hpt-01: {}
+  model-02:
+    estimator: tests.resources.estimators.FailingEstimator
+    training-jobs:
+      1: {}
+"""
+
+
+class FakeTracker(object):
+    def __init__(self):
+        self.statuses = dict()
+        self.polls = 0
+
+    def track(self, handles):
+        for handle in handles:
+            self.statuses[handle.result.name] = None
+
+    @property
+    def running(self):
+        return [name for name, status in self.statuses.items() if status is None]
+
+    def poll(self):
+        self.polls += 1
+        for name in self.running:
+            self.statuses[name] = "InProgress"
+
+
+@pytest.fixture
+def descriptor_file_path(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_text(DESCRIPTOR)
+    return descriptor_file_path
+
+
+@pytest.fixture
+def daemon():
+    # Unix socket paths are limited to about 100 characters, so pytest's tmp_path
+    # can be too long.
+    directory = tempfile.mkdtemp()
+    daemon = Daemon(os.path.join(directory, "daemon.sock"), tracker=FakeTracker())
+
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    client = DaemonClient(daemon.socket_path, timeout=5)
+    deadline = time.monotonic() + 5
+    while not daemon.socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    yield daemon
+
+    if thread.is_alive():
+        client.shutdown()
+        thread.join(timeout=5)
+
+    os.rmdir(directory)
+
+
+@pytest.fixture
+def client(daemon):
+    return DaemonClient(daemon.socket_path, timeout=5)
+
+
+def test_ping(client):
+    assert client.ping()["pid"] == os.getpid()
+
+
+def test_list(client, descriptor_file_path):
+    assert client.list(descriptor_file_path) == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.hpt-01",
+        "model-02.1",
+    ]
+    assert client.list(descriptor_file_path, ["model-01.*"]) == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.hpt-01",
+    ]
+
+
+def test_run(client, daemon, descriptor_file_path):
+    result = client.run(descriptor_file_path, ["model-01", "model-02"], max_workers=2)
+
+    submissions = {
+        submission["name"]: submission for submission in result["submissions"]
+    }
+    assert submissions["model-01.1"]["job_name"] == "training-model-01-1"
+    assert submissions["model-01.hpt-01"]["job_name"] == "tuning-model-01-hpt-01"
+    assert submissions["model-02.1"]["error"] == "Unable to fit estimator"
+
+    assert client.status() == {
+        "training-model-01-1": "InProgress",
+        "training-model-01-2": "InProgress",
+        "tuning-model-01-hpt-01": "InProgress",
+    }
+    assert daemon.tracker.polls == 1
+
+
+def test_run_isolates_errors(client, daemon, descriptor_file_path):
+    result = client.run(descriptor_file_path, ["model-02", "model-01"])
+
+    assert [submission["name"] for submission in result["submissions"]] == [
+        "model-02.1",
+        "model-01.1",
+        "model-01.2",
+        "model-01.hpt-01",
+    ]
+    assert result["submissions"][0]["error"] == "Unable to fit estimator"
+    assert sorted(daemon.tracker.statuses) == [
+        "training-model-01-1",
+        "training-model-01-2",
+        "tuning-model-01-hpt-01",
+    ]
+
+
+def test_descriptor_kept_warm(daemon, descriptor_file_path):
+    descriptor = daemon.get_descriptor(descriptor_file_path)
+    assert daemon.get_descriptor(descriptor_file_path) is descriptor
+
+    descriptor_file_path.write_text(DESCRIPTOR.replace("hpt-01", "hpt-02"))
+    os.utime(descriptor_file_path, ns=(0, time.time_ns() + 10 ** 9))
+
+    reloaded = daemon.get_descriptor(descriptor_file_path)
+    assert reloaded is not descriptor
+    assert "hpt-02" in reloaded.models["model-01"].jobs
+
+
+@pytest.mark.parametrize("pattern", ["descriptors", "descriptors/*.yaml"])
+def test_descriptor_directory_reloaded(daemon, tmp_path, pattern):
+    directory = tmp_path / "descriptors"
+    directory.mkdir()
+    (directory / "model-01.yaml").write_text(DESCRIPTOR)
+
+    descriptor = daemon.get_descriptor(tmp_path / pattern)
+    assert daemon.get_descriptor(tmp_path / pattern) is descriptor
+
+    directory_stat = directory.stat()
+    (directory / "model-01.yaml").write_text(DESCRIPTOR.replace("hpt-01", "hpt-02"))
+    os.utime(directory / "model-01.yaml", ns=(0, time.time_ns() + 10 ** 9))
+    assert directory.stat().st_mtime_ns == directory_stat.st_mtime_ns
+
+    reloaded = daemon.get_descriptor(tmp_path / pattern)
+    assert reloaded is not descriptor
+    assert "hpt-02" in reloaded.models["model-01"].jobs
+
+
+@pytest.mark.parametrize(
+    "command, arguments",
+    [
+        ("unexistent", {}),
+        ("list", {"descriptor": "unexistent.yaml"}),
+        ("list", {"unexistent": "argument"}),
+    ],
+)
+def test_invalid_requests(client, command, arguments):
+    with pytest.raises(DaemonError):
+        client.request(command, **arguments)
+
+
+def test_invalid_selector(client, descriptor_file_path):
+    with pytest.raises(DaemonError):
+        client.list(descriptor_file_path, ["model-03"])
+
+
+def test_daemon_already_listening(daemon):
+    with pytest.raises(DaemonError):
+        Daemon(daemon.socket_path).start()
+
+
+def test_client_without_daemon(tmp_path):
+    with pytest.raises(DaemonError):
+        DaemonClient(tmp_path / "daemon.sock").ping()
+
+
+def test_main(daemon, descriptor_file_path, capsys):
+    socket_path = str(daemon.socket_path)
+
+    assert main(["--socket", socket_path, "run", str(descriptor_file_path)]) == 1
+    assert "Unable to fit estimator" in capsys.readouterr().out
+
+    arguments = ["--socket", socket_path, "run", str(descriptor_file_path), "model-01"]
+    assert main(arguments) == 0
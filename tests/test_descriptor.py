@@ -1,4 +1,7 @@
 import pytest
+import subprocess
+import sys
+
 from pathlib import Path
 
 from leiah.descriptor import (
@@ -159,10 +162,54 @@ def test_estimator_missing_properties():
                         }
                     }
                 }
-            }
+            },
+            eager=True,
         )
 
 
+def test_estimator_missing_properties_lazy():
+    descriptor = Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "hyperparameter-tuning-jobs": {
+                        "1": {"estimator": "leiah.estimators.TensorFlowEstimator"}
+                    }
+                }
+            }
+        }
+    )
+
+    assert len(descriptor.models["model-01"].jobs) == 1
+
+    with pytest.raises(DescriptorError):
+        descriptor.models["model-01"].jobs["1"]
+
+
+def test_jobs_lazy_materialization(descriptor):
+    jobs = descriptor.models["model-01"].jobs
+
+    assert not any(jobs.is_materialized(identifier) for identifier in jobs)
+
+    descriptor._get_jobs(jobs="model-01.2")
+
+    assert jobs.is_materialized("2")
+    assert not jobs.is_materialized("1")
+    assert not jobs.is_materialized("hpt-01")
+
+
+def test_jobs_eager_materialization(descriptor_base_path):
+    descriptor = Descriptor(descriptor_base_path / "descriptor-01.yaml", eager=True)
+    jobs = descriptor.models["model-01"].jobs
+
+    assert all(jobs.is_materialized(identifier) for identifier in jobs)
+
+
+def test_jobs_materialized_once(descriptor):
+    jobs = descriptor.models["model-01"].jobs
+    assert jobs["1"] is jobs["1"]
+
+
 def test_get_jobs_single_experiment(descriptor):
     jobs = descriptor._get_jobs(jobs="model-01.2")
 
@@ -224,3 +271,127 @@ def test_run_experiment_process(descriptor):
     assert estimator.tuned is False
     descriptor.run(jobs="model-01.hpt-01")
     assert estimator.tuned is True
+
+
+def test_descriptor_cache(descriptor_base_path, tmp_path, monkeypatch):
+    descriptor_file_path = descriptor_base_path / "descriptor-01.yaml"
+    Descriptor(descriptor_file_path, cache_dir=tmp_path)
+
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed for a cached descriptor")
+
+    monkeypatch.setattr("leiah.descriptor.yaml.load", fail)
+    descriptor = Descriptor(descriptor_file_path, cache_dir=tmp_path)
+
+    assert len(descriptor.models) == 3
+    assert len(descriptor.models["model-01"].jobs) == 3
+
+
+def test_descriptor_cache_invalidated_on_change(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    cache_dir = tmp_path / "cache"
+
+    descriptor_file_path.write_text("models:\n  model-01: {}\n")
+    assert list(Descriptor(descriptor_file_path, cache_dir=cache_dir).models) == [
+        "model-01"
+    ]
+
+    descriptor_file_path.write_text("models:\n  model-02: {}\n")
+    assert list(Descriptor(descriptor_file_path, cache_dir=cache_dir).models) == [
+        "model-02"
+    ]
+
+
+def test_descriptor_cache_skips_invalid_descriptor(descriptor_base_path, tmp_path):
+    with pytest.raises(DescriptorError):
+        Descriptor(
+            descriptor_base_path / "invalid-descriptor-2.yaml", cache_dir=tmp_path
+        )
+
+    assert not tmp_path.exists() or not list(tmp_path.iterdir())
+
+
+def test_descriptor_does_not_import_sagemaker(descriptor_base_path):
+    descriptor_file_path = str(descriptor_base_path / "descriptor-01.yaml")
+    script = (
+        "import sys\n"
+        "from leiah.descriptor import Descriptor\n"
+        f"descriptor = Descriptor({descriptor_file_path!r})\n"
+        "jobs = descriptor._get_jobs(['model-01.*', 'model-02'])\n"
+        "assert jobs\n"
+        "assert 'sagemaker' not in sys.modules, 'sagemaker'\n"
+        "assert 'boto3' not in sys.modules, 'boto3'\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def descriptor_directory(tmp_path):
+    (tmp_path / "team-b").mkdir()
+    (tmp_path / "team-a.yaml").write_text(
+        "models:\n"
+        "  model-01:\n"
+        "    estimator: tests.resources.estimators.DummyEstimator\n"
+        "    training-jobs:\n"
+        "      1: {}\n"
+    )
+    (tmp_path / "team-b" / "models.yml").write_text(
+        "models:\n"
+        "  model-02:\n"
+        "    estimator: tests.resources.estimators.DummyEstimator\n"
+        "    training-jobs:\n"
+        "      1: {}\n"
+        "  model-03:\n"
+        "    estimator: tests.resources.estimators.DummyEstimator\n"
+    )
+    (tmp_path / "README.md").write_text("Not a descriptor")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "load_workers, streaming", [(1, False), (2, False), (2, True)]
+)
+def test_descriptor_directory(descriptor_directory, load_workers, streaming):
+    descriptor = Descriptor(
+        descriptor_directory, load_workers=load_workers, streaming=streaming
+    )
+
+    assert list(descriptor.models) == ["model-01", "model-02", "model-03"]
+    assert descriptor.index.names == ["model-01.1", "model-02.1"]
+
+    summary = descriptor.run(jobs="model-02.1")
+    assert summary[0].result.name == "training-model-02-1"
+
+
+def test_descriptor_glob(descriptor_directory):
+    descriptor = Descriptor(str(descriptor_directory / "**" / "*.yml"))
+    assert list(descriptor.models) == ["model-02", "model-03"]
+
+
+def test_descriptor_directory_duplicate_models(descriptor_directory):
+    (descriptor_directory / "team-c.yaml").write_text(
+        "models:\n  model-02:\n    estimator: tests.resources.estimators.DummyEstimator"
+    )
+
+    with pytest.raises(DescriptorError, match="model-02"):
+        Descriptor(descriptor_directory, load_workers=2)
+
+
+def test_descriptor_directory_invalid_file(descriptor_directory):
+    (descriptor_directory / "team-c.yaml").write_text("invalid:\n  descriptor: 1")
+
+    with pytest.raises(DescriptorError):
+        Descriptor(descriptor_directory, load_workers=2)
+
+
+@pytest.mark.parametrize("pattern", ["", "*.yaml"])
+def test_descriptor_directory_without_files(tmp_path, pattern):
+    with pytest.raises(DescriptorError):
+        Descriptor(str(tmp_path / pattern) if pattern else tmp_path)
@@ -1,6 +1,64 @@
 from sagemaker.parameter import ContinuousParameter
+from sagemaker.tuner import WarmStartTypes
 from tests.resources.estimators import DummyEstimator
-from leiah.estimators import Estimator
+from leiah.channels import get_channels
+from leiah.estimators import Estimator, TensorFlowEstimator
+from leiah.tracking import TRAINING, JobHandle
+
+
+class CountingEstimator(DummyEstimator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.builds = 0
+
+    def get_sagemaker_estimator(self):
+        self.builds += 1
+        return object()
+
+
+def test_estimator_sagemaker_estimator_memoized():
+    estimator = CountingEstimator(model="hello", job="world")
+
+    hyperparameter_ranges = {"sample": ContinuousParameter(1.0, 2.0)}
+    tuner = estimator.get_sagemaker_tuner(hyperparameter_ranges=hyperparameter_ranges)
+
+    assert tuner.estimator is estimator.sagemaker_estimator
+    assert estimator.builds == 1
+
+
+def test_estimator_sagemaker_estimator_rebuilt_on_source_change(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "train.py").write_text("print('training')\n")
+
+    estimator = CountingEstimator(model="hello", job="world")
+    estimator.source_dir = str(source_dir)
+
+    sagemaker_estimator = estimator.sagemaker_estimator
+    assert estimator.sagemaker_estimator is sagemaker_estimator
+    assert estimator.builds == 1
+
+    (source_dir / "train.py").write_text("print('changed training')\n")
+
+    assert estimator.sagemaker_estimator is not sagemaker_estimator
+    assert estimator.builds == 2
+
+
+class FakeSageMakerEstimator(object):
+    def fit(self, inputs, wait=True):
+        self.latest_training_job = type("Job", (), {"job_name": "training-job-001"})
+
+
+class FakeEstimator(Estimator):
+    channels = None
+
+    def get_sagemaker_estimator(self):
+        return FakeSageMakerEstimator()
+
+
+def test_estimator_fit_returns_handle():
+    estimator = FakeEstimator(model="hello", job="world")
+    assert estimator.fit() == JobHandle(TRAINING, "training-job-001")
 
 
 def test_estimator_get_training_job_name():
@@ -56,3 +114,72 @@ def test_estimator_metric_definitions():
     tuner = estimator.get_sagemaker_tuner(hyperparameter_ranges=hyperparameter_ranges)
 
     assert tuner.metric_definitions == estimator.get_tuner_metric_definitions()
+
+
+def test_tensorflow_estimator_slots():
+    estimator = TensorFlowEstimator(
+        model="hello",
+        job="world",
+        entry_point="train.py",
+        train_instance_type="ml.p2.xlarge",
+        source_dir="src",
+        model_uri=None,
+        model_dir="/opt/ml/model",
+        code_location="s3://bucket/code",
+        output_path="s3://bucket/output",
+    )
+
+    assert not hasattr(estimator, "__dict__")
+
+
+def test_estimator_get_sagemaker_tuner_strategy():
+    estimator = DummyEstimator(model="hello", job="world", hyperparameters=dict())
+
+    hyperparameter_ranges = {"sample": ContinuousParameter(1.0, 2.0)}
+    tuner = estimator.get_sagemaker_tuner(
+        hyperparameter_ranges=hyperparameter_ranges,
+        strategy="Random",
+        early_stopping_type="Auto",
+    )
+
+    assert tuner.strategy == "Random"
+    assert tuner.early_stopping_type == "Auto"
+    assert tuner.warm_start_config is None
+
+
+def test_estimator_get_sagemaker_tuner_default_strategy():
+    estimator = DummyEstimator(model="hello", job="world", hyperparameters=dict())
+
+    hyperparameter_ranges = {"sample": ContinuousParameter(1.0, 2.0)}
+    tuner = estimator.get_sagemaker_tuner(hyperparameter_ranges=hyperparameter_ranges)
+
+    assert tuner.strategy == "Bayesian"
+    assert tuner.early_stopping_type == "Off"
+
+
+def test_estimator_get_sagemaker_tuner_warm_start():
+    estimator = DummyEstimator(model="hello", job="world", hyperparameters=dict())
+
+    hyperparameter_ranges = {"sample": ContinuousParameter(1.0, 2.0)}
+    tuner = estimator.get_sagemaker_tuner(
+        hyperparameter_ranges=hyperparameter_ranges,
+        warm_start={"type": "TransferLearning", "parents": ["tuning-job-001"]},
+    )
+
+    assert tuner.warm_start_config.type == WarmStartTypes.TRANSFER_LEARNING
+    assert tuner.warm_start_config.parents == {"tuning-job-001"}
+
+
+def test_estimator_fit_training_inputs():
+    estimator = FakeEstimator(model="hello", job="world")
+    estimator.channels = get_channels(
+        {
+            "train": {"uri": "s3://bucket/train", "input_mode": "FastFile"},
+            "validation": "s3://bucket/validation",
+        }
+    )
+
+    inputs = estimator.get_inputs()
+
+    assert inputs["train"].config["InputMode"] == "FastFile"
+    assert inputs["validation"] == "s3://bucket/validation"
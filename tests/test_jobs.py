@@ -6,7 +6,8 @@ from sagemaker.parameter import (
     IntegerParameter,
 )
 from leiah.descriptor import Model
-from leiah.jobs import HyperparameterTuningJob
+from leiah import jobs
+from leiah.jobs import HyperparameterTuningJob, TrainingJob, resolve_estimator
 from leiah.exceptions import DescriptorError
 
 
@@ -64,6 +65,53 @@ def test_job_invalid_estimator(estimator):
         )
 
 
+def test_resolve_estimator_cached(monkeypatch):
+    jobs.clear_estimator_cache()
+
+    calls = []
+    import_module = jobs.importlib.import_module
+
+    def counting_import_module(name):
+        calls.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(jobs.importlib, "import_module", counting_import_module)
+
+    model = Model("model1", data={})
+    for identifier in range(3):
+        TrainingJob(
+            model=model,
+            identifier=str(identifier),
+            data={"estimator": "tests.resources.estimators.DummyEstimator"},
+        )
+
+    assert calls == ["tests.resources.estimators"]
+
+
+def test_resolve_estimator_negative_result_cached(monkeypatch):
+    jobs.clear_estimator_cache()
+
+    calls = []
+    import_module = jobs.importlib.import_module
+
+    def counting_import_module(name):
+        calls.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(jobs.importlib, "import_module", counting_import_module)
+
+    for _ in range(3):
+        with pytest.raises(DescriptorError):
+            resolve_estimator("invalid.module.Estimator")
+
+    assert calls == ["invalid.module"]
+
+
+def test_resolve_estimator_signature():
+    resolved = resolve_estimator("leiah.estimators.TensorFlowEstimator")
+    assert "entry_point" in resolved.signature.parameters
+
+
 def test__get_categorical_parameter(hyperparameter_tuning_job):
     parameter = hyperparameter_tuning_job._get_categorical_parameter(
         data={"type": "categorical", "values": [1.0, 2.0]}
@@ -227,3 +275,107 @@ def test_hyperparameter_tuning_job_hyperparameter_ranges(hyperparameter_tuning_j
     assert len(
         hyperparameter_tuning_job.estimator.kwargs["hyperparameter_ranges"]
     ) == len(hyperparameter_tuning_job.hyperparameter_ranges)
+
+
+def test_hyperparameter_tuning_job_does_not_mutate_data(model):
+    data = {
+        "estimator": "tests.resources.estimators.DummyEstimator",
+        "hyperparameter_ranges": {
+            "property1": {"type": "categorical", "values": [1.0, 2.0]},
+        },
+    }
+
+    job = HyperparameterTuningJob(model=model, identifier="job1", data=data)
+    job.run()
+
+    assert data["hyperparameter_ranges"] == {
+        "property1": {"type": "categorical", "values": [1.0, 2.0]},
+    }
+
+
+def test_job_layered_properties():
+    model = Model(
+        "model1",
+        data={
+            "estimator": "tests.resources.estimators.DummyEstimator",
+            "role": "model-role",
+            "hyperparameters": {"epochs": 10, "batch_size": 32},
+        },
+    )
+    job = TrainingJob(
+        model=model,
+        identifier="job1",
+        data={"role": "job-role", "hyperparameters": {"epochs": 20}},
+    )
+
+    assert job.properties["role"] == "job-role"
+    assert job.properties["estimator"] == "tests.resources.estimators.DummyEstimator"
+    assert dict(job.hyperparameters) == {"epochs": 20, "batch_size": 32}
+
+    with pytest.raises(TypeError):
+        job.properties["role"] = "other-role"
+
+    model.data["role"] = "new-model-role"
+    del job.data["role"]
+    assert job.properties["role"] == "new-model-role"
+
+
+def test_job_slots(hyperparameter_tuning_job):
+    assert not hasattr(hyperparameter_tuning_job, "__dict__")
+    assert not hasattr(hyperparameter_tuning_job.model, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        {"strategy": "Invalid"},
+        {"early_stopping_type": "Invalid"},
+        {"strategy": "Hyperband", "early_stopping_type": "Auto"},
+        {
+            "strategy": "Grid",
+            "hyperparameter_ranges": {
+                "property1": {"type": "continuous", "min_value": 1, "max_value": 2}
+            },
+        },
+        {"warm_start": {"type": "TransferLearning"}},
+        {"warm_start": {"parents": "model.job"}},
+        {"warm_start": {"parents": [f"model.{i}" for i in range(6)]}},
+        {"warm_start": {"parents": ["model.job"], "type": "Invalid"}},
+    ],
+)
+def test_hyperparameter_tuning_job_invalid_tuning_attributes(model, attributes):
+    data = {"estimator": "tests.resources.estimators.DummyEstimator"}
+    data.update(attributes)
+
+    with pytest.raises(DescriptorError):
+        HyperparameterTuningJob(model=model, identifier="job1", data=data)
+
+
+def test_hyperparameter_tuning_job_strategy(model):
+    job = HyperparameterTuningJob(
+        model=model,
+        identifier="job1",
+        data={
+            "estimator": "tests.resources.estimators.DummyEstimator",
+            "strategy": "Random",
+            "early_stopping_type": "Auto",
+        },
+    )
+
+    job.run()
+    assert job.estimator.kwargs["strategy"] == "Random"
+    assert job.estimator.kwargs["early_stopping_type"] == "Auto"
+
+
+def test_hyperparameter_tuning_job_unresolved_warm_start(model):
+    job = HyperparameterTuningJob(
+        model=model,
+        identifier="job1",
+        data={
+            "estimator": "tests.resources.estimators.DummyEstimator",
+            "warm_start": {"parents": ["model1.job0"]},
+        },
+    )
+
+    with pytest.raises(DescriptorError):
+        job.run()
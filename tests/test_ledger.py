@@ -0,0 +1,341 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from botocore.exceptions import NoRegionError
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+from leiah.ledger import Ledger
+from leiah.session import SessionPool
+
+
+class FakeSageMakerClient(object):
+    def __init__(self, tuning_jobs=()):
+        self.tuning_jobs = list(tuning_jobs)
+        self.calls = []
+
+    def list_hyper_parameter_tuning_jobs(self, **kwargs):
+        self.calls.append(kwargs)
+        return {
+            "HyperParameterTuningJobSummaries": [
+                {"HyperParameterTuningJobName": name}
+                for name in self.tuning_jobs
+                if kwargs["NameContains"] in name
+            ]
+        }
+
+
+class FakeBotoSession(object):
+    def __init__(self, client):
+        self._client = client
+
+    def client(self, service_name, config=None):
+        return self._client
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = Ledger(tmp_path / "ledger.sqlite")
+    yield ledger
+    ledger.close()
+
+
+def create_descriptor(ledger, epochs=10):
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "hyperparameters": {"epochs": epochs},
+                    "training-jobs": {
+                        "1": {"hyperparameters": {"batch_size": 32}},
+                        "2": {"hyperparameters": {"batch_size": 64}},
+                    },
+                }
+            }
+        },
+        ledger=ledger,
+    )
+
+
+def test_ledger_record(ledger):
+    assert ledger.get("model.1") is None
+
+    ledger.record("model.1", "abc")
+    ledger.record("model.1", "def")
+
+    assert ledger.get("model.1") == "def"
+
+
+def test_ledger_persistence(tmp_path):
+    ledger = Ledger(tmp_path / "ledger.sqlite")
+    ledger.record("model.1", "abc")
+    ledger.close()
+
+    assert Ledger(tmp_path / "ledger.sqlite").get("model.1") == "abc"
+
+
+def test_fingerprint_stable(ledger):
+    first = create_descriptor(ledger).models["model-01"].jobs
+    second = create_descriptor(ledger).models["model-01"].jobs
+
+    assert first["1"].fingerprint() == second["1"].fingerprint()
+    assert first["1"].fingerprint() != first["2"].fingerprint()
+
+
+def test_fingerprint_ignores_description_and_siblings():
+    def fingerprint(job_data):
+        descriptor = Descriptor(
+            {
+                "models": {
+                    "model-01": {
+                        "estimator": "tests.resources.estimators.DummyEstimator",
+                        "training-jobs": job_data,
+                    }
+                }
+            }
+        )
+        return descriptor.models["model-01"].jobs["1"].fingerprint()
+
+    assert fingerprint({"1": {}}) == fingerprint(
+        {"1": {"description": "Readability counts."}, "2": {}}
+    )
+
+
+def test_incremental_run(ledger):
+    summary = create_descriptor(ledger).run(incremental=True)
+    assert len(summary) == 2
+
+    summary = create_descriptor(ledger).run(incremental=True)
+    assert len(summary) == 0
+    assert [job.name for job in summary.skipped] == ["model-01.1", "model-01.2"]
+
+    summary = create_descriptor(ledger, epochs=20).run(incremental=True)
+    assert [submission.name for submission in summary] == ["model-01.1", "model-01.2"]
+
+
+def test_non_incremental_run_resubmits(ledger):
+    create_descriptor(ledger).run()
+
+    summary = create_descriptor(ledger).run()
+    assert len(summary) == 2
+    assert len(summary.skipped) == 0
+
+
+def test_incremental_run_failed_jobs_resubmitted(ledger):
+    descriptor = Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.FailingEstimator",
+                    "training-jobs": {"1": {}},
+                }
+            }
+        },
+        ledger=ledger,
+    )
+
+    descriptor.run(max_workers=1, incremental=True)
+    assert ledger.get("model-01.1") is None
+
+
+def test_ledger_job_name(ledger):
+    ledger.record("model.1", "abc", job_name="training-model-1-001")
+
+    assert ledger.get_job_name("model.1") == "training-model-1-001"
+    assert ledger.get_job_name("model.2") is None
+
+
+def test_ledger_adds_job_name_column(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "ledger.sqlite"))
+    connection.execute(
+        "CREATE TABLE submissions (name TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+        "submitted_at REAL NOT NULL)"
+    )
+    connection.execute("INSERT INTO submissions VALUES ('model.1', 'abc', 0)")
+    connection.commit()
+    connection.close()
+
+    ledger = Ledger(tmp_path / "ledger.sqlite")
+    assert ledger.get("model.1") == "abc"
+    assert ledger.get_job_name("model.1") is None
+
+
+def create_warm_start_descriptor(ledger, parents, sagemaker_client=None):
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "hyperparameter-tuning-jobs": {
+                        "hpt-01": {},
+                        "hpt-02": {
+                            "strategy": "Random",
+                            "warm_start": {
+                                "type": "TransferLearning",
+                                "parents": parents,
+                            },
+                        },
+                    },
+                }
+            }
+        },
+        ledger=ledger,
+        session=SessionPool(
+            role="role",
+            boto_session=FakeBotoSession(sagemaker_client or FakeSageMakerClient()),
+        ),
+    )
+
+
+def test_warm_start(ledger):
+    descriptor = create_warm_start_descriptor(ledger, ["model-01.hpt-01"])
+
+    descriptor.run(jobs="model-01.hpt-01")
+    assert ledger.get_job_name("model-01.hpt-01") == "tuning-model-01-hpt-01"
+
+    descriptor.run(jobs="model-01.hpt-02")
+
+    estimator = descriptor.models["model-01"].jobs["hpt-02"].estimator
+    assert estimator.kwargs["warm_start"] == {
+        "type": "TransferLearning",
+        "parents": ["tuning-model-01-hpt-01"],
+    }
+
+
+@pytest.mark.parametrize("parent", ["model-01.hpt-01", "model-01.unexistent"])
+def test_warm_start_unresolved_parent(ledger, parent):
+    descriptor = create_warm_start_descriptor(ledger, [parent])
+
+    with pytest.raises(DescriptorError):
+        descriptor.run(jobs="model-01.hpt-02")
+
+
+def test_warm_start_without_ledger(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    descriptor = create_warm_start_descriptor(None, ["model-01.hpt-01"])
+
+    descriptor.run(jobs="model-01.hpt-01")
+    descriptor.run(jobs="model-01.hpt-02")
+
+    estimator = descriptor.models["model-01"].jobs["hpt-02"].estimator
+    assert estimator.kwargs["warm_start"]["parents"] == ["tuning-model-01-hpt-01"]
+    assert not (tmp_path / ".leiah").exists()
+
+
+def test_warm_start_parent_from_sagemaker():
+    sagemaker_client = FakeSageMakerClient(
+        [
+            "tuning-m-hpt-01-extra-201016-1000",
+            "tuning-m-hpt-01-201016-0930",
+            "tuning-m-hpt-01-201015-1200",
+        ]
+    )
+    descriptor = Descriptor(
+        {
+            "models": {
+                "m": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "hyperparameter-tuning-jobs": {
+                        "hpt-01": {},
+                        "hpt-02": {"warm_start": {"parents": ["m.hpt-01"]}},
+                    },
+                }
+            }
+        },
+        session=SessionPool(
+            role="role", boto_session=FakeBotoSession(sagemaker_client)
+        ),
+    )
+
+    descriptor.run(jobs="m.hpt-02")
+
+    assert sagemaker_client.calls[0]["NameContains"] == "tuning-m-hpt-01"
+    assert sagemaker_client.calls[0]["SortOrder"] == "Descending"
+
+    estimator = descriptor.models["m"].jobs["hpt-02"].estimator
+    assert estimator.kwargs["warm_start"]["parents"] == ["tuning-m-hpt-01-201016-0930"]
+
+
+def test_warm_start_trimmed_parent_not_resolved():
+    sagemaker_client = FakeSageMakerClient(["tuning-model-01-hpt--201016-0930"])
+    descriptor = create_warm_start_descriptor(
+        None, ["model-01.hpt-01"], sagemaker_client=sagemaker_client
+    )
+
+    with pytest.raises(DescriptorError):
+        descriptor.run(jobs="model-01.hpt-02")
+
+    assert sagemaker_client.calls == []
+
+
+class UnconfiguredSageMakerClient(FakeSageMakerClient):
+    def list_hyper_parameter_tuning_jobs(self, **kwargs):
+        raise NoRegionError()
+
+
+def create_staged_descriptor(sagemaker_client, parents=("m.p",)):
+    return Descriptor(
+        {
+            "models": {
+                "m": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {"t": {}},
+                    "hyperparameter-tuning-jobs": {
+                        "p": {},
+                        "h": {"warm_start": {"parents": list(parents)}},
+                    },
+                }
+            }
+        },
+        session=SessionPool(
+            role="role", boto_session=FakeBotoSession(sagemaker_client)
+        ),
+    )
+
+
+def test_warm_start_parent_submitted_first():
+    sagemaker_client = UnconfiguredSageMakerClient()
+    descriptor = create_staged_descriptor(sagemaker_client)
+
+    summary = descriptor.run(jobs=["m.h", "m.t", "m.p"], max_workers=4)
+
+    assert [submission.name for submission in summary] == ["m.h", "m.t", "m.p"]
+    assert all(submission.succeeded for submission in summary)
+
+    estimator = descriptor.models["m"].jobs["h"].estimator
+    assert estimator.kwargs["warm_start"]["parents"] == ["tuning-m-p"]
+
+
+def test_warm_start_parent_submitted_first_async():
+    descriptor = create_staged_descriptor(UnconfiguredSageMakerClient())
+
+    summary = asyncio.run(descriptor.arun(jobs="m"))
+
+    assert len(summary.succeeded) == 3
+
+    estimator = descriptor.models["m"].jobs["h"].estimator
+    assert estimator.kwargs["warm_start"]["parents"] == ["tuning-m-p"]
+
+
+def test_warm_start_errors_isolated():
+    descriptor = create_staged_descriptor(UnconfiguredSageMakerClient())
+
+    summary = descriptor.run(jobs=["m.t", "m.h"], max_workers=4)
+
+    assert [submission.name for submission in summary.succeeded] == ["m.t"]
+    (failed,) = summary.failed
+    assert failed.name == "m.h"
+    assert isinstance(failed.error, DescriptorError)
+
+
+def test_warm_start_training_parent():
+    descriptor = create_staged_descriptor(FakeSageMakerClient(), parents=["m.t"])
+
+    summary = descriptor.run(jobs="m", max_workers=4)
+
+    (failed,) = summary.failed
+    assert failed.name == "m.h"
+    assert "not a hyperparameter tuning job" in str(failed.error)
@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+from leiah.local import LocalBackend
+
+
+TRAINING_SCRIPT = """
+import argparse
+import json
+import os
+import sys
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--epochs", type=int)
+parser.add_argument("--learning_rate", type=float)
+parser.add_argument("--model_dir")
+args = parser.parse_args()
+
+with open(os.path.join(os.environ["SM_CHANNEL_TRAIN"], "data.txt")) as f:
+    data = f.read().strip()
+
+print(json.dumps({"epochs": args.epochs, "learning_rate": args.learning_rate}))
+print(f"data: {data}")
+print(f"loss: {1.0 / args.epochs}")
+
+with open(os.path.join(os.environ["SM_MODEL_DIR"], "model.txt"), "w") as f:
+    f.write("model")
+
+sys.exit(0 if args.epochs > 0 else 3)
+"""
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "train.py").write_text(TRAINING_SCRIPT)
+
+    return source_dir
+
+
+@pytest.fixture
+def train_dir(tmp_path):
+    train_dir = tmp_path / "train"
+    train_dir.mkdir()
+    (train_dir / "data.txt").write_text("sample")
+
+    return train_dir
+
+
+@pytest.fixture
+def backend(tmp_path, train_dir):
+    with LocalBackend(
+        max_workers=2,
+        work_dir=tmp_path / "runs",
+        channels={"s3://bucket/train": train_dir},
+    ) as backend:
+        yield backend
+
+
+def create_descriptor(source_dir, backend=None, channels=None):
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "leiah.estimators.TensorFlowEstimator",
+                    "entry_point": "train.py",
+                    "source_dir": str(source_dir),
+                    "train_instance_type": "ml.m5.large",
+                    "model_uri": None,
+                    "model_dir": "s3://bucket/model",
+                    "code_location": "s3://bucket/code",
+                    "output_path": "s3://bucket/output",
+                    "channels": channels or {"train": "s3://bucket/train"},
+                    "hyperparameters": {"learning_rate": 0.01},
+                    "training-jobs": {
+                        "1": {"hyperparameters": {"epochs": 2}},
+                        "2": {"hyperparameters": {"epochs": 4}},
+                        "3": {"hyperparameters": {"epochs": -1}},
+                    },
+                }
+            }
+        },
+        backend=backend,
+    )
+
+
+def test_local_run(source_dir, backend):
+    descriptor = create_descriptor(source_dir, backend=backend)
+    summary = descriptor.run(jobs="model-01")
+
+    runs = [submission.result for submission in summary]
+    assert [run.wait() for run in runs] == [0, 0, 3]
+
+    assert json.loads(runs[0].log.splitlines()[0]) == {
+        "epochs": 2,
+        "learning_rate": 0.01,
+    }
+    assert "data: sample" in runs[1].log
+    assert "loss: 0.25" in runs[1].log
+    assert (runs[0].model_dir / "model.txt").exists()
+    assert runs[2].succeeded is False
+
+
+def test_local_run_per_run_backend(source_dir, backend):
+    descriptor = create_descriptor(source_dir)
+    descriptor.run(jobs="model-01.1", backend=backend)
+
+    (run,) = backend.wait()
+    assert run.exit_code == 0
+    assert run.name == "training-model-01-1"
+
+
+def test_local_run_channel_settings(source_dir, backend):
+    channels = {
+        "train": {
+            "uri": "s3://bucket/train",
+            "input_mode": "FastFile",
+            "distribution": "ShardedByS3Key",
+        }
+    }
+    descriptor = create_descriptor(source_dir, channels=channels)
+    descriptor.run(jobs="model-01.1", backend=backend)
+
+    (run,) = backend.wait()
+    assert run.exit_code == 0
+    assert "data: sample" in run.log
+
+
+def test_local_channel_paths(tmp_path, backend, train_dir):
+    assert backend.get_channel_path("train", "s3://bucket/train") == str(train_dir)
+    assert backend.get_channel_path("test", "file:///data/test") == "/data/test"
+    assert backend.get_channel_path("test", "/data/test") == "/data/test"
+
+    with pytest.raises(DescriptorError):
+        backend.get_channel_path("test", "s3://bucket/test")
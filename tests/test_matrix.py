@@ -0,0 +1,177 @@
+import pytest
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+from leiah.matrix import JobMatrix
+
+
+@pytest.fixture
+def matrix():
+    return JobMatrix(
+        "sweep",
+        {
+            "description": "Sweep",
+            "hyperparameters": {"epochs": 10, "lr": 0.1},
+            "matrix": {"lr": ["1e-3", 0.01], "bs": [32, 64, 128], "aug": [True]},
+        },
+    )
+
+
+@pytest.fixture
+def descriptor():
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {
+                        "1": {},
+                        "sweep": {
+                            "tags": ["sweep"],
+                            "hyperparameters": {"epochs": 10},
+                            "matrix": {"lr": [0.1, 0.01], "bs": [32, 64]},
+                        },
+                    },
+                }
+            }
+        }
+    )
+
+
+def test_matrix_identifiers(matrix):
+    assert len(matrix) == 6
+    assert list(matrix)[:2] == [
+        "sweep[lr=1e-3,bs=32,aug=true]",
+        "sweep[lr=1e-3,bs=64,aug=true]",
+    ]
+    assert list(matrix)[-1] == "sweep[lr=0.01,bs=128,aug=true]"
+
+
+@pytest.mark.parametrize(
+    "identifier, combination",
+    [
+        ("sweep[lr=0.01,bs=64,aug=true]", (0.01, 64, True)),
+        ("sweep[lr=1e-3,bs=128,aug=true]", ("1e-3", 128, True)),
+        ("sweep[lr=0.02,bs=64,aug=true]", None),
+        ("sweep[bs=64,lr=0.01,aug=true]", None),
+        ("sweep[lr=0.01,bs=64]", None),
+        ("other[lr=0.01,bs=64,aug=true]", None),
+    ],
+)
+def test_matrix_combination(matrix, identifier, combination):
+    assert matrix.get_combination(identifier) == combination
+
+
+def test_matrix_data(matrix):
+    data = matrix.get_data((0.01, 64, True))
+
+    assert "matrix" not in data
+    assert data["description"] == "Sweep"
+    assert data["hyperparameters"] == {"epochs": 10, "lr": 0.01, "bs": 64, "aug": True}
+
+
+@pytest.mark.parametrize(
+    "value", [None, [], {}, {"lr": 0.1}, {"lr": []}, {"lr": [0.1, 0.1]}]
+)
+def test_matrix_invalid(value):
+    with pytest.raises(DescriptorError):
+        JobMatrix("sweep", {"matrix": value})
+
+
+def test_descriptor_matrix_jobs(descriptor):
+    jobs = descriptor.models["model-01"].jobs
+
+    assert list(jobs) == [
+        "1",
+        "sweep[lr=0.1,bs=32]",
+        "sweep[lr=0.1,bs=64]",
+        "sweep[lr=0.01,bs=32]",
+        "sweep[lr=0.01,bs=64]",
+    ]
+    assert len(jobs) == 5
+    assert "sweep[lr=0.01,bs=64]" in jobs
+    assert "sweep" not in jobs
+    assert not jobs.is_materialized("sweep[lr=0.01,bs=64]")
+
+
+def test_descriptor_matrix_selection(descriptor):
+    jobs = descriptor._get_jobs("model-01.sweep[lr=0.01,bs=64]")
+
+    assert [job.name for job in jobs] == ["model-01.sweep[lr=0.01,bs=64]"]
+    assert dict(jobs[0].hyperparameters) == {"epochs": 10, "lr": 0.01, "bs": 64}
+    assert jobs[0].estimator.job.startswith("sweep-")
+
+    model_jobs = descriptor.models["model-01"].jobs
+    assert not model_jobs.is_materialized("sweep[lr=0.1,bs=32]")
+
+    assert len(descriptor._get_jobs("model-01.sweep[[]lr=0.1,*")) == 2
+    assert len(descriptor._get_jobs("tag:sweep")) == 4
+
+
+def test_descriptor_matrix_base_selection(descriptor):
+    jobs = descriptor._get_jobs("model-01.sweep")
+
+    assert [job.name for job in jobs] == [
+        "model-01.sweep[lr=0.1,bs=32]",
+        "model-01.sweep[lr=0.1,bs=64]",
+        "model-01.sweep[lr=0.01,bs=32]",
+        "model-01.sweep[lr=0.01,bs=64]",
+    ]
+
+
+@pytest.mark.parametrize(
+    "selector, names",
+    [
+        ("model-01.sweep[lr=0.1]", ["sweep[lr=0.1,bs=32]", "sweep[lr=0.1,bs=64]"]),
+        ("model-01.sweep[bs=64]", ["sweep[lr=0.1,bs=64]", "sweep[lr=0.01,bs=64]"]),
+        ("model-01.sweep[bs=64,lr=0.01]", ["sweep[lr=0.01,bs=64]"]),
+    ],
+)
+def test_descriptor_matrix_partial_selection(descriptor, selector, names):
+    jobs = descriptor._get_jobs(selector)
+
+    assert [job.name for job in jobs] == [f"model-01.{name}" for name in names]
+
+    model_jobs = descriptor.models["model-01"].jobs
+    assert not model_jobs.is_materialized("sweep[lr=0.01,bs=32]")
+
+
+@pytest.mark.parametrize(
+    "selector", ["model-01.swe", "model-01.sweep[lr=0.5]", "model-01.sweep[lr]"]
+)
+def test_descriptor_matrix_selection_not_found(descriptor, selector):
+    with pytest.raises(DescriptorError):
+        descriptor._get_jobs(selector)
+
+
+def test_descriptor_matrix_run(descriptor):
+    summary = descriptor.run(jobs="re:model-01\\.sweep\\[lr=0\\.1,.*")
+
+    assert len(summary) == 2
+    assert len({submission.result.name for submission in summary}) == 2
+
+
+def test_descriptor_matrix_streaming(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_text(
+        "models:\n"
+        "  model-01:\n"
+        "    estimator: tests.resources.estimators.DummyEstimator\n"
+        "    training-jobs:\n"
+        "      sweep:\n"
+        "        matrix:\n"
+        "          lr: [0.1, 0.01]\n"
+        "  model-02:\n"
+        "    estimator: tests.resources.estimators.DummyEstimator\n"
+        "    training-jobs:\n"
+        "      1: {}\n"
+    )
+
+    descriptor = Descriptor(descriptor_file_path, streaming=True)
+
+    assert descriptor.index.names == [
+        "model-01.sweep[lr=0.01]",
+        "model-01.sweep[lr=0.1]",
+        "model-02.1",
+    ]
+    assert not descriptor.models.is_materialized("model-02")
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from leiah.exceptions import DescriptorError
+from leiah.metrics import MetricEngine
+
+
+LOG = [
+    "Epoch 1/2",
+    "100/100 - 3s - loss: 0.9000 - accuracy: 0.5000 - val_loss: 0.8000 "
+    "- val_accuracy: 0.5500",
+    "Epoch 2/2",
+    "100/100 - 3s - loss: 0.7000 - accuracy: 0.6500 - val_loss: 0.6000 "
+    "- val_accuracy: 0.7000",
+]
+
+
+@pytest.fixture
+def engine():
+    return MetricEngine(
+        [
+            {"Name": "loss", "Regex": " loss: ([0-9\\.]+)"},
+            {"Name": "accuracy", "Regex": " accuracy: ([0-9\\.]+)"},
+            {"Name": "val_loss", "Regex": " val_loss: ([0-9\\.]+)"},
+            {"Name": "val_accuracy", "Regex": " val_accuracy: ([0-9\\.]+)"},
+        ]
+    )
+
+
+def test_process_lines(engine):
+    series = engine.process_lines(LOG)
+
+    assert set(series) == {"loss", "accuracy", "val_loss", "val_accuracy"}
+    assert np.array_equal(series["loss"], [0.9, 0.7])
+    assert np.array_equal(series["accuracy"], [0.5, 0.65])
+    assert np.array_equal(series["val_loss"], [0.8, 0.6])
+    assert np.array_equal(series["val_accuracy"], [0.55, 0.7])
+    assert series["loss"].dtype == np.float64
+
+
+def test_process_file_small_chunks(engine, tmp_path):
+    log_file_path = tmp_path / "output.log"
+    log_file_path.write_text("\n".join(LOG * 100))
+
+    series = engine.process_file(log_file_path, chunk_size=7)
+
+    assert len(series["val_loss"]) == 200
+    assert np.array_equal(series["val_loss"][-2:], [0.8, 0.6])
+
+
+def test_stream_partial_lines(engine):
+    stream = engine.stream()
+    stream.feed(" loss: 0.")
+    assert len(stream.series["loss"]) == 0
+
+    stream.feed("25\n loss: 0.5")
+    assert np.array_equal(stream.series["loss"], [0.25])
+
+    assert np.array_equal(stream.close()["loss"], [0.25, 0.5])
+
+
+def test_invalid_values_ignored(engine):
+    series = engine.process_lines([" loss: . loss: 0.1"])
+    assert np.array_equal(series["loss"], [0.1])
+
+
+def test_optional_group_not_matched():
+    engine = MetricEngine([{"Name": "loss", "Regex": "loss: ([0-9.]+)?"}])
+
+    series = engine.process_lines(["loss: nan", "loss: 0.5"])
+    assert np.array_equal(series["loss"], [0.5])
+
+
+@pytest.mark.parametrize(
+    "definitions",
+    [
+        [{"Name": "loss"}],
+        [{"Name": "loss", "Regex": "loss: [0-9]+"}],
+        [{"Name": "loss", "Regex": "loss: ([0-9]+"}],
+        [{"Name": "loss", "Regex": "(loss): ([0-9]+) \\1"}],
+        [{"Name": "loss", "Regex": "(?P<n>loss): ([0-9]+) (?P=n)"}],
+        [{"Name": "loss", "Regex": "(?u)loss: ([0-9]+)"}],
+    ],
+)
+def test_invalid_definitions(definitions):
+    with pytest.raises(DescriptorError):
+        MetricEngine(definitions)
+
+
+def test_common_prefix_with_quantifiers():
+    engine = MetricEngine(
+        [
+            {"Name": "loss", "Regex": "lo+ss: ([0-9]+)"},
+            {"Name": "lr", "Regex": "lr: ([0-9]+)"},
+        ]
+    )
+
+    series = engine.process_lines(["looss: 1 lr: 2 lss: 3 loss: 4"])
+
+    assert np.array_equal(series["loss"], [1, 4])
+    assert np.array_equal(series["lr"], [2])
+
+
+def test_top_level_alternation():
+    engine = MetricEngine(
+        [
+            {"Name": "loss", "Regex": " loss: ([0-9.]+)| cost: ([0-9.]+)"},
+            {"Name": "accuracy", "Regex": " acc: ([0-9.]+)"},
+        ]
+    )
+
+    series = engine.process_lines([" loss: 0.5 acc: 0.9", " cost: 0.4 acc: 0.8"])
+
+    assert np.array_equal(series["loss"], [0.5, 0.4])
+    assert np.array_equal(series["accuracy"], [0.9, 0.8])
+
+
+def test_global_flags():
+    engine = MetricEngine(
+        [
+            {"Name": "loss", "Regex": "(?i) loss: ([0-9.]+)"},
+            {"Name": "lr", "Regex": " lr: ([0-9.]+)"},
+        ]
+    )
+
+    series = engine.process_lines([" LOSS: 0.5 lr: 0.1 LR: 0.2"])
+
+    assert np.array_equal(series["loss"], [0.5])
+    assert np.array_equal(series["lr"], [0.1])
+
+
+def test_no_definitions():
+    assert MetricEngine([]).process_lines(["loss: 1"]) == {}
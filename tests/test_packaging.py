@@ -0,0 +1,184 @@
+import tarfile
+
+import pytest
+
+from botocore.exceptions import ClientError
+
+from leiah.estimators import TensorFlowEstimator
+from leiah import packaging
+from leiah.descriptor import Descriptor
+from leiah.packaging import (
+    SourcePackager,
+    get_source_digest,
+    hash_source_dir,
+    parse_s3_uri,
+)
+from leiah.session import SessionPool
+
+
+class LocalS3(object):
+    def __init__(self, directory):
+        self.directory = directory
+        self.uploads = []
+
+    def head_object(self, Bucket, Key):
+        if not (self.directory / Bucket / Key).exists():
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+        return {}
+
+    def upload_file(self, Filename, Bucket, Key):
+        self.uploads.append((Bucket, Key))
+
+        destination = self.directory / Bucket / Key
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(open(Filename, "rb").read())
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source_dir = tmp_path / "src"
+    (source_dir / "package").mkdir(parents=True)
+    (source_dir / "train.py").write_text("print('training')\n")
+    (source_dir / "package" / "module.py").write_text("VALUE = 1\n")
+    (source_dir / "__pycache__").mkdir()
+    (source_dir / "__pycache__" / "train.cpython-37.pyc").write_bytes(b"\0")
+
+    return source_dir
+
+
+@pytest.fixture
+def s3(tmp_path):
+    return LocalS3(tmp_path / "s3")
+
+
+def test_hash_source_dir(source_dir):
+    digest = hash_source_dir(source_dir)
+    assert digest == hash_source_dir(source_dir)
+
+    (source_dir / "__pycache__" / "module.cpython-37.pyc").write_bytes(b"\1")
+    assert digest == hash_source_dir(source_dir)
+
+    (source_dir / "train.py").write_text("print('changed')\n")
+    assert digest != hash_source_dir(source_dir)
+
+
+def test_source_digest_cached(source_dir, monkeypatch):
+    packaging.clear_source_digests()
+
+    hashes = []
+    monkeypatch.setattr(
+        packaging,
+        "hash_source_dir",
+        lambda path: hashes.append(path) or hash_source_dir(path),
+    )
+
+    digest = get_source_digest(source_dir)
+    assert get_source_digest(source_dir / ".." / "src") == digest
+    assert SourcePackager(None).get_digest(source_dir) == digest
+    assert len(hashes) == 1
+
+    (source_dir / "train.py").write_text("print('changed training')\n")
+    assert get_source_digest(source_dir) != digest
+    assert len(hashes) == 2
+
+
+def test_fingerprint_source_digest_shared(source_dir, monkeypatch):
+    packaging.clear_source_digests()
+
+    hashes = []
+    monkeypatch.setattr(
+        packaging,
+        "hash_source_dir",
+        lambda path: hashes.append(path) or hash_source_dir(path),
+    )
+
+    descriptor = Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "leiah.estimators.TensorFlowEstimator",
+                    "entry_point": "train.py",
+                    "source_dir": str(source_dir),
+                    "train_instance_type": "ml.m5.large",
+                    "model_uri": None,
+                    "model_dir": "s3://bucket/model",
+                    "code_location": "s3://bucket/code",
+                    "output_path": "s3://bucket/output",
+                    "training-jobs": {
+                        str(i): {"hyperparameters": {"seed": i}} for i in range(20)
+                    },
+                }
+            }
+        }
+    )
+
+    fingerprints = {job.fingerprint() for job in descriptor._get_jobs("model-01")}
+
+    assert len(fingerprints) == 20
+    assert len(hashes) == 1
+
+
+def test_parse_s3_uri():
+    assert parse_s3_uri("s3://bucket/a/b/") == ("bucket", "a/b")
+    assert parse_s3_uri("s3://bucket") == ("bucket", "")
+
+    with pytest.raises(ValueError):
+        parse_s3_uri("/local/path")
+
+
+def test_upload_once(source_dir, s3):
+    packager = SourcePackager(s3)
+
+    uris = {packager.upload(source_dir, "s3://bucket/code") for _ in range(50)}
+
+    digest = hash_source_dir(source_dir)
+    assert uris == {f"s3://bucket/code/source/{digest}/sourcedir.tar.gz"}
+    assert s3.uploads == [("bucket", f"code/source/{digest}/sourcedir.tar.gz")]
+
+    with tarfile.open(s3.directory / "bucket" / s3.uploads[0][1]) as tarball:
+        assert sorted(tarball.getnames()) == ["package/module.py", "train.py"]
+
+
+def test_upload_skips_existing_object(source_dir, s3):
+    SourcePackager(s3).upload(source_dir, "s3://bucket/code")
+    SourcePackager(s3).upload(source_dir, "s3://bucket/code")
+
+    assert len(s3.uploads) == 1
+
+
+def test_upload_after_change(source_dir, s3):
+    packager = SourcePackager(s3)
+
+    first = packager.upload(source_dir, "s3://bucket/code")
+    (source_dir / "train.py").write_text("print('changed')\n")
+    second = packager.upload(source_dir, "s3://bucket/code")
+
+    assert first != second
+    assert len(s3.uploads) == 2
+
+
+def test_estimator_source_dir(source_dir, s3):
+    pool = SessionPool(role="role-name", packager=SourcePackager(s3))
+
+    estimators = [
+        TensorFlowEstimator(
+            model="model",
+            job=str(job),
+            entry_point="train.py",
+            train_instance_type="ml.p2.xlarge",
+            source_dir=str(source_dir),
+            model_uri=None,
+            model_dir="/opt/ml/model",
+            code_location="s3://bucket/code",
+            output_path="s3://bucket/output",
+            session=pool,
+        )
+        for job in range(3)
+    ]
+
+    source_dirs = {estimator.get_source_dir() for estimator in estimators}
+
+    assert len(source_dirs) == 1
+    assert source_dirs.pop().startswith("s3://bucket/code/source/")
+    assert len(s3.uploads) == 1
@@ -0,0 +1,146 @@
+import asyncio
+import pytest
+import threading
+
+from leiah.descriptor import Descriptor
+from leiah.runs import RunSummary, arun_jobs
+
+
+class AsyncJob(object):
+    active = 0
+    peak = 0
+
+    def __init__(self, name, delay=0.01):
+        self.name = name
+        self.delay = delay
+        self.completed = False
+
+    async def arun(self, backend=None):
+        AsyncJob.active += 1
+        AsyncJob.peak = max(AsyncJob.peak, AsyncJob.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            AsyncJob.active -= 1
+
+        self.completed = True
+        return self.name
+
+
+@pytest.fixture
+def descriptor():
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {
+                        "1": {},
+                        "2": {
+                            "estimator": "tests.resources.estimators.FailingEstimator"
+                        },
+                        "3": {},
+                    },
+                    "hyperparameter-tuning-jobs": {"hpt-01": {}},
+                }
+            }
+        }
+    )
+
+
+def test_run_summary(descriptor):
+    summary = descriptor.run(jobs=["model-01.1", "model-01.3"])
+
+    assert isinstance(summary, RunSummary)
+    assert len(summary) == 2
+    assert [submission.name for submission in summary] == [
+        "model-01.1",
+        "model-01.3",
+    ]
+    assert summary[0].result.name == "training-model-01-1"
+    assert all(submission.latency >= 0 for submission in summary)
+
+
+def test_run_sequential_raises(descriptor):
+    with pytest.raises(RuntimeError):
+        descriptor.run(jobs="model-01")
+
+
+def test_run_concurrent_isolates_errors(descriptor):
+    summary = descriptor.run(jobs="model-01", max_workers=4)
+
+    assert [submission.name for submission in summary] == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.3",
+        "model-01.hpt-01",
+    ]
+
+    assert [submission.name for submission in summary.failed] == ["model-01.2"]
+    assert isinstance(summary.failed[0].error, RuntimeError)
+    assert len(summary.succeeded) == 3
+
+    jobs = descriptor.models["model-01"].jobs
+    assert jobs["1"].estimator.fitted is True
+    assert jobs["3"].estimator.fitted is True
+    assert jobs["hpt-01"].estimator.tuned is True
+
+
+def test_arun(descriptor):
+    summary = asyncio.run(descriptor.arun(jobs="model-01", max_concurrency=2))
+
+    assert [submission.name for submission in summary] == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.3",
+        "model-01.hpt-01",
+    ]
+    assert [submission.name for submission in summary.failed] == ["model-01.2"]
+    assert summary[3].result.name == "tuning-model-01-hpt-01"
+
+
+def test_arun_bounded_concurrency():
+    AsyncJob.peak = 0
+    jobs = [AsyncJob(f"model.{i}") for i in range(10)]
+
+    summary = asyncio.run(arun_jobs(jobs, max_concurrency=3))
+
+    assert AsyncJob.peak == 3
+    assert [submission.result for submission in summary] == [j.name for j in jobs]
+
+
+def test_arun_cancellation():
+    jobs = [AsyncJob(f"model.{i}", delay=0.05) for i in range(4)]
+
+    async def run():
+        task = asyncio.ensure_future(arun_jobs(jobs, max_concurrency=1))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert not any(job.completed for job in jobs)
+
+
+def test_arun_fingerprints_outside_event_loop():
+    class FingerprintedJob(AsyncJob):
+        def fingerprint(self):
+            self.thread = threading.get_ident()
+            return self.name
+
+    class MemoryLedger(dict):
+        def record(self, name, fingerprint, job_name=None):
+            self[name] = fingerprint
+
+    jobs = [FingerprintedJob(f"model.{i}") for i in range(3)]
+    ledger = MemoryLedger({"model.0": "model.0"})
+
+    summary = asyncio.run(arun_jobs(jobs, ledger=ledger, incremental=True))
+
+    assert [job.name for job in summary.skipped] == ["model.0"]
+    assert len(summary) == 2
+    assert all(job.thread != threading.get_ident() for job in jobs)
+    assert ledger == {f"model.{i}": f"model.{i}" for i in range(3)}
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from sagemaker.parameter import (
+    CategoricalParameter,
+    ContinuousParameter,
+    IntegerParameter,
+)
+from leiah.exceptions import DescriptorError
+from leiah.search import SearchSpace, iterate_samples
+
+
+@pytest.fixture
+def search_space():
+    return SearchSpace.compile(
+        {
+            "learning_rate": {
+                "type": "continuous",
+                "min_value": 1e-5,
+                "max_value": 1e-1,
+                "scaling_type": "Logarithmic",
+            },
+            "batch_size": {"type": "integer", "min_value": 16, "max_value": 128},
+            "optimizer": {"type": "categorical", "values": ["adam", "sgd"]},
+        }
+    )
+
+
+def test_compile(search_space):
+    assert len(search_space) == 3
+    assert search_space.names == ("learning_rate", "batch_size", "optimizer")
+    assert search_space["optimizer"].values == ("adam", "sgd")
+
+
+def test_compile_does_not_mutate_ranges():
+    ranges = {"epochs": {"type": "integer", "min_value": 1, "max_value": 5}}
+    SearchSpace.compile(ranges)
+
+    assert ranges == {"epochs": {"type": "integer", "min_value": 1, "max_value": 5}}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"values": [1, 2]},
+        {"type": "invalid"},
+        {"type": "categorical", "values": []},
+        {"type": "integer", "min_value": 10, "max_value": 1},
+        {"type": "continuous", "min_value": 0, "max_value": 1, "scaling_type": "X"},
+        {
+            "type": "continuous",
+            "min_value": 0,
+            "max_value": 1,
+            "scaling_type": "Logarithmic",
+        },
+        {
+            "type": "continuous",
+            "min_value": 0,
+            "max_value": 1,
+            "scaling_type": "ReverseLogarithmic",
+        },
+    ],
+)
+def test_compile_invalid(data):
+    with pytest.raises(DescriptorError):
+        SearchSpace.compile({"parameter": data})
+
+
+def test_grid(search_space):
+    grid = search_space.grid(points=3)
+
+    assert next(grid) == {"learning_rate": 1e-5, "batch_size": 16, "optimizer": "adam"}
+    assert len(list(search_space.grid(points=3))) == search_space.grid_size(3) == 18
+
+    learning_rates = sorted({point["learning_rate"] for point in search_space.grid(3)})
+    assert learning_rates == pytest.approx([1e-5, 1e-3, 1e-1])
+
+
+def test_grid_integer_deduplicated():
+    search_space = SearchSpace.compile(
+        {"epochs": {"type": "integer", "min_value": 1, "max_value": 3}}
+    )
+
+    assert [point["epochs"] for point in search_space.grid(points=10)] == [1, 2, 3]
+
+
+def test_sample(search_space):
+    samples = search_space.sample(1000, seed=42)
+
+    assert samples["learning_rate"].shape == (1000,)
+    learning_rates = samples["learning_rate"]
+    assert np.all((learning_rates >= 1e-5) & (learning_rates <= 1e-1))
+    assert np.all((samples["batch_size"] >= 16) & (samples["batch_size"] <= 128))
+    assert set(samples["optimizer"]) == {"adam", "sgd"}
+
+    assert np.array_equal(
+        samples["batch_size"], search_space.sample(1000, seed=42)["batch_size"]
+    )
+
+
+def test_sample_latin_hypercube(search_space):
+    samples = search_space.sample_latin_hypercube(10, seed=7)
+
+    log_learning_rates = np.log10(samples["learning_rate"])
+    strata = np.floor((log_learning_rates + 5) / 4 * 10).astype(int)
+
+    assert sorted(strata) == list(range(10))
+
+
+def test_iterate_samples(search_space):
+    points = list(iterate_samples(search_space.sample(3, seed=1)))
+
+    assert len(points) == 3
+    assert isinstance(points[0]["batch_size"], int)
+    assert isinstance(points[0]["learning_rate"], float)
+
+
+def test_to_sagemaker(search_space):
+    ranges = search_space.to_sagemaker()
+
+    assert isinstance(ranges["learning_rate"], ContinuousParameter)
+    assert ranges["learning_rate"].scaling_type == "Logarithmic"
+    assert isinstance(ranges["batch_size"], IntegerParameter)
+    assert isinstance(ranges["optimizer"], CategoricalParameter)
@@ -0,0 +1,111 @@
+import pytest
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+
+
+@pytest.fixture
+def descriptor():
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "tags": ["vision"],
+                    "training-jobs": {
+                        "1": {"tags": ["nightly"]},
+                        "2": {},
+                    },
+                    "hyperparameter-tuning-jobs": {
+                        "hpt-01": {"tags": "nightly"},
+                        "hpt-02": {},
+                    },
+                },
+                "model-02": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {"1.0.1": {}},
+                    "hyperparameter-tuning-jobs": {"hpt-01": {}},
+                },
+                "other": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {"1": {"tags": ["nightly"]}},
+                },
+            }
+        }
+    )
+
+
+def names(jobs):
+    return [job.name for job in jobs]
+
+
+def test_select_glob(descriptor):
+    assert names(descriptor._get_jobs("model-*.hpt-*")) == [
+        "model-01.hpt-01",
+        "model-01.hpt-02",
+        "model-02.hpt-01",
+    ]
+
+
+def test_select_glob_model(descriptor):
+    assert names(descriptor._get_jobs("mod*")) == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.hpt-01",
+        "model-01.hpt-02",
+        "model-02.1.0.1",
+        "model-02.hpt-01",
+    ]
+
+
+def test_select_regex(descriptor):
+    assert names(descriptor._get_jobs(r"re:model-0[12]\.hpt-01")) == [
+        "model-01.hpt-01",
+        "model-02.hpt-01",
+    ]
+
+    assert names(descriptor._get_jobs(r"re:[^.]*\.1")) == ["model-01.1", "other.1"]
+
+
+def test_select_invalid_regex(descriptor):
+    with pytest.raises(DescriptorError):
+        descriptor._get_jobs("re:model-(")
+
+
+def test_select_tag(descriptor):
+    assert names(descriptor._get_jobs("tag:nightly")) == [
+        "model-01.1",
+        "model-01.hpt-01",
+        "other.1",
+    ]
+
+
+def test_select_inherited_tag(descriptor):
+    assert names(descriptor._get_jobs("tag:vision")) == [
+        "model-01.1",
+        "model-01.2",
+        "model-01.hpt-01",
+        "model-01.hpt-02",
+    ]
+
+
+def test_select_no_matches(descriptor):
+    with pytest.raises(DescriptorError):
+        descriptor._get_jobs("model-*.unexistent-*")
+
+    with pytest.raises(DescriptorError):
+        descriptor._get_jobs("tag:unexistent")
+
+
+def test_select_without_materializing(descriptor):
+    descriptor.index.select("model-*.hpt-*")
+    descriptor.index.select("tag:nightly")
+
+    for model in descriptor.models.values():
+        assert not any(model.jobs.is_materialized(job) for job in model.jobs)
+
+
+def test_index_tags(descriptor):
+    assert descriptor.index.tags == ["nightly", "vision"]
+    assert len(descriptor.index) == 7
+    assert "model-02.1.0.1" in descriptor.index
@@ -0,0 +1,88 @@
+import pytest
+
+from leiah.descriptor import Descriptor
+from leiah.session import SessionPool, get_default_session_pool
+
+
+class FakeBotoSession(object):
+    def __init__(self):
+        self.clients = []
+
+    def client(self, service_name, config=None):
+        self.clients.append(service_name)
+        return object()
+
+
+@pytest.fixture
+def roles(monkeypatch):
+    roles = []
+
+    def get_execution_role(sagemaker_session=None):
+        roles.append(sagemaker_session)
+        return "arn:aws:iam::123456789012:role/leiah"
+
+    monkeypatch.setattr("sagemaker.get_execution_role", get_execution_role)
+    return roles
+
+
+def test_role_resolved_once(roles):
+    sagemaker_session = object()
+    pool = SessionPool(sagemaker_session=sagemaker_session)
+
+    assert pool.role == "arn:aws:iam::123456789012:role/leiah"
+    assert pool.role == "arn:aws:iam::123456789012:role/leiah"
+    assert roles == [sagemaker_session]
+
+
+def test_explicit_role(roles):
+    pool = SessionPool(role="role-name")
+
+    assert pool.role == "role-name"
+    assert roles == []
+
+
+def test_clients_cached():
+    boto_session = FakeBotoSession()
+    pool = SessionPool(boto_session=boto_session)
+
+    assert pool.client("s3") is pool.client("s3")
+    assert pool.client("logs") is not pool.client("s3")
+    assert boto_session.clients == ["s3", "logs"]
+
+
+def test_default_session_pool():
+    assert get_default_session_pool() is get_default_session_pool()
+
+
+def test_descriptor_session_injection():
+    pool = SessionPool(role="role-name")
+    descriptor = Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {"1": {}, "2": {}},
+                }
+            }
+        },
+        session=pool,
+    )
+
+    for job in descriptor._get_jobs("model-01"):
+        assert job.estimator.session is pool
+
+
+def test_descriptor_default_session():
+    descriptor = Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "tests.resources.estimators.DummyEstimator",
+                    "training-jobs": {"1": {}},
+                }
+            }
+        }
+    )
+
+    estimator = descriptor.models["model-01"].jobs["1"].estimator
+    assert estimator.session is get_default_session_pool()
@@ -0,0 +1,167 @@
+import pytest
+import yaml
+
+from pathlib import Path
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+from leiah.streaming import DescriptorOutline
+
+
+descriptor_base_path = Path("tests/resources")
+
+DESCRIPTOR = """
+models:
+  model-01:
+    estimator: tests.resources.estimators.DummyEstimator
+    tags: [vision, nightly]
+    training-jobs:
+      1:
+        description: "Entrenamiento rápido"
+        tags: smoke
+      2: {}
+    hyperparameter-tuning-jobs:
+      hpt-01:
+        tags:
+          - tuning
+  "model-02": {estimator: tests.resources.estimators.DummyEstimator,
+    training-jobs: {1: {description: flow}}}
+  model-03:
+    estimator: tests.resources.estimators.DummyEstimator
+    tags: ~
+    training-jobs:
+      tags: {}
+"""
+
+
+@pytest.fixture
+def descriptor_file_path(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_text(DESCRIPTOR, encoding="utf-8")
+    return descriptor_file_path
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        DESCRIPTOR.encode(),
+        (descriptor_base_path / "descriptor-01.yaml").read_bytes(),
+    ],
+)
+def test_outline_models(content):
+    outline = DescriptorOutline.scan(content)
+    data = yaml.safe_load(content)
+
+    assert list(outline.models) == list(data["models"])
+    for name in outline.models:
+        assert outline.load_model(name) == data["models"][name]
+
+
+@pytest.mark.parametrize("prefix", ["", "# Descripción 日本語 😀\n", "\ufeff# Ñ\n"])
+def test_outline_file_byte_offsets(tmp_path, prefix):
+    content = (prefix + DESCRIPTOR).encode()
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_bytes(content)
+
+    outline = DescriptorOutline.scan_file(descriptor_file_path)
+    data = yaml.safe_load(content)
+
+    assert outline._content is None
+    for name, model in outline.models.items():
+        start, end = model.start, model.end
+        assert content[start:end] == outline.get_fragment(name).lstrip()
+        assert outline.load_model(name) == data["models"][name]
+
+
+def test_outline_file_changed(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_text(DESCRIPTOR, encoding="utf-8")
+
+    outline = DescriptorOutline.scan_file(descriptor_file_path)
+    descriptor_file_path.write_text(DESCRIPTOR + "\n", encoding="utf-8")
+
+    with pytest.raises(DescriptorError):
+        outline.load_model("model-01")
+
+
+def test_outline_entries():
+    outline = DescriptorOutline.scan(DESCRIPTOR.encode())
+
+    assert dict(outline.entries()) == {
+        "model-01": [
+            ("1", {"vision", "nightly", "smoke"}),
+            ("2", {"vision", "nightly"}),
+            ("hpt-01", {"vision", "nightly", "tuning"}),
+        ],
+        "model-02": [("1", set())],
+        "model-03": [("tags", set())],
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"- models",
+        b"models: 1",
+        b"models: [model-01]",
+        b"invalid:\n  descriptor: 1",
+        (descriptor_base_path / "invalid-descriptor-3.yaml").read_bytes(),
+    ],
+)
+def test_outline_invalid_descriptor(content):
+    with pytest.raises(DescriptorError):
+        DescriptorOutline.scan(content)
+
+
+def test_streaming_descriptor_parses_selected_models(descriptor_file_path):
+    descriptor = Descriptor(descriptor_file_path, streaming=True)
+
+    assert list(descriptor.models) == ["model-01", "model-02", "model-03"]
+    assert not descriptor.models.is_materialized("model-01")
+
+    summary = descriptor.run(jobs="model-02.1")
+
+    assert summary[0].result.name == "training-model-02-1"
+    assert descriptor.models.is_materialized("model-02")
+    assert not descriptor.models.is_materialized("model-01")
+    assert not descriptor.models.is_materialized("model-03")
+
+
+def test_streaming_descriptor_selectors(descriptor_file_path):
+    descriptor = Descriptor(descriptor_file_path, streaming=True)
+
+    jobs = descriptor._get_jobs(["tag:smoke", "model-01.hpt-*"])
+
+    assert [job.name for job in jobs] == ["model-01.1", "model-01.hpt-01"]
+    assert jobs[0].description == "Entrenamiento rápido"
+    assert not descriptor.models.is_materialized("model-02")
+
+
+def test_streaming_descriptor_matches_full_parsing():
+    descriptor_file_path = descriptor_base_path / "descriptor-01.yaml"
+
+    streaming = Descriptor(descriptor_file_path, streaming=True)
+    descriptor = Descriptor(descriptor_file_path)
+
+    assert streaming.index.names == descriptor.index.names
+    for name, model in descriptor.models.items():
+        assert streaming.models[name].data == model.data
+
+
+def test_streaming_descriptor_with_aliases(tmp_path):
+    descriptor_file_path = tmp_path / "descriptor.yaml"
+    descriptor_file_path.write_text(
+        "defaults: &defaults\n"
+        "  estimator: tests.resources.estimators.DummyEstimator\n"
+        "models:\n"
+        "  model-01:\n"
+        "    <<: *defaults\n"
+        "    training-jobs:\n"
+        "      1: {}\n"
+    )
+
+    descriptor = Descriptor(descriptor_file_path, streaming=True)
+
+    assert descriptor.models["model-01"].jobs["1"].estimator_classname == (
+        "tests.resources.estimators.DummyEstimator"
+    )
@@ -0,0 +1,201 @@
+import pytest
+import threading
+import time
+
+from leiah.session import SessionPool
+from leiah.throttling import (
+    AdaptiveLimiter,
+    ApiLimit,
+    RateLimiter,
+    RetryPolicy,
+    ThrottledClient,
+    get_error_code,
+)
+
+
+class ClientError(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code, "Message": code}}
+
+
+class FakeMeta(object):
+    method_to_api_mapping = {"create_training_job": "CreateTrainingJob"}
+
+
+class FakeSageMakerClient(object):
+    meta = FakeMeta()
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create_training_job(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise ClientError(self.errors.pop(0))
+
+        return {"TrainingJobArn": kwargs["TrainingJobName"]}
+
+    def get_waiter(self, name):
+        return name
+
+
+class FakeBotoSession(object):
+    def __init__(self, client):
+        self._client = client
+        self.configs = []
+
+    def client(self, service_name, config=None):
+        self.configs.append(config)
+        return self._client
+
+
+@pytest.fixture
+def delays():
+    return []
+
+
+@pytest.fixture
+def rate_limiter(delays):
+    return RateLimiter(
+        limits={"sagemaker": ApiLimit(rate=1000, burst=1000, max_concurrency=8)},
+        retry=RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=3.0),
+        sleep=delays.append,
+        jitter=lambda: 1.0,
+    )
+
+
+def test_get_error_code():
+    assert get_error_code(ClientError("ThrottlingException")) == "ThrottlingException"
+    assert get_error_code(ValueError("error")) is None
+
+
+def test_retry_throttled_calls(rate_limiter, delays):
+    client = FakeSageMakerClient(["ThrottlingException", "ResourceLimitExceeded"])
+    throttled_client = ThrottledClient(client, rate_limiter, "sagemaker")
+
+    response = throttled_client.create_training_job(TrainingJobName="job-1")
+
+    assert response == {"TrainingJobArn": "job-1"}
+    assert client.calls == 3
+    assert delays == [1.0, 2.0]
+
+    stats = rate_limiter.stats["sagemaker.create_training_job"]
+    assert stats["calls"] == 3
+    assert stats["successes"] == 1
+    assert stats["retries"] == 2
+    assert stats["throttles"] == 2
+    assert stats["failures"] == 0
+    assert stats["concurrency"] < 8
+
+
+def test_retries_exhausted(rate_limiter, delays):
+    client = FakeSageMakerClient(["ThrottlingException"] * 10)
+    throttled_client = ThrottledClient(client, rate_limiter, "sagemaker")
+
+    with pytest.raises(ClientError):
+        throttled_client.create_training_job(TrainingJobName="job-1")
+
+    assert client.calls == 4
+    assert delays == [1.0, 2.0, 3.0]
+    assert rate_limiter.stats["sagemaker.create_training_job"]["failures"] == 1
+
+
+def test_non_retryable_error(rate_limiter, delays):
+    client = FakeSageMakerClient(["ValidationException"])
+    throttled_client = ThrottledClient(client, rate_limiter, "sagemaker")
+
+    with pytest.raises(ClientError):
+        throttled_client.create_training_job(TrainingJobName="job-1")
+
+    assert client.calls == 1
+    assert delays == []
+
+
+def test_non_operations_are_not_limited(rate_limiter):
+    throttled_client = ThrottledClient(FakeSageMakerClient(), rate_limiter, "sagemaker")
+
+    assert throttled_client.get_waiter("waiter") == "waiter"
+    assert rate_limiter.stats == {}
+
+
+def test_limits_per_api():
+    rate_limiter = RateLimiter()
+
+    assert rate_limiter.get_limit("sagemaker.create_training_job").rate == 1.0
+    assert rate_limiter.get_limit("sagemaker.list_training_jobs").rate == 5.0
+    assert rate_limiter.get_limit("logs.filter_log_events") == ApiLimit()
+
+
+def test_adaptive_limiter_aimd():
+    limiter = AdaptiveLimiter(ApiLimit(rate=10, burst=10, max_concurrency=8))
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.concurrency == 4
+    assert limiter.rate == 5
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+
+    assert 4 < limiter.concurrency < 6
+    assert limiter.rate == 7
+
+
+def test_adaptive_limiter_token_bucket():
+    now = [0.0]
+    limiter = AdaptiveLimiter(
+        ApiLimit(rate=2, burst=2, max_concurrency=10), clock=lambda: now[0]
+    )
+
+    limiter.acquire()
+    limiter.acquire()
+    assert limiter.tokens == 0
+
+    now[0] = 1.0
+    limiter.acquire()
+    assert limiter.tokens == 1
+
+
+def test_adaptive_limiter_concurrency():
+    limiter = AdaptiveLimiter(ApiLimit(rate=1000, burst=1000, max_concurrency=2))
+    active = []
+    peak = []
+
+    def call():
+        limiter.acquire()
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.01)
+        active.pop()
+        limiter.release()
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= 2
+
+
+def test_session_pool_clients_are_throttled(rate_limiter):
+    client = FakeSageMakerClient(["ThrottlingException"])
+    pool = SessionPool(boto_session=FakeBotoSession(client), rate_limiter=rate_limiter)
+
+    pool.client("sagemaker").create_training_job(TrainingJobName="job-1")
+
+    assert rate_limiter.stats["sagemaker.create_training_job"]["retries"] == 1
+
+
+def test_session_pool_clients_disable_botocore_retries(rate_limiter):
+    boto_session = FakeBotoSession(FakeSageMakerClient())
+    pool = SessionPool(boto_session=boto_session, rate_limiter=rate_limiter)
+
+    pool.client("sagemaker")
+
+    assert [config.retries for config in boto_session.configs] == [
+        {"max_attempts": 1}
+    ]
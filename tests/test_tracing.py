@@ -0,0 +1,151 @@
+import json
+import pytest
+
+from pathlib import Path
+
+from leiah.descriptor import Descriptor
+from leiah.jobs import clear_estimator_cache
+from leiah.tracing import (
+    ChromeTraceExporter,
+    Hook,
+    TimingSummary,
+    Tracer,
+    span,
+    tracing,
+)
+
+
+descriptor_base_path = Path("tests/resources")
+
+
+class RecordingHook(Hook):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+def test_span_without_hooks():
+    with span("idle") as current:
+        assert current is None
+
+
+def test_span_hooks_and_nesting():
+    hook = RecordingHook()
+    tracer = Tracer(hooks=[hook])
+
+    with tracer.span("outer", job="model.1") as outer:
+        with tracer.span("inner") as inner:
+            assert inner.parent is outer
+
+    assert hook.started == ["outer", "inner"]
+    assert [s.name for s in hook.ended] == ["inner", "outer"]
+    assert outer.attributes == {"job": "model.1"}
+    assert outer.duration >= inner.duration
+
+
+def test_span_records_error():
+    hook = RecordingHook()
+    tracer = Tracer(hooks=[hook])
+
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("error")
+
+    assert isinstance(hook.ended[0].error, ValueError)
+
+
+def test_remove_hook():
+    hook = RecordingHook()
+    tracer = Tracer()
+
+    tracer.add_hook(hook)
+    with tracer.span("traced"):
+        pass
+
+    tracer.remove_hook(hook)
+    with tracer.span("untraced"):
+        pass
+
+    assert hook.started == ["traced"]
+
+
+def test_chrome_trace_exporter(tmp_path):
+    exporter = ChromeTraceExporter()
+    tracer = Tracer(hooks=[exporter])
+
+    with tracer.span("descriptor.load", path="descriptor.yaml"):
+        with tracer.span("descriptor.yaml"):
+            pass
+
+    exporter.export(tmp_path / "trace.json")
+
+    with open(tmp_path / "trace.json") as f:
+        trace = json.load(f)
+
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "descriptor.load",
+        "descriptor.yaml",
+    ]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["cat"] == "descriptor"
+    assert events[0]["args"] == {"path": "descriptor.yaml"}
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+def test_timing_summary():
+    summary = TimingSummary()
+    tracer = Tracer(hooks=[summary])
+
+    for _ in range(3):
+        with tracer.span("job.fit"):
+            pass
+
+    with tracer.span("descriptor.load"):
+        pass
+
+    rows = {row["name"]: row for row in summary.rows()}
+    assert rows["job.fit"]["count"] == 3
+    assert rows["descriptor.load"]["count"] == 1
+    assert "job.fit" in summary.report()
+
+
+def test_descriptor_spans():
+    clear_estimator_cache()
+
+    with tracing(TimingSummary()) as summary:
+        descriptor = Descriptor(descriptor_base_path / "descriptor-01.yaml")
+        descriptor.run(jobs="model-01.1")
+
+    names = {row["name"] for row in summary.rows()}
+    assert {
+        "descriptor.load",
+        "descriptor.yaml",
+        "descriptor.parse",
+        "model.load_jobs",
+        "descriptor.run",
+        "estimator.import",
+        "job.get_estimator",
+        "job.fit",
+    } <= names
+
+
+def test_spans_follow_threads():
+    hook = RecordingHook()
+
+    with tracing(hook):
+        descriptor = Descriptor(descriptor_base_path / "descriptor-01.yaml")
+        descriptor.run(jobs="model-01.*", max_workers=2)
+
+    spans = {s.name: s for s in hook.ended}
+    fits = [s for s in hook.ended if s.name == "job.fit"]
+
+    assert len(fits) > 1
+    assert all(s.parent is spans["descriptor.run"] for s in fits)
+    assert all(s.thread_id != spans["descriptor.run"].thread_id for s in fits)
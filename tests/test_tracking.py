@@ -0,0 +1,226 @@
+import pytest
+
+from leiah.runs import JobSubmission
+from leiah.session import SessionPool
+from leiah.tracking import JobHandle, JobTracker, TRAINING, TUNING
+
+
+class FakeSageMakerClient(object):
+    def __init__(self):
+        self.training_jobs = dict()
+        self.tuning_jobs = dict()
+        self.calls = []
+
+    def list_training_jobs(self, **kwargs):
+        self.calls.append(("list_training_jobs", kwargs))
+        return self._page(
+            self.training_jobs,
+            "TrainingJobSummaries",
+            "TrainingJobName",
+            "TrainingJobStatus",
+            **kwargs,
+        )
+
+    def list_hyper_parameter_tuning_jobs(self, **kwargs):
+        self.calls.append(("list_hyper_parameter_tuning_jobs", kwargs))
+        return self._page(
+            self.tuning_jobs,
+            "HyperParameterTuningJobSummaries",
+            "HyperParameterTuningJobName",
+            "HyperParameterTuningJobStatus",
+            **kwargs,
+        )
+
+    def _page(self, jobs, key, name_key, status_key, **kwargs):
+        names = [name for name in sorted(jobs) if kwargs["NameContains"] in name]
+        start = int(kwargs.get("NextToken", 0))
+        end = start + kwargs["MaxResults"]
+
+        response = {
+            key: [{name_key: name, status_key: jobs[name]} for name in names[start:end]]
+        }
+        if end < len(names):
+            response["NextToken"] = str(end)
+
+        return response
+
+
+class FakeLogsClient(object):
+    def __init__(self):
+        self.events = []
+        self.calls = []
+
+    def filter_log_events(self, **kwargs):
+        self.calls.append(kwargs)
+        return {
+            "events": [
+                event
+                for event in self.events
+                if event["logStreamName"].startswith(kwargs["logStreamNamePrefix"])
+                and event["timestamp"] >= kwargs["startTime"]
+            ]
+        }
+
+
+class FakeBotoSession(object):
+    def __init__(self):
+        self.clients = {"sagemaker": FakeSageMakerClient(), "logs": FakeLogsClient()}
+
+    def client(self, service_name, config=None):
+        return self.clients[service_name]
+
+
+@pytest.fixture
+def boto_session():
+    return FakeBotoSession()
+
+
+@pytest.fixture
+def sagemaker_client(boto_session):
+    return boto_session.clients["sagemaker"]
+
+
+@pytest.fixture
+def logs_client(boto_session):
+    return boto_session.clients["logs"]
+
+
+@pytest.fixture
+def tracker(boto_session):
+    return JobTracker(
+        session=SessionPool(boto_session=boto_session),
+        min_interval=1,
+        max_interval=8,
+        sleep=lambda interval: None,
+    )
+
+
+def test_poll_batches_calls(tracker, sagemaker_client):
+    handles = [JobHandle(TRAINING, f"training-model-{i:03d}") for i in range(250)]
+    handles.append(JobHandle(TUNING, "tuning-model-hpt"))
+
+    for handle in handles[:-1]:
+        sagemaker_client.training_jobs[handle.name] = "InProgress"
+    sagemaker_client.tuning_jobs["tuning-model-hpt"] = "InProgress"
+    sagemaker_client.training_jobs["training-other"] = "Failed"
+
+    tracker.track(handles)
+    changed = tracker.poll()
+
+    assert len(changed) == 251
+    assert [call for call, _ in sagemaker_client.calls] == [
+        "list_training_jobs",
+        "list_training_jobs",
+        "list_training_jobs",
+        "list_hyper_parameter_tuning_jobs",
+    ]
+    assert sagemaker_client.calls[0][1]["NameContains"] == "training-model-"
+    assert "training-other" not in tracker.statuses
+
+
+def test_poll_adaptive_backoff(tracker, sagemaker_client):
+    sagemaker_client.training_jobs["training-1"] = "InProgress"
+    tracker.track([JobHandle(TRAINING, "training-1")])
+
+    tracker.poll()
+    assert tracker.interval == 1
+
+    tracker.poll()
+    tracker.poll()
+    assert tracker.interval == 4
+
+    tracker.poll()
+    tracker.poll()
+    assert tracker.interval == 8
+
+    sagemaker_client.training_jobs["training-1"] = "Completed"
+    assert tracker.poll() == {"training-1": "Completed"}
+    assert tracker.interval == 1
+
+
+def test_wait(tracker, sagemaker_client):
+    sagemaker_client.training_jobs["training-1"] = "InProgress"
+    sagemaker_client.tuning_jobs["tuning-1"] = "InProgress"
+
+    def sleep(interval):
+        sagemaker_client.training_jobs["training-1"] = "Completed"
+        sagemaker_client.tuning_jobs["tuning-1"] = "Failed"
+
+    tracker.sleep = sleep
+    tracker.track(
+        [
+            JobSubmission(job=None, result=JobHandle(TRAINING, "training-1")),
+            JobSubmission(job=None, result=JobHandle(TUNING, "tuning-1")),
+            JobSubmission(job=None, result=None),
+        ]
+    )
+
+    assert tracker.wait() == {"training-1": "Completed", "tuning-1": "Failed"}
+    assert tracker.done
+
+
+def test_tail(tracker, sagemaker_client, logs_client):
+    sagemaker_client.training_jobs["training-1"] = "InProgress"
+    sagemaker_client.training_jobs["training-2"] = "InProgress"
+
+    tracker.track(
+        [JobHandle(TRAINING, "training-1"), JobHandle(TRAINING, "training-2")]
+    )
+
+    start = tracker._log_start_time
+    logs_client.events = [
+        {
+            "eventId": "1",
+            "logStreamName": "training-1/algo-1",
+            "timestamp": start + 1,
+            "message": "epoch 1",
+        },
+        {
+            "eventId": "2",
+            "logStreamName": "training-2/algo-1",
+            "timestamp": start + 1,
+            "message": "epoch 1",
+        },
+    ]
+
+    def sleep(interval):
+        logs_client.events.append(
+            {
+                "eventId": "3",
+                "logStreamName": "training-1/algo-1",
+                "timestamp": start + 2,
+                "message": "epoch 2",
+            }
+        )
+        sagemaker_client.training_jobs["training-1"] = "Completed"
+        sagemaker_client.training_jobs["training-2"] = "Completed"
+
+    tracker.sleep = sleep
+
+    assert list(tracker.tail()) == [
+        ("training-1", "epoch 1"),
+        ("training-2", "epoch 1"),
+        ("training-1", "epoch 2"),
+    ]
+    assert len(logs_client.calls) == 2
+    assert logs_client.calls[0]["logStreamNamePrefix"] == "training-"
+
+
+def test_creation_time_bound_advances(tracker, sagemaker_client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("leiah.tracking.time.time", lambda: now[0])
+
+    sagemaker_client.training_jobs["training-1"] = "InProgress"
+    tracker.track([JobHandle(TRAINING, "training-1")])
+    tracker.poll()
+
+    now[0] = 5000.0
+    sagemaker_client.training_jobs["training-2"] = "InProgress"
+    tracker.track([JobHandle(TRAINING, "training-2")])
+    tracker.poll()
+    assert sagemaker_client.calls[-1][1]["CreationTimeAfter"] == 700.0
+
+    sagemaker_client.training_jobs["training-1"] = "Completed"
+    tracker.poll()
+    tracker.poll()
+    assert sagemaker_client.calls[-1][1]["CreationTimeAfter"] == 4700.0
@@ -0,0 +1,170 @@
+import pytest
+
+from leiah.descriptor import Descriptor
+from leiah.exceptions import DescriptorError
+from leiah.local import LocalBackend
+from leiah.tuning import LocalTuner, Trial
+
+
+TRAINING_SCRIPT = """
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--epochs", type=int)
+parser.add_argument("--learning_rate", type=float)
+parser.add_argument("--model_dir")
+args = parser.parse_args()
+
+if args.learning_rate > 0.09:
+    raise SystemExit(1)
+
+for epoch in range(1, args.epochs + 1):
+    val_loss = (args.learning_rate - 0.05) ** 2 + 1.0 / epoch
+    print(f"Epoch {epoch} - val_loss: {val_loss:.6f}")
+"""
+
+
+@pytest.fixture
+def descriptor(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "train.py").write_text(TRAINING_SCRIPT)
+
+    return Descriptor(
+        {
+            "models": {
+                "model-01": {
+                    "estimator": "leiah.estimators.TensorFlowEstimator",
+                    "entry_point": "train.py",
+                    "source_dir": str(source_dir),
+                    "train_instance_type": "ml.m5.large",
+                    "model_uri": None,
+                    "model_dir": "s3://bucket/model",
+                    "code_location": "s3://bucket/code",
+                    "output_path": "s3://bucket/output",
+                    "hyperparameters": {"epochs": 9},
+                    "hyperparameter-tuning-jobs": {
+                        "random": {
+                            "max_jobs": 4,
+                            "max_parallel_jobs": 2,
+                            "seed": 1,
+                            "hyperparameter_ranges": {
+                                "learning_rate": {
+                                    "type": "continuous",
+                                    "min_value": 0.0,
+                                    "max_value": 0.1,
+                                }
+                            },
+                        },
+                        "hyperband": {
+                            "strategy": "Hyperband",
+                            "max_jobs": 9,
+                            "max_parallel_jobs": 3,
+                            "reduction_factor": 3,
+                            "seed": 2,
+                            "hyperparameter_ranges": {
+                                "learning_rate": {
+                                    "type": "continuous",
+                                    "min_value": 0.0,
+                                    "max_value": 0.1,
+                                }
+                            },
+                        },
+                    },
+                }
+            }
+        }
+    )
+
+
+@pytest.fixture
+def backend(tmp_path):
+    with LocalBackend(max_workers=3, work_dir=tmp_path / "runs") as backend:
+        yield backend
+
+
+def test_random_search(descriptor, backend):
+    (submission,) = descriptor.run(jobs="model-01.random", backend=backend)
+    tuner = submission.result
+
+    best_trial = tuner.wait()
+
+    assert len(tuner.trials) == 4
+    assert all(len(trial.runs) == 1 for trial in tuner.trials)
+    assert best_trial.rung == 0
+    assert best_trial.objective == min(
+        trial.objective for trial in tuner.trials if trial.objective is not None
+    )
+
+
+def test_hyperband_early_stopping(descriptor, backend):
+    (submission,) = descriptor.run(jobs="model-01.hyperband", backend=backend)
+    tuner = submission.result
+
+    best_trial = tuner.wait()
+
+    assert tuner.budgets == [1, 3, 9]
+    assert len(tuner.trials) == 9
+
+    runs = sum(len(trial.runs) for trial in tuner.trials)
+    assert runs < 9 * len(tuner.budgets)
+
+    assert best_trial.rung == 2
+    assert sum(trial.rung == 2 for trial in tuner.trials) <= 3
+
+
+def test_failed_trials_ranked_last(descriptor, backend):
+    job = descriptor.models["model-01"].jobs["random"]
+    tuner = LocalTuner(
+        backend,
+        job.estimator,
+        {"learning_rate": {"type": "categorical", "values": [0.095, 0.05]}},
+        max_jobs=2,
+        seed=0,
+    )
+
+    best_trial = tuner.run()
+
+    assert best_trial.hyperparameters["learning_rate"] == 0.05
+    assert [
+        trial.objective is None
+        for trial in tuner.trials
+        if trial.hyperparameters["learning_rate"] == 0.095
+    ] == [True]
+
+
+def test_invalid_strategy(descriptor, backend):
+    job = descriptor.models["model-01"].jobs["random"]
+
+    with pytest.raises(DescriptorError):
+        LocalTuner(backend, job.estimator, {}, strategy="Bayesian")
+
+
+def test_hyperband_requires_max_resource(descriptor, backend):
+    job = descriptor.models["model-01"].jobs["random"]
+
+    with pytest.raises(DescriptorError):
+        LocalTuner(
+            backend, job.estimator, {}, strategy="Hyperband", resource="steps"
+        )
+
+
+def test_failed_trials_not_promoted(descriptor, backend):
+    job = descriptor.models["model-01"].jobs["hyperband"]
+    tuner = LocalTuner(
+        backend,
+        job.estimator,
+        job.search_space,
+        strategy="Hyperband",
+        max_resource=9,
+        reduction_factor=3,
+    )
+
+    trials = [Trial(number, {}) for number in range(3)]
+    for trial in trials:
+        trial.objectives[0] = None
+
+    assert tuner._next([], [set(), set(), set()], [trials, [], []]) is None
+
+    trials[2].objectives[0] = 0.5
+    assert tuner._next([], [set(), set(), set()], [trials, [], []]) == (trials[2], 1)